@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-commons is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Overhead of the access snapshot created when the records are loaded (``post_init``).
+
+Usage:
+
+    python benchmarks/bench_access.py [--agents 10] [--number 100000] [--repeat 5]
+"""
+
+import argparse
+import copy
+import timeit
+
+from storm_commons.records.systemfields.fields.access import RecordAccessField
+
+
+def make_access(agents):
+    """Create the access data of a record."""
+    return {
+        "owned_by": [{"user": idx} for idx in range(agents)],
+        "contributed_by": [{"project": f"project-{idx}"} for idx in range(agents)],
+    }
+
+
+def run(agents, number, repeat):
+    """Run the benchmarks and print the time of each snapshot strategy."""
+    access = make_access(agents)
+
+    strategies = {
+        "copy.deepcopy": lambda: copy.deepcopy(access),
+        "RecordAccessField._dump_snapshot": lambda: RecordAccessField._dump_snapshot(
+            access
+        ),
+    }
+
+    for name, snapshot in strategies.items():
+        best = min(timeit.repeat(snapshot, repeat=repeat, number=number))
+        print(f"{name:<34} {best / number * 1e6:>8.2f} us/record")
+
+
+def main():
+    """Benchmark entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--agents", type=int, default=10)
+    parser.add_argument("--number", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+
+    args = parser.parse_args()
+    run(args.agents, args.number, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-commons is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Overhead of the service components calls (``run_components``).
+
+Usage:
+
+    python benchmarks/bench_components.py [--components 8] [--number 20000] [--repeat 5]
+"""
+
+import argparse
+import timeit
+
+from invenio_records_resources.services.base import Service
+from invenio_records_resources.services.records.components import ServiceComponent
+
+from storm_commons.services.service import BaseInvenioService
+
+
+class CreateComponent(ServiceComponent):
+    """Component that implements only the ``create`` operation."""
+
+    def create(self, identity, record=None, data=None, **kwargs):
+        """Create handler."""
+
+
+class ServiceConfig:
+    """Service config (only the components are used)."""
+
+    components = []
+
+
+def run(components, number, repeat):
+    """Run the benchmarks and print the time of each ``run_components`` call."""
+    config = type(
+        "BenchServiceConfig",
+        (ServiceConfig,),
+        {"components": [CreateComponent] + [ServiceComponent] * (components - 1)},
+    )
+
+    services = {
+        "Service (invenio-records-resources)": Service(config),
+        "BaseInvenioService": BaseInvenioService(config),
+    }
+
+    for name, service in services.items():
+        for action in ("create", "read"):
+            best = min(
+                timeit.repeat(
+                    lambda: service.run_components(
+                        action, None, record=None, data=None, uow=None
+                    ),
+                    repeat=repeat,
+                    number=number,
+                )
+            )
+            print(f"{name:<38} {action:<8} {best / number * 1e6:>8.2f} us/call")
+
+
+def main():
+    """Benchmark entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--components", type=int, default=8)
+    parser.add_argument("--number", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+
+    args = parser.parse_args()
+    run(args.components, args.number, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-commons is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Startup time of the plugins discovery (cold and warm entry points cache).
+
+Each measure runs in a new interpreter, so the import time of the modules is included.
+
+Usage:
+
+    python benchmarks/bench_entry_points.py [--group invenio_base.apps] [--repeat 5]
+"""
+
+import argparse
+import subprocess
+import sys
+import tempfile
+import time
+
+DISCOVERY_SCRIPT = """
+from storm_commons.plugins.packages.entry_point import list_plugins_entrypoint
+
+list_plugins_entrypoint({group!r}, cache_dir={cache_dir!r})
+"""
+
+BASELINE_SCRIPT = """
+import pkg_resources
+
+[ep for ep in pkg_resources.iter_entry_points({group!r})]
+"""
+
+
+def run_script(script):
+    """Run a script in a new interpreter and return its wall time (in seconds)."""
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", script], check=True)
+
+    return time.perf_counter() - start
+
+
+def run(group, repeat):
+    """Run the benchmarks and print the best time of each scenario."""
+    results = {}
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        # cold: the cache directory is empty in each run.
+        cold = []
+        for idx in range(repeat):
+            script = DISCOVERY_SCRIPT.format(
+                group=group, cache_dir=f"{cache_dir}/cold-{idx}"
+            )
+            cold.append(run_script(script))
+        results["importlib.metadata (cold cache)"] = min(cold)
+
+        # warm: the cache is created in the first run.
+        script = DISCOVERY_SCRIPT.format(group=group, cache_dir=f"{cache_dir}/warm")
+        run_script(script)
+
+        results["importlib.metadata (warm cache)"] = min(
+            run_script(script) for _ in range(repeat)
+        )
+
+    results["importlib.metadata (no cache)"] = min(
+        run_script(DISCOVERY_SCRIPT.format(group=group, cache_dir=None))
+        for _ in range(repeat)
+    )
+    results["pkg_resources"] = min(
+        run_script(BASELINE_SCRIPT.format(group=group)) for _ in range(repeat)
+    )
+
+    for name, seconds in results.items():
+        print(f"{name:<34} {seconds * 1000:>10.1f} ms")
+
+
+def main():
+    """Benchmark entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--group", default="invenio_base.apps")
+    parser.add_argument("--repeat", type=int, default=5)
+
+    args = parser.parse_args()
+    run(args.group, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
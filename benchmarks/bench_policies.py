@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-commons is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Throughput of the conditional generators (needs evaluated per second).
+
+Usage:
+
+    python benchmarks/bench_policies.py [--records 10000] [--repeat 5]
+"""
+
+import argparse
+import timeit
+
+import pydash
+from flask_principal import UserNeed
+from invenio_records_permissions.generators import AnyUser, SystemProcess
+
+from storm_commons.services.generators.conditional import AllGenerator, IfFinished
+
+
+def make_records(count):
+    """Create records with half of them finished."""
+    return [
+        {"data": {"is_finished": idx % 2 == 0, "is_public": idx % 3 == 0}}
+        for idx in range(count)
+    ]
+
+
+def pydash_needs(generator, record):
+    """Needs of a ``IfFinished`` evaluated without the compiled getter and the memoization."""
+    branch = generator.then_ if pydash.get(record, generator.field) else generator.else_
+
+    needs = set()
+    for g in branch:
+        needs.update(g.needs() if hasattr(g, "needs") else [g])
+    return list(needs)
+
+
+def run(records, repeat):
+    """Run the benchmarks and print the needs evaluated per second."""
+    then_ = [AnyUser(), SystemProcess()]
+    else_ = [UserNeed(1), UserNeed(2), SystemProcess()]
+
+    generators = {
+        "IfFinished (pydash.get)": (
+            IfFinished("data.is_finished", then_, else_),
+            pydash_needs,
+        ),
+        "IfFinished": (
+            IfFinished("data.is_finished", then_, else_),
+            lambda g, record: g.needs(record=record),
+        ),
+        "AllGenerator": (
+            AllGenerator(["data.is_finished", "data.is_public"], then_, else_),
+            lambda g, record: g.needs(record=record),
+        ),
+    }
+
+    for name, (generator, needs) in generators.items():
+        timer = timeit.Timer(lambda: [needs(generator, record) for record in records])
+        best = min(timer.repeat(repeat=repeat, number=1))
+
+        print(f"{name:<28} {len(records) / best:>12,.0f} needs/s")
+
+
+def main():
+    """Benchmark entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+
+    args = parser.parse_args()
+    run(make_records(args.records), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
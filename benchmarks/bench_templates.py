@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-commons is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Template rendering throughput (renders per second).
+
+Usage:
+
+    python benchmarks/bench_templates.py [--renders 2000] [--processes 4] [--repeat 3]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import timeit
+
+import storm_commons.template as template_module
+from storm_commons.template import render_template, render_template_many
+
+TEMPLATE = """
+{%- for item in items %}
+{{ loop.index }}. {{ item.name | title }}: {{ "%.2f" | format(item.value) }}
+{%- endfor %}
+"""
+
+
+def make_package(directory):
+    """Create a package with the benchmark template."""
+    package = os.path.join(directory, "bench_templates_package")
+
+    os.makedirs(os.path.join(package, "templates"))
+    open(os.path.join(package, "__init__.py"), "w").close()
+
+    with open(os.path.join(package, "templates", "report.txt"), "w") as template:
+        template.write(TEMPLATE)
+
+    sys.path.insert(0, directory)
+    return "bench_templates_package", "templates"
+
+
+def make_contexts(renders):
+    """Create the contexts of the renders."""
+    return [
+        {"items": [{"name": f"item {idx}", "value": idx / 3} for idx in range(20)]}
+        for _ in range(renders)
+    ]
+
+
+def run(renders, processes, repeat):
+    """Run the benchmarks and print the renders per second of each mode."""
+    with tempfile.TemporaryDirectory() as directory:
+        template_module.TEMPLATES_CACHE_DIR = os.path.join(directory, "cache")
+
+        module_name, package_path = make_package(directory)
+        contexts = make_contexts(renders)
+
+        modes = {
+            "render_template": lambda: [
+                render_template("report.txt", module_name, package_path, **context)
+                for context in contexts
+            ],
+            "render_template_many (serial)": lambda: list(
+                render_template_many("report.txt", module_name, package_path, contexts)
+            ),
+            f"render_template_many ({processes} processes)": lambda: list(
+                render_template_many(
+                    "report.txt",
+                    module_name,
+                    package_path,
+                    contexts,
+                    processes=processes,
+                )
+            ),
+        }
+
+        for name, mode in modes.items():
+            best = min(timeit.repeat(mode, repeat=repeat, number=1))
+            print(f"{name:<36} {renders / best:>10,.0f} renders/s")
+
+
+def main():
+    """Benchmark entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--renders", type=int, default=2000)
+    parser.add_argument("--processes", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=3)
+
+    args = parser.parse_args()
+    run(args.renders, args.processes, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -52,6 +52,7 @@ install_requires = [
     "jinja2>=3.0.3,<4.0.0",
     "invenio-drafts-resources>=0.14.0,<0.15.0",
     "invenio-records-resources>=0.17.0,<0.18",
+    'importlib-metadata>=1.0; python_version<"3.8"',
 ]
 
 packages = find_packages()
@@ -81,6 +82,7 @@ setup(
     install_requires=install_requires,
     setup_requires=setup_requires,
     tests_require=tests_require,
+    python_requires=">=3.7",
     classifiers=[
         "Environment :: Web Environment",
         "Intended Audience :: Developers",
@@ -90,7 +92,6 @@ setup(
         "Topic :: Internet :: WWW/HTTP :: Dynamic Content",
         "Topic :: Software Development :: Libraries :: Python Modules",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.6",
         "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
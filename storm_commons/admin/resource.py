@@ -10,7 +10,11 @@ from flask import g
 from flask_resources import response_handler, resource_requestctx
 from invenio_records_resources.resources.records.resource import RecordResource
 
-from storm_commons.resources.parsers import request_view_args
+from storm_commons.resources.parsers import (
+    request_admin_agents_args,
+    request_data,
+    request_view_args,
+)
 
 
 class AdminRecordResource(RecordResource):
@@ -40,11 +44,24 @@ class AdminRecordResource(RecordResource):
         )
         return edited_record.to_dict(), 200
 
+    @request_data
+    @response_handler()
+    def admin_edit_agents(self):
+        """Add/Remove many agents in many records."""
+        edited_records = self.service.admin_edit_agents(
+            g.identity,
+            resource_requestctx.data or [],
+        )
+        return edited_records.to_dict(), 200
+
     @request_view_args
+    @request_admin_agents_args
     @response_handler()
     def admin_list_agents(self):
-        """Remove an existing agent from a record."""
+        """List the agents of a record (paginated)."""
         agents_available = self.service.admin_list_agents(
-            g.identity, resource_requestctx.view_args["pid_value"]
+            g.identity,
+            resource_requestctx.view_args["pid_value"],
+            resource_requestctx.args,
         )
         return agents_available, 200
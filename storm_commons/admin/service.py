@@ -5,9 +5,30 @@
 # storm-commons is free software; you can redistribute it and/or modify it
 # under the terms of the MIT License; see LICENSE file for more details.
 
+from invenio_db import db
+from pydash import py_
+
+from invenio_pidstore.errors import PIDDeletedError, PIDDoesNotExistError
 from invenio_records_resources.services.records import RecordService
 from invenio_records_resources.services.uow import unit_of_work, RecordCommitOp
 
+from storm_commons.services.results import BaseBulkResult
+from storm_commons.services.uow import RecordBulkIndexOp
+
+ADMIN_AGENTS_OPTIONS = {
+    "default_size": 25,
+    "max_size": 100,
+    "projection": {
+        "user": {"id": "id", "email": "email"},
+        "project": {"id": "id", "title": "json.title"},
+    },
+}
+"""Default options of the agents listing (``admin_list_agents``).
+
+The ``projection`` defines, for each agent type, the fields (``name: path``)
+of the agent entity (e.g. ``invenio_accounts.models.User``) returned in the listing.
+"""
+
 
 class AdminRecordService(RecordService):
     """Service with features for record access administration.
@@ -88,8 +109,162 @@ class AdminRecordService(RecordService):
             identity, record_id, agent_type, agent_id, "remove", uow
         )
 
-    def admin_list_agents(self, identity, record_id):
-        """Get record access field."""
+    @unit_of_work()
+    def admin_edit_agents(self, identity, operations, uow=None):
+        """Add/Remove many agents in many records.
+
+        Args:
+            identity (flask_principal.Identity): User identity
+
+            operations (list): List of operations. Each operation is a dict with the ``id`` (Record id),
+                               ``agent_type``, ``agent_id`` and ``operation`` (``add`` or ``remove``) keys.
+
+        Returns:
+            BaseBulkResult: The updated records and the errors of the operations that failed.
+
+        Note:
+            The operations are grouped by record. So, each record is resolved, checked
+            (``manage_access`` permission) and committed only once. The operations of a record
+            are applied together: if one of them fails, none is applied. The edited records are
+            indexed after the commit of the unit of work (one by one, or sent to the bulk indexing
+            queue when ``admin_bulk_index`` is enabled in the service config).
+        """
+        errors = {}
+
+        # grouping the operations by record (keeping the order of the operations).
+        records_operations = {}
+        for idx, operation in enumerate(operations):
+            try:
+                record_id = operation["id"]
+                agent = (
+                    operation["agent_type"],
+                    operation["agent_id"],
+                    operation["operation"],
+                )
+            except (KeyError, TypeError):
+                errors[idx] = [
+                    "Operations must have the `id`, `agent_type`, `agent_id` and `operation` keys."
+                ]
+                continue
+
+            if agent[2] not in ("add", "remove"):
+                errors[idx] = ["Invalid operation (use `add` or `remove`)."]
+                continue
+
+            records_operations.setdefault(record_id, []).append((idx, agent))
+
+        edited_records = []
+        for record_id, record_operations in records_operations.items():
+            indexes = [idx for idx, _ in record_operations]
+
+            # loading the record
+            try:
+                record = self.record_cls.pid.resolve(record_id)
+            except (PIDDoesNotExistError, PIDDeletedError):
+                errors.update({idx: ["Record not found."] for idx in indexes})
+                continue
+
+            # checking permissions
+            if not self.check_permission(identity, "manage_access", record=record):
+                errors.update({idx: ["Permission denied."] for idx in indexes})
+                continue
+
+            # the operations of each record are applied in a savepoint: when an operation
+            # fails (e.g. a database error), the savepoint is rolled back and none of the
+            # record operations is committed (the other records are not affected).
+            failed_idx = None
+            try:
+                with db.session.begin_nested():
+                    for idx, (agent_type, agent_id, operation) in record_operations:
+                        failed_idx = idx
+                        self.run_components(
+                            "update",
+                            identity,
+                            data=record,
+                            record=record,
+                            agent_id=agent_id,
+                            agent_type=agent_type,
+                            operation=operation,
+                            uow=uow,
+                        )
+
+                    # the records are indexed in bulk (see below).
+                    failed_idx = None
+                    uow.register(RecordCommitOp(record))
+            except Exception as e:
+                for idx in indexes:
+                    errors[idx] = (
+                        [str(e)]
+                        if failed_idx in (None, idx)
+                        else ["Not applied: another operation of the record failed."]
+                    )
+                continue
+
+            edited_records.append(record)
+
+        uow.register(
+            RecordBulkIndexOp(edited_records, self.indexer, bulk=self.admin_bulk_index)
+        )
+
+        errors_list = []
+        for idx in sorted(errors):
+            error = {"index": idx, "errors": errors[idx]}
+            if isinstance(operations[idx], dict) and "id" in operations[idx]:
+                error["id"] = str(operations[idx]["id"])
+            errors_list.append(error)
+
+        return BaseBulkResult(
+            self,
+            identity,
+            [
+                self.result_item(self, identity, record, links_tpl=self.links_item_tpl)
+                for record in edited_records
+            ],
+            errors_list,
+        )
+
+    @property
+    def admin_agents_options(self):
+        """Options of the agents listing."""
+        return getattr(self.config, "admin_agents_options", ADMIN_AGENTS_OPTIONS)
+
+    @property
+    def admin_bulk_index(self):
+        """Send the records edited in bulk (``admin_edit_agents``) to the bulk indexing queue."""
+        return getattr(self.config, "admin_bulk_index", False)
+
+    def _project_agent(self, agent, projection):
+        """Select the fields of the agent entity defined in the projection."""
+        entity = agent.resolve()
+        if entity is None:
+            return None
+
+        return {
+            name: py_.get(entity, path)
+            for name, path in projection.get(agent.agent_type, {}).items()
+        }
+
+    def admin_list_agents(self, identity, record_id, params=None):
+        """List the agents (owners and contributors) of a record.
+
+        Args:
+            identity (flask_principal.Identity): User identity
+
+            record_id (str): Record id
+
+            params (dict): Listing params (``page``, ``size``, ``role`` and ``agent_type``).
+
+        Returns:
+            Dict: The page of agents. Each agent has the role, type, id and the fields of
+            the agent entity defined in the ``projection`` option (see ``ADMIN_AGENTS_OPTIONS``).
+
+        Note:
+            Only the agents of the selected page are resolved, using a single query for
+            each agent type. The page size is limited by the ``max_size`` option.
+        """
+        params = params or {}
+        options = self.admin_agents_options
+
         # loading the record
         record = self.record_cls.pid.resolve(record_id)
 
@@ -102,7 +277,41 @@ class AdminRecordService(RecordService):
             record=record,
         )
 
-        # experimental: this is a experimental
-        # service function. So, in the future, probably
-        # this will be changed.
-        return record.get("access")
+        # selecting the agents
+        role = params.get("role")
+        agent_type = params.get("agent_type")
+
+        agents = [
+            (agent_role, agent)
+            for agent_role in ["owned_by", "contributed_by"]
+            if role in (None, agent_role)
+            for agent in getattr(record.access, agent_role)
+            if agent_type in (None, agent.agent_type)
+        ]
+
+        # paginating
+        page = params.get("page", 1)
+        size = min(params.get("size", options["default_size"]), options["max_size"])
+
+        page_agents = agents[(page - 1) * size : page * size]
+
+        # resolving the agents of the page (one query for each agent type).
+        if page_agents:
+            type(page_agents[0][1]).resolve_many([agent for _, agent in page_agents])
+
+        return {
+            "hits": {
+                "hits": [
+                    {
+                        "role": agent_role,
+                        "agent_type": agent.agent_type,
+                        "agent_id": agent.agent_id,
+                        "agent": self._project_agent(agent, options["projection"]),
+                    }
+                    for agent_role, agent in page_agents
+                ],
+                "total": len(agents),
+            },
+            "page": page,
+            "size": size,
+        }
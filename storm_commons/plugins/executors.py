@@ -0,0 +1,316 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-commons is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+import inspect
+import os
+import threading
+
+from concurrent.futures import CancelledError, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+
+_worker_services = {}
+"""Services of the worker process (created once, by the pool initializer)."""
+
+
+def _initialize_worker(services):
+    """Define the services of a worker process (``ProcessPoolExecutor`` initializer)."""
+    _worker_services.clear()
+    _worker_services.update(services)
+
+
+def _call_service_method(service_key, method_name, *args, **kwargs):
+    """Run a method of a service of the worker process."""
+    return getattr(_worker_services[service_key], method_name)(*args, **kwargs)
+
+
+class BackendBusyError(RuntimeError):
+    """Error raised when the execution backend queue is full."""
+
+
+class ProcessPoolBackend:
+    """Execution backend that runs the plugin services calls in a process pool.
+
+    Args:
+        max_workers (int): Number of processes of the pool (by default, the number of CPUs).
+
+        max_queue (int): Maximum number of calls waiting for a process. When the queue is
+                         full, new calls are rejected with ``BackendBusyError``.
+
+        timeout (float): Default maximum time (in seconds) to wait for the result of a call.
+
+    Note:
+        The services registered in the backend (see ``register_service``) are sent to each
+        worker process only once, when the process starts. Then, the calls send only the
+        service key, the method name and the arguments (using ``pickle``). So, the services
+        executed in this backend must be picklable (e.g. they must not store the Flask
+        application or database sessions).
+
+    Note:
+        When a worker process dies (e.g. killed by the OOM killer), the pool is broken and
+        the running calls fail with ``BrokenProcessPool``. The pool is recreated in the
+        next call.
+    """
+
+    def __init__(self, max_workers=None, max_queue=64, timeout=None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_queue = max_queue
+        self.timeout = timeout
+
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
+        # services sent to the worker processes (see ``register_service``).
+        self._services = {}
+
+        # running calls + calls waiting for a process.
+        self._slots = threading.BoundedSemaphore(self.max_workers + self.max_queue)
+
+        self._metrics_lock = threading.Lock()
+        self._metrics = {
+            "submitted": 0,
+            "rejected": 0,
+            "completed": 0,
+            "failed": 0,
+            "cancelled": 0,
+            "timed_out": 0,
+            "restarted": 0,
+            "pending": 0,
+        }
+
+    @property
+    def executor(self):
+        """Process pool executor (created on first use)."""
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.max_workers,
+                        initializer=_initialize_worker,
+                        initargs=(dict(self._services),),
+                    )
+        return self._executor
+
+    def _discard_executor(self, executor):
+        """Discard an executor (e.g. a broken pool). A new one is created on next use."""
+        with self._executor_lock:
+            if self._executor is not executor:
+                return  # already discarded.
+            self._executor = None
+
+        # the calls already submitted to the old pool are not cancelled.
+        executor.shutdown(wait=False)
+
+    def register_service(self, service_key, service):
+        """Register a service executed in the worker processes.
+
+        Note:
+            The services are sent to the worker processes when the pool starts. So, a
+            running pool is replaced by a new one (with the registered services).
+        """
+        with self._executor_lock:
+            self._services[service_key] = service
+            executor = self._executor
+
+        if executor is not None:
+            self._discard_executor(executor)
+
+    def _count(self, metric, value=1):
+        """Update a metric counter."""
+        with self._metrics_lock:
+            self._metrics[metric] += value
+
+    def _on_done(self, future):
+        """Release the queue slot and register the call status."""
+        self._slots.release()
+        self._count("pending", -1)
+
+        if future.cancelled():
+            self._count("cancelled")
+        elif future.exception() is not None:
+            self._count("failed")
+        else:
+            self._count("completed")
+
+    def submit(self, fn, *args, **kwargs):
+        """Submit a call to the process pool.
+
+        Returns:
+            concurrent.futures.Future: Future of the call result. The call can be cancelled
+            (``future.cancel()``) while it is waiting for a process.
+
+        Raises:
+            BackendBusyError: If the queue is full.
+        """
+        if not self._slots.acquire(blocking=False):
+            self._count("rejected")
+            raise BackendBusyError("Execution backend queue is full.")
+
+        try:
+            try:
+                executor = self.executor
+                future = executor.submit(fn, *args, **kwargs)
+            except BrokenProcessPool:
+                # a worker process died: recreating the pool.
+                self._discard_executor(executor)
+                self._count("restarted")
+
+                future = self.executor.submit(fn, *args, **kwargs)
+        except Exception:
+            self._slots.release()
+            raise
+
+        self._count("submitted")
+        self._count("pending")
+
+        future.add_done_callback(self._on_done)
+        return future
+
+    def call(self, fn, *args, timeout=None, **kwargs):
+        """Run a call in the process pool and wait for its result.
+
+        Args:
+            fn (Callable): Picklable callable (e.g. a module function or a bound method
+                           of a picklable object).
+
+            timeout (float): Maximum time (in seconds) to wait for the result. By default,
+                             the ``timeout`` of the backend is used.
+
+        Returns:
+            object: The call result.
+
+        Raises:
+            TimeoutError: If the result is not available in time. When the call is still
+            waiting for a process, it is cancelled. Calls already running can not be
+            interrupted: they run until the end and the result is discarded.
+        """
+        timeout = timeout if timeout is not None else self.timeout
+
+        future = self.submit(fn, *args, **kwargs)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            self._count("timed_out")
+
+            raise TimeoutError(f"Call to `{fn!r}` timed out after {timeout}s.")
+        except CancelledError:
+            raise TimeoutError(f"Call to `{fn!r}` was cancelled.")
+
+    def metrics(self):
+        """Utilization metrics of the pool.
+
+        Note:
+            The ``pending`` calls (submitted and not finished) are measured. The calls
+            running in the processes are not: ``running_estimate``, ``queued_estimate`` and
+            ``utilization_estimate`` assume that the pending calls use all free processes.
+        """
+        with self._metrics_lock:
+            metrics = dict(self._metrics)
+
+        metrics.update(
+            {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "running_estimate": min(metrics["pending"], self.max_workers),
+                "queued_estimate": max(metrics["pending"] - self.max_workers, 0),
+            }
+        )
+        metrics["utilization_estimate"] = metrics["running_estimate"] / self.max_workers
+        return metrics
+
+    def shutdown(self, wait=True):
+        """Stop the process pool."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait)
+                self._executor = None
+
+
+class ProcessMethodProxy:
+    """Method of a plugin service executed in a ``ProcessPoolBackend``."""
+
+    def __init__(self, backend, service_key, method_name):
+        self._backend = backend
+        self._service_key = service_key
+        self._method_name = method_name
+
+    def __call__(self, *args, timeout=None, **kwargs):
+        """Run the method in the process pool and wait for the result."""
+        return self._backend.call(
+            _call_service_method,
+            self._service_key,
+            self._method_name,
+            *args,
+            timeout=timeout,
+            **kwargs,
+        )
+
+    def submit(self, *args, **kwargs):
+        """Submit the method to the process pool (returns a ``concurrent.futures.Future``)."""
+        return self._backend.submit(
+            _call_service_method,
+            self._service_key,
+            self._method_name,
+            *args,
+            **kwargs,
+        )
+
+    def __repr__(self):
+        """Return repr(self)."""
+        return f"<ProcessMethodProxy ({self._service_key}.{self._method_name})>"
+
+
+class ProcessServiceProxy:
+    """Plugin service proxy that runs the service methods in a ``ProcessPoolBackend``.
+
+    The methods defined in the ``process_methods`` attribute of the service (by default,
+    all public methods) are executed in the process pool. Other attributes (e.g. ``id``,
+    ``metadata`` and ``schema``) are read from the service.
+
+    Note:
+        The service is registered in the backend with the ``service_key`` (by default,
+        the service id). So, the worker processes create the service only once.
+    """
+
+    def __init__(self, service, backend, service_key=None):
+        self._service = service
+        self._backend = backend
+        self._service_key = service_key or getattr(service, "id", None) or id(service)
+
+        self._process_methods = getattr(service, "process_methods", None)
+
+        backend.register_service(self._service_key, service)
+
+    @property
+    def service(self):
+        """Proxied service."""
+        return self._service
+
+    def __getattr__(self, name):
+        """Get the service attribute (methods are executed in the process pool)."""
+        attribute = getattr(self._service, name)
+
+        if name.startswith("_") or not inspect.ismethod(attribute):
+            return attribute
+
+        if self._process_methods is not None and name not in self._process_methods:
+            return attribute
+
+        return ProcessMethodProxy(self._backend, self._service_key, name)
+
+    def __repr__(self):
+        """Return repr(self)."""
+        return f"<ProcessServiceProxy ({self._service!r})>"
+
+
+__all__ = (
+    "BackendBusyError",
+    "ProcessMethodProxy",
+    "ProcessPoolBackend",
+    "ProcessServiceProxy",
+)
@@ -8,11 +8,17 @@
 from .manager import PluginManager
 
 from .factory import plugin_factory
-from .entry_point import load_plugins_entrypoint
+from .entry_point import (
+    LazyEntryPoint,
+    list_plugins_entrypoint,
+    load_plugins_entrypoint,
+)
 
 
 __all__ = (
     "PluginManager",
     "plugin_factory",
+    "LazyEntryPoint",
+    "list_plugins_entrypoint",
     "load_plugins_entrypoint",
 )
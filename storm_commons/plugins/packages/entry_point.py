@@ -5,14 +5,223 @@
 # storm-commons is free software; you can redistribute it and/or modify it
 # under the terms of the MIT License; see LICENSE file for more details.
 
-import pkg_resources
+import hashlib
+import json
+import os
+import sys
+import tempfile
 
+from werkzeug.local import LocalProxy
 
-def load_plugins_entrypoint(entry_point_group: str, load_callable: bool = False):
-    """Initialize plugins entry point."""
+from storm_commons.utils import default_cache_dir, private_directory
+
+try:
+    from importlib.metadata import EntryPoint, entry_points
+except ImportError:  # Python < 3.8
+    from importlib_metadata import EntryPoint, entry_points
+
+
+ENTRY_POINTS_CACHE_DIR = default_cache_dir()
+"""Directory where the discovered entry points are cached (``None`` disables the cache).
+
+The directory is private to the current user (see ``storm_commons.utils.private_directory``).
+To disable the cache, set the ``STORM_COMMONS_CACHE_DIR`` environment variable to an empty value.
+"""
+
+DISTRIBUTION_METADATA_SUFFIXES = (".dist-info", ".egg-info")
+"""Suffixes of the distributions metadata directories."""
+
+
+def _environment_id():
+    """Create an identifier of the Python environment (e.g. virtualenv)."""
+    environment = f"{sys.prefix}:{sys.executable}:{sys.version}"
+
+    return hashlib.sha1(environment.encode("utf-8")).hexdigest()[:16]
+
+
+def _environment_fingerprint():
+    """Create a fingerprint of the installed distributions.
+
+    The fingerprint is based on the ``sys.path`` entries, on their modification times and
+    on the modification times of the entry points files (``entry_points.txt``) of the
+    distributions. So, the fingerprint changes when a distribution is installed or removed
+    and when the entry points of an editable install (e.g. ``*.egg-info/entry_points.txt``
+    in a project directory) are changed.
+    """
+    fingerprint = hashlib.sha1(sys.version.encode("utf-8"))
+
+    for path in sys.path:
+        path = path or os.curdir
+
+        try:
+            mtime = os.stat(path).st_mtime_ns
+            entries = sorted(os.listdir(path))
+        except OSError:
+            mtime, entries = None, []
+
+        fingerprint.update(f"{path}:{mtime};".encode("utf-8"))
+
+        for entry in entries:
+            if not entry.endswith(DISTRIBUTION_METADATA_SUFFIXES):
+                continue
+
+            try:
+                entry_mtime = os.stat(
+                    os.path.join(path, entry, "entry_points.txt")
+                ).st_mtime_ns
+            except OSError:
+                continue  # distribution without entry points.
+
+            fingerprint.update(f"{entry}:{entry_mtime};".encode("utf-8"))
+
+    return fingerprint.hexdigest()
+
+
+def _discover_entry_points(entry_point_group):
+    """List the ``(name, value)`` of the entry points of a group using ``importlib.metadata``.
+
+    The entry points are listed in the discovery order (as in ``pkg_resources``: by
+    distribution, in the ``sys.path`` order). Duplicated entry points (e.g. of distributions
+    found more than once in the ``sys.path``) are listed only once.
+    """
+    eps = entry_points()
+
+    # ``importlib.metadata`` < 3.10 returns a dict of groups.
+    if hasattr(eps, "select"):
+        eps = eps.select(group=entry_point_group)
+    else:
+        eps = eps.get(entry_point_group, [])
+
+    return list(dict.fromkeys((ep.name, ep.value) for ep in eps))
+
+
+def _cached_entry_points(entry_point_group, cache_dir):
+    """List the entry points of a group (cached on disk by environment fingerprint)."""
+    if not cache_dir:
+        return _discover_entry_points(entry_point_group)
+
+    try:
+        private_directory(cache_dir)
+    except OSError:
+        # e.g. read-only file systems or directories of other users.
+        return _discover_entry_points(entry_point_group)
+
+    cache_prefix = f"entry-points-{_environment_id()}-"
+    cache_file = os.path.join(
+        cache_dir, f"{cache_prefix}{_environment_fingerprint()}.json"
+    )
+
+    try:
+        with open(cache_file) as cache:
+            cached_groups = json.load(cache)
+    except (OSError, ValueError):
+        cached_groups = {}
+
+    if entry_point_group in cached_groups:
+        return [tuple(ep) for ep in cached_groups[entry_point_group]]
+
+    cached_groups[entry_point_group] = _discover_entry_points(entry_point_group)
+
+    # the cache is written atomically. Errors (e.g. read-only file
+    # systems) are ignored: the entry points are discovered again.
+    try:
+        fd, tmp_file = tempfile.mkstemp(dir=cache_dir)
+        with os.fdopen(fd, "w") as tmp:
+            json.dump(cached_groups, tmp)
+        os.replace(tmp_file, cache_file)
+
+        # removing the caches of the previous states of this environment (the
+        # caches of other environments sharing the directory are kept).
+        for filename in os.listdir(cache_dir):
+            filepath = os.path.join(cache_dir, filename)
+
+            if filename.startswith(cache_prefix) and filepath != cache_file:
+                os.remove(filepath)
+    except OSError:
+        pass
+
+    return cached_groups[entry_point_group]
+
+
+class LazyEntryPoint:
+    """Entry point that imports the referenced object only on first use."""
+
+    __slots__ = ("entry_point", "_obj", "_loaded")
+
+    def __init__(self, name, value, group):
+        self.entry_point = EntryPoint(name=name, value=value, group=group)
+
+        self._obj = None
+        self._loaded = False
+
+    @property
+    def name(self):
+        """Entry point name."""
+        return self.entry_point.name
+
+    def load(self):
+        """Import the referenced object (only in the first call)."""
+        if not self._loaded:
+            self._obj = self.entry_point.load()
+            self._loaded = True
+
+        return self._obj
+
+    def proxy(self):
+        """Proxy that loads the entry point when it is used."""
+        return LocalProxy(self.load)
+
+    def __repr__(self):
+        """Return repr(self)."""
+        return "<LazyEntryPoint ({} = {})>".format(
+            self.entry_point.name, self.entry_point.value
+        )
+
+
+def list_plugins_entrypoint(
+    entry_point_group: str, cache_dir: str = ENTRY_POINTS_CACHE_DIR
+):
+    """List the entry points of a group without importing them.
+
+    Returns:
+        List[LazyEntryPoint]: The entry points (see ``load_plugins_entrypoint``).
+    """
+    return [
+        LazyEntryPoint(name, value, entry_point_group)
+        for name, value in _cached_entry_points(entry_point_group, cache_dir)
+    ]
+
+
+def load_plugins_entrypoint(
+    entry_point_group: str,
+    load_callable: bool = False,
+    lazy: bool = False,
+    cache_dir: str = ENTRY_POINTS_CACHE_DIR,
+):
+    """Initialize plugins entry point.
+
+    Args:
+        entry_point_group (str): Name of the entry point group.
+
+        load_callable (bool): Flag indicating if the loaded objects must be called.
+
+        lazy (bool): Flag indicating if the plugins must be imported only on first use. In this
+                     case, proxies are returned (``load_callable`` is ignored).
+
+        cache_dir (str): Directory where the discovered entry points are cached (the cache is
+                         invalidated when the installed distributions change). Use ``None``
+                         to disable the cache.
+
+    Returns:
+        list: The plugins definitions (or proxies to them).
+    """
+    entry_points_definition = list_plugins_entrypoint(entry_point_group, cache_dir)
+
+    if lazy:
+        return [entry_point.proxy() for entry_point in entry_points_definition]
 
     plugins_definition = []
-    for entry_point in pkg_resources.iter_entry_points(group=entry_point_group):
+    for entry_point in entry_points_definition:
 
         entry_point_obj = entry_point.load()
         if load_callable and callable(entry_point_obj):
@@ -5,20 +5,232 @@
 # storm-commons is free software; you can redistribute it and/or modify it
 # under the terms of the MIT License; see LICENSE file for more details.
 
-from .entry_point import load_plugins_entrypoint
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
+from flask import current_app, has_app_context
 
-def plugin_factory(app, entrypoint_group_name):
-    """Flask factory app to initialize the flask extensions plugins."""
+from .entry_point import list_plugins_entrypoint
 
-    available_services = {}
-    available_plugins = load_plugins_entrypoint(
-        entrypoint_group_name, load_callable=False
+
+def _plugins_dependencies(plugins):
+    """Get the dependencies (``plugin_dependencies`` attribute) of the plugins.
+
+    Args:
+        plugins (dict): Plugins classes indexed by the entry point name.
+
+    Returns:
+        dict: Set of dependencies (entry point names) of each plugin.
+
+    Raises:
+        RuntimeError: If a dependency is not available or the dependencies have a cycle.
+    """
+    dependencies = {}
+
+    for plugin_name, plugin_cls in plugins.items():
+        plugin_dependencies = set(getattr(plugin_cls, "plugin_dependencies", []))
+
+        missing_dependencies = plugin_dependencies - set(plugins)
+        if missing_dependencies:
+            raise RuntimeError(
+                "Plugin `{}` depends on unavailable plugins: {}".format(
+                    plugin_name, ", ".join(sorted(missing_dependencies))
+                )
+            )
+
+        dependencies[plugin_name] = plugin_dependencies
+
+    # checking cycles (topological sort).
+    sorted_plugins = set()
+    pending_plugins = dict(dependencies)
+
+    while pending_plugins:
+        ready_plugins = [
+            plugin_name
+            for plugin_name, plugin_dependencies in pending_plugins.items()
+            if plugin_dependencies.issubset(sorted_plugins)
+        ]
+
+        if not ready_plugins:
+            raise RuntimeError(
+                "Plugins with cyclic dependencies: {}".format(
+                    ", ".join(sorted(pending_plugins))
+                )
+            )
+
+        for plugin_name in ready_plugins:
+            sorted_plugins.add(plugin_name)
+            del pending_plugins[plugin_name]
+
+    return dependencies
+
+
+def _initialize_plugin(app, plugin_cls):
+    """Initialize a plugin (in the application context) measuring the time spent."""
+    start = time.monotonic()
+
+    if has_app_context() and current_app._get_current_object() is app:
+        plugin_obj = plugin_cls(app)
+    else:
+        # e.g. the worker threads (they do not have the context of the caller).
+        with app.app_context():
+            plugin_obj = plugin_cls(app)
+
+    return plugin_obj, time.monotonic() - start
+
+
+def _initialize_plugins(app, plugins, dependencies, max_workers, timeout):
+    """Initialize the plugins respecting the dependencies order.
+
+    The plugins are initialized in the calling thread when ``max_workers`` is ``1`` and
+    there is no ``timeout``. Otherwise, they are initialized in a thread pool.
+    """
+    plugins_obj = {}
+    plugins_time = {}
+
+    pending_plugins = dict(dependencies)
+
+    if max_workers == 1 and timeout is None:
+        while pending_plugins:
+            plugin_name = next(
+                plugin_name
+                for plugin_name, plugin_dependencies in pending_plugins.items()
+                if plugin_dependencies.issubset(plugins_obj)
+            )
+            del pending_plugins[plugin_name]
+
+            plugins_obj[plugin_name], plugins_time[plugin_name] = _initialize_plugin(
+                app, plugins[plugin_name]
+            )
+
+        return plugins_obj, plugins_time
+
+    # the executor is not used as a context manager: when a plugin
+    # times out, the factory must not wait for its thread.
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        running_plugins = {}
+
+        while pending_plugins or running_plugins:
+            # submitting the plugins with all dependencies initialized. At most
+            # ``max_workers`` plugins are submitted: so, each plugin starts when
+            # it is submitted and its timeout does not include the queue time.
+            ready_plugins = [
+                plugin_name
+                for plugin_name, plugin_dependencies in pending_plugins.items()
+                if plugin_dependencies.issubset(plugins_obj)
+            ][: max_workers - len(running_plugins)]
+
+            for plugin_name in ready_plugins:
+                del pending_plugins[plugin_name]
+
+                future = executor.submit(_initialize_plugin, app, plugins[plugin_name])
+                running_plugins[future] = (plugin_name, time.monotonic())
+
+            # waiting for (at least) one plugin.
+            wait_timeout = None
+            if timeout is not None:
+                wait_timeout = max(
+                    0,
+                    min(start for _, start in running_plugins.values())
+                    + timeout
+                    - time.monotonic(),
+                )
+
+            finished_plugins, _ = wait(
+                running_plugins, timeout=wait_timeout, return_when=FIRST_COMPLETED
+            )
+
+            if not finished_plugins:
+                expired_plugins = sorted(
+                    plugin_name
+                    for plugin_name, start in running_plugins.values()
+                    if time.monotonic() - start >= timeout
+                )
+
+                for future in running_plugins:
+                    future.cancel()
+
+                raise TimeoutError(
+                    "Plugins initialization timed out after {}s: {}".format(
+                        timeout, ", ".join(expired_plugins)
+                    )
+                )
+
+            for future in finished_plugins:
+                plugin_name, _ = running_plugins.pop(future)
+
+                plugins_obj[plugin_name], plugins_time[plugin_name] = future.result()
+    finally:
+        executor.shutdown(wait=False)
+
+    return plugins_obj, plugins_time
+
+
+def _report_plugins_time(app, plugins_time, total_time):
+    """Log the time spent in the initialization of each plugin (slowest first)."""
+    app.logger.info(
+        "Plugins initialized in {:.3f}s ({} plugins)".format(
+            total_time, len(plugins_time)
+        )
     )
 
-    for available_plugin_cls in available_plugins:
-        # factoring the plugin flask extension
-        plugin_obj = available_plugin_cls(app)
+    for plugin_name, plugin_time in sorted(
+        plugins_time.items(), key=lambda item: item[1], reverse=True
+    ):
+        app.logger.info("  {}: {:.3f}s".format(plugin_name, plugin_time))
+
+
+def plugin_factory(app, entrypoint_group_name, max_workers=1, timeout=None):
+    """Flask factory app to initialize the flask extensions plugins.
+
+    Args:
+        app (flask.Flask): Flask application.
+
+        entrypoint_group_name (str): Name of the entry point group with the plugins.
+
+        max_workers (int): Number of threads used to initialize the plugins. By default,
+                           the plugins are initialized one by one.
+
+        timeout (float): Maximum time (in seconds) to initialize each plugin. When a plugin
+                         exceeds this time, a ``TimeoutError`` is raised.
+
+    Returns:
+        dict: The services provided by the plugins.
+
+    Note:
+        A plugin can define the plugins that must be initialized before it with the
+        ``plugin_dependencies`` attribute (list of entry point names). The plugins without
+        dependencies between them are initialized concurrently (when ``max_workers > 1``).
+        The time spent by each plugin is reported in the application logger.
+
+    Note:
+        By default (``max_workers=1`` and no ``timeout``), the plugins are initialized in the
+        calling thread. Otherwise, they are initialized in worker threads (the ``timeout``
+        requires a thread to wait for). In both cases, the plugins are initialized in the
+        application context: the context of the caller is used in the calling thread and a
+        new context is pushed in the worker threads.
+    """
+    start = time.monotonic()
+
+    available_plugins = {
+        entry_point.name: entry_point.load()
+        for entry_point in list_plugins_entrypoint(entrypoint_group_name)
+    }
+
+    dependencies = _plugins_dependencies(available_plugins)
+
+    # factoring the plugins flask extensions
+    plugins_obj, plugins_time = _initialize_plugins(
+        app, available_plugins, dependencies, max_workers, timeout
+    )
+
+    _report_plugins_time(app, plugins_time, time.monotonic() - start)
+
+    # the services are merged using the entry points order
+    # (it does not depend on the initialization order).
+    available_services = {}
+    for plugin_name in available_plugins:
+        available_services.update(plugins_obj[plugin_name].plugin_services)
 
-        available_services.update(plugin_obj.plugin_services)
     return available_services
@@ -5,11 +5,69 @@
 # storm-commons is free software; you can redistribute it and/or modify it
 # under the terms of the MIT License; see LICENSE file for more details.
 
+from types import MappingProxyType
+
+from storm_commons.plugins.executors import ProcessServiceProxy
+
 
 class PluginManager:
-    def __init__(self, plugin_services: dict):
+    """Manager of the services provided by the plugins.
+
+    Note:
+        The catalog of the services (ids and metadata) is computed once, when the
+        plugin services are defined (see ``update_services``), and it is immutable.
+
+    Note:
+        The services that define ``execution_backend = "process"`` are executed in the
+        ``process_backend`` (e.g. ``storm_commons.plugins.executors.ProcessPoolBackend``). In
+        this case, ``service`` returns a proxy that runs the service methods in the backend.
+        Without a backend, these services run in the request thread.
+    """
+
+    def __init__(self, plugin_services: dict, process_backend=None):
+
+        self._process_backend = process_backend
+
+        self.update_services(plugin_services)
+
+    def update_services(self, plugin_services: dict):
+        """Define the plugin services and rebuild the services catalog."""
+        self._plugin_services = MappingProxyType(dict(plugin_services))
+
+        self._services_catalog = MappingProxyType(
+            {plugin.id: plugin.metadata for plugin in self._plugin_services.values()}
+        )
+        self._services_ids = frozenset(self._services_catalog)
+        self._services = tuple(
+            dict(id=plugin_id, metadata=metadata)
+            for plugin_id, metadata in self._services_catalog.items()
+        )
 
-        self._plugin_services = plugin_services
+        # proxies of the services executed in the process backend.
+        self._services_proxies = {}
+        if self._process_backend is not None:
+            self._services_proxies = {
+                service_name: ProcessServiceProxy(
+                    plugin, self._process_backend, service_key=service_name
+                )
+                for service_name, plugin in self._plugin_services.items()
+                if getattr(plugin, "execution_backend", None) == "process"
+            }
+
+    @property
+    def process_backend(self):
+        """Backend used to execute the services in a process pool."""
+        return self._process_backend
+
+    @property
+    def services_ids(self):
+        """Ids of the available services."""
+        return self._services_ids
+
+    @property
+    def services_catalog(self):
+        """Metadata of the available services (indexed by the service id)."""
+        return self._services_catalog
 
     def exists(self, service_name: str):
         """Check if a plugin service exists."""
@@ -18,15 +76,38 @@ class PluginManager:
     def service(self, service_name: str):
         """Get existing service."""
         if self.exists(service_name):
+            if service_name in self._services_proxies:
+                return self._services_proxies[service_name]
             return self._plugin_services.get(service_name)
         raise NotImplemented("Service not implemented yet.")
 
+    def schema(self, service_name: str):
+        """Get a schema instance of an existing service.
+
+        Returns:
+            marshmallow.Schema: The schema instance (``None`` if the service does not define a schema).
+
+        Note:
+            A new instance is created in each call: the schemas may store request data
+            (e.g. the identity in the ``context``).
+        """
+        schema_cls = self.service(service_name).schema
+
+        return schema_cls() if schema_cls else None
+
+    def backend_metrics(self):
+        """Utilization metrics of the process backend (``None`` if there is no backend)."""
+        if self._process_backend is None:
+            return None
+        return self._process_backend.metrics()
+
     def services(self):
-        """List all available services."""
-        return [
-            dict(id=plugin.id, metadata=plugin.metadata)
-            for plugin in self._plugin_services.values()
-        ]
+        """List all available services.
+
+        Note:
+            The list is shared by all callers. Please, do not change it.
+        """
+        return self._services
 
 
 __all__ = "PluginManager"
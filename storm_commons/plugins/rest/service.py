@@ -24,3 +24,7 @@ class PluginService(BaseInvenioService):
     def list_plugin_services(self):
         """List the available service plugin metadata."""
         return self.plugin_manager.services()
+
+    def plugin_backend_metrics(self):
+        """Utilization metrics of the plugins execution backend."""
+        return self.plugin_manager.backend_metrics()
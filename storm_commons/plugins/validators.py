@@ -26,8 +26,9 @@ def marshmallow_validate_plugin_service(extension_name, **kwargs):
     """
     plugin_manager = extension_plugin_manager(extension_name)
 
+    # the choices are sorted to keep the order of the error messages.
     return validate.OneOf(
-        choices=[service.get("id") for service in plugin_manager.services()],
+        choices=tuple(sorted(plugin_manager.services_ids)),
         **kwargs,
     )
 
@@ -53,13 +54,12 @@ def marshmallow_validate_custom_plugin_schema(extension_name, service_name, **kw
     if service_name:
         plugin_manager = extension_plugin_manager(extension_name)
 
-        # selecting the service from the current
-        # plugin manager.
-        service = plugin_manager.service(service_name)
+        # selecting the service schema from the current plugin manager.
+        schema = plugin_manager.schema(service_name)
 
         # validating
-        if service.schema:
-            return service.schema().load
+        if schema:
+            return schema.load
     return (
         lambda *args, **kwargs: False
     )  # customization not allowed in the selected service.
@@ -5,11 +5,37 @@
 # storm-commons is free software; you can redistribute it and/or modify it
 # under the terms of the MIT License; see LICENSE file for more details.
 
+import uuid
+
 from invenio_db import db
 from invenio_records.errors import MissingModelError
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+from sqlalchemy.orm.exc import NoResultFound
+from sqlalchemy.orm.util import identity_key
 
 from storm_commons.records.model import BaseRecordModel
 
+CACHE_INVALIDATIONS_KEY = "storm_commons.cache_invalidations"
+"""Key of the session ``info`` with the cache entries to be removed after the commit."""
+
+
+def _pending_invalidations(session):
+    """Cache entries (``(cache, key)``) changed in the current transaction of the session."""
+    return session.info.setdefault(CACHE_INVALIDATIONS_KEY, set())
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _apply_cache_invalidations(session):
+    """Remove the cache entries of the records changed in the finished transaction.
+
+    The entries are removed only when the transaction finishes. So, concurrent
+    readers can not cache the old values between the invalidation and the commit.
+    """
+    for cache, key in session.info.pop(CACHE_INVALIDATIONS_KEY, ()):
+        cache.delete(key)
+
 
 class BaseRecordModelAPI:
     """Base class to access and manipulate SQLAlchemy models."""
@@ -17,6 +43,9 @@ class BaseRecordModelAPI:
     model_cls = BaseRecordModel
     """SQLAlchemy model class defining which table stores the records."""
 
+    cache = None
+    """Optional read-through cache used by ``get_record`` (e.g. ``LocalRecordCache``)."""
+
     def __init__(self, model=None):
         self.model = model
 
@@ -49,8 +78,128 @@ class BaseRecordModelAPI:
         return obj
 
     @classmethod
-    def get_record(cls, with_deleted=False, **kwargs):
-        """Get record by arbitrary attribute(s)."""
+    def create_many(cls, items, commit=False):
+        """Create many new entries in a single flush.
+
+        Unlike ``create``, this method does not open a savepoint for each entry. All
+        entries are added to the session at once.
+
+        Args:
+            items (Iterable[dict]): Arguments used to create each model.
+
+            commit (bool): Flag indicating if the session must be committed.
+
+        Returns:
+            list: The created record objects.
+        """
+        objs = [cls(model=cls.model_cls(**kwargs)) for kwargs in items]
+
+        db.session.add_all([obj.model for obj in objs])
+
+        if commit:
+            db.session.commit()
+        return objs
+
+    @classmethod
+    def _cache_key(cls, **kwargs):
+        """Create the cache key of a lookup."""
+        lookup = ",".join(f"{k}={v}" for k, v in sorted(kwargs.items()))
+        return f"{cls.model_cls.__tablename__}:{lookup}"
+
+    @classmethod
+    def _cache_dump(cls, obj):
+        """Dump the column values of a model to be cached."""
+        return {
+            attr.key: getattr(obj, attr.key)
+            for attr in inspect(obj).mapper.column_attrs
+        }
+
+    @classmethod
+    def _cache_load(cls, state):
+        """Load a model from cached column values (without querying the database)."""
+        obj = cls.model_cls(**state)
+        make_transient_to_detached(obj)
+
+        return db.session.merge(obj, load=False)
+
+    @classmethod
+    def _is_session_loaded(cls, id_):
+        """Check if the model of a record is loaded in the current session.
+
+        Note:
+            The cached values must not be merged in a loaded model: the merge would
+            replace the changes not committed (and reset the model history).
+        """
+        identity_map = db.session.identity_map
+
+        if identity_key(cls.model_cls, id_) in identity_map:
+            return True
+
+        # the model ids are ``uuid.UUID`` objects (the lookups may use strings).
+        try:
+            uuid_ = uuid.UUID(str(id_))
+        except ValueError:
+            return False
+        return identity_key(cls.model_cls, uuid_) in identity_map
+
+    @classmethod
+    def _is_cache_pending(cls, pk_key, model=None):
+        """Check if the record has changes not committed in the current session."""
+        if (cls.cache, pk_key) in db.session.info.get(CACHE_INVALIDATIONS_KEY, ()):
+            return True
+
+        return model is not None and (
+            model in db.session.new or db.session.is_modified(model)
+        )
+
+    @classmethod
+    def _get_cached_record(cls, with_deleted=False, **kwargs):
+        """Get record by arbitrary attribute(s) using the read-through cache.
+
+        Note:
+            Records changed in the current transaction are read from the database
+            (and not cached) until the transaction is committed. Also, the records
+            already loaded in the session are not read from the cache.
+        """
+        cache = cls.cache
+
+        # lookups by arbitrary attributes store the primary key of the record.
+        key = cls._cache_key(**kwargs)
+        id_ = kwargs["id"] if set(kwargs) == {"id"} else cache.get(key)
+        pk_key = cls._cache_key(id=id_) if id_ is not None else None
+
+        # the records changed or loaded in the current session are read from the session.
+        if pk_key and (cls._is_cache_pending(pk_key) or cls._is_session_loaded(id_)):
+            return cls._get_record(with_deleted=with_deleted, **kwargs)
+
+        state = cache.get(pk_key) if pk_key else None
+
+        # checking if the cached record still matches the lookup.
+        if state is not None and all(
+            str(state.get(k)) == str(v) for k, v in kwargs.items()
+        ):
+            cache.register_hit()
+
+            if not with_deleted and state.get("is_deleted"):
+                raise NoResultFound()
+            return cls(model=cls._cache_load(state))
+
+        cache.register_miss()
+        record = cls._get_record(with_deleted=with_deleted, **kwargs)
+
+        pk_key = cls._cache_key(id=record.id)
+        if cls._is_cache_pending(pk_key, record.model):
+            return record
+
+        cache.set(pk_key, cls._cache_dump(record.model))
+        if key != pk_key:
+            cache.set(key, record.id)
+
+        return record
+
+    @classmethod
+    def _get_record(cls, with_deleted=False, **kwargs):
+        """Get record by arbitrary attribute(s) from the database."""
         with db.session.no_autoflush:
             query = cls.model_cls.query.filter_by(**kwargs)
             if not with_deleted:
@@ -59,6 +208,17 @@ class BaseRecordModelAPI:
             obj = query.one()
             return cls(model=obj)
 
+    @classmethod
+    def get_record(cls, with_deleted=False, **kwargs):
+        """Get record by arbitrary attribute(s).
+
+        Note:
+            When the ``cache`` is defined, the records are read through the cache.
+        """
+        if cls.cache is not None:
+            return cls._get_cached_record(with_deleted=with_deleted, **kwargs)
+        return cls._get_record(with_deleted=with_deleted, **kwargs)
+
     @classmethod
     def get_records(cls, with_deleted=False, **kwargs):
         """Get record by arbitrary attribute(s)."""
@@ -70,6 +230,113 @@ class BaseRecordModelAPI:
             objs = query.all()
             return [cls(model=obj) for obj in objs]
 
+    @classmethod
+    def iter_records(
+        cls, chunk_size=1000, with_deleted=False, query_filter=None, **kwargs
+    ):
+        """Iterate over the records selected by arbitrary attribute(s).
+
+        Unlike ``get_records``, the rows are streamed from the database (server-side
+        cursor) in chunks of ``chunk_size`` rows. The models of each processed chunk
+        are removed from the session, so the memory usage does not depend on the
+        number of records selected.
+
+        Args:
+            chunk_size (int): Number of rows fetched from the database at a time.
+
+            with_deleted (bool): Flag indicating if deleted records must be included.
+
+            query_filter (Callable): Function to apply extra filters on the query.
+
+        Yields:
+            BaseRecordModelAPI: Selected records.
+
+        Note:
+            The records yielded are detached from the session after their chunk
+            is processed. So, they should not be kept or changed after that.
+        """
+        query = cls.model_cls.query.filter_by(**kwargs)
+        if not with_deleted:
+            query = query.filter(cls.model_cls.is_deleted != True)
+
+        if query_filter:
+            query = query_filter(query)
+
+        query = query.execution_options(stream_results=True).yield_per(chunk_size)
+
+        # the autoflush is disabled only while the rows are fetched: the
+        # consumer code (between the yields) runs with the session defaults.
+        with db.session.no_autoflush:
+            rows = iter(query)
+
+        processed = []
+        try:
+            while True:
+                with db.session.no_autoflush:
+                    obj = next(rows, None)
+
+                if obj is None:
+                    break
+
+                yield cls(model=obj)
+
+                processed.append(obj)
+                if len(processed) >= chunk_size:
+                    cls._expunge(processed)
+                    processed = []
+        finally:
+            # also when the consumer stops the iteration (or fails).
+            cls._expunge(processed)
+
+    @staticmethod
+    def _expunge(objs):
+        """Remove the processed models from the session."""
+        for obj in objs:
+            if obj in db.session:
+                db.session.expunge(obj)
+
+    @classmethod
+    def get_records_by_id(cls, ids, with_deleted=False):
+        """Get many records by id using a single query.
+
+        Args:
+            ids (Iterable[Union[uuid.uuid4, str]]): Records ids.
+
+            with_deleted (bool): Flag indicating if deleted records must be included.
+
+        Returns:
+            dict: Records found, indexed by the string representation of their ids.
+        """
+        with db.session.no_autoflush:
+            query = cls.model_cls.query.filter(cls.model_cls.id.in_(list(ids)))
+            if not with_deleted:
+                query = query.filter(cls.model_cls.is_deleted != True)
+
+            return {str(obj.id): cls(model=obj) for obj in query.all()}
+
+    @classmethod
+    def commit_many(cls, records):
+        """Commit the models of many records using a single savepoint.
+
+        Args:
+            records (Iterable[BaseRecordModelAPI]): Records to be committed.
+
+        Returns:
+            list: The committed records.
+        """
+        records = list(records)
+        if any(record.model is None for record in records):
+            raise MissingModelError()
+
+        with db.session.begin_nested():
+            for record in records:
+                db.session.merge(record.model)
+
+        for record in records:
+            record.invalidate_cache()
+
+        return records
+
     def commit(self, **kwargs):
         """Commit the record model changes in the database."""
         if self.model is None:
@@ -78,7 +345,21 @@ class BaseRecordModelAPI:
         with db.session.begin_nested():
             db.session.merge(self.model)
 
+        self.invalidate_cache()
         return self
 
+    def invalidate_cache(self):
+        """Remove the record from the read-through cache.
+
+        Note:
+            The record is removed when the current transaction of the session is
+            committed (or rolled back). Until then, the record is not read from
+            (or stored in) the cache.
+        """
+        if self.cache is not None and self.id is not None:
+            _pending_invalidations(db.session).add(
+                (self.cache, self._cache_key(id=self.id))
+            )
+
 
 __all__ = "BaseRecordModelAPI"
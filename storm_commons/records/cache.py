@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-commons is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+import copy
+import time
+import threading
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+
+class BaseRecordCache(ABC):
+    """Base class for the record caches used by ``BaseRecordModelAPI``.
+
+    The cache stores the column values of the record models (indexed by
+    primary key) and the primary keys of arbitrary lookups.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    @abstractmethod
+    def get(self, key):
+        """Get a cached value (``None`` if the key is not cached)."""
+
+    @abstractmethod
+    def set(self, key, value):
+        """Cache a value."""
+
+    @abstractmethod
+    def delete(self, key):
+        """Remove a cached value."""
+
+    def register_hit(self):
+        """Increment the hits counter."""
+        self.hits += 1
+
+    def register_miss(self):
+        """Increment the misses counter."""
+        self.misses += 1
+
+    def stats(self):
+        """Cache usage counters."""
+        requests = self.hits + self.misses
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / requests if requests else 0.0,
+        }
+
+
+class LocalRecordCache(BaseRecordCache):
+    """In-process record cache with LRU and TTL eviction.
+
+    Args:
+        maxsize (int): Maximum number of cached entries.
+
+        ttl (int): Time (in seconds) an entry stays in the cache. Use ``None``
+                   to keep the entries until they are evicted or invalidated.
+    """
+
+    def __init__(self, maxsize=1024, ttl=300):
+        super(LocalRecordCache, self).__init__()
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+
+        self._data = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, key):
+        """Get a cached value (``None`` if the key is not cached or expired)."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+
+            value, expires_at = item
+            if expires_at is not None and expires_at < time.monotonic():
+                del self._data[key]
+                return None
+
+            self._data.move_to_end(key)
+
+        # the cached values must not be changed by the callers.
+        return copy.deepcopy(value)
+
+    def set(self, key, value):
+        """Cache a value."""
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+
+        with self._lock:
+            self._data[key] = (copy.deepcopy(value), expires_at)
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        """Remove a cached value."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        """Remove all cached values."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        """Number of cached entries."""
+        return len(self._data)
+
+
+class SharedRecordCache(BaseRecordCache):
+    """Record cache shared between processes.
+
+    Args:
+        client (object): Cache client with the ``get``, ``set`` (with the ``timeout``
+                         argument) and ``delete`` methods, like the ``Flask-Caching``
+                         or ``cachelib`` caches (e.g. ``invenio_cache.current_cache``).
+
+        prefix (str): Prefix added to the cache keys.
+
+        ttl (int): Time (in seconds) an entry stays in the cache.
+
+    Note:
+        The eviction of the entries is made by the client backend (e.g. Redis). In the
+        tests, a local client (e.g. ``cachelib.SimpleCache``) can be used.
+    """
+
+    def __init__(self, client, prefix="storm-records", ttl=300):
+        super(SharedRecordCache, self).__init__()
+
+        self.client = client
+        self.prefix = prefix
+        self.ttl = ttl
+
+    def _key(self, key):
+        """Create the key used in the client backend."""
+        return f"{self.prefix}:{key}"
+
+    def get(self, key):
+        """Get a cached value (``None`` if the key is not cached)."""
+        return self.client.get(self._key(key))
+
+    def set(self, key, value):
+        """Cache a value."""
+        self.client.set(self._key(key), value, timeout=self.ttl)
+
+    def delete(self, key):
+        """Remove a cached value."""
+        self.client.delete(self._key(key))
+
+
+__all__ = (
+    "BaseRecordCache",
+    "LocalRecordCache",
+    "SharedRecordCache",
+)
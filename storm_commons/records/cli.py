@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-commons is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+import click
+
+from flask.cli import with_appcontext
+from invenio_db import db
+
+
+def backfill_access_index(record_cls, field_name="access", chunk_size=500):
+    """Populate the access index table with the access data of the existing records.
+
+    Args:
+        record_cls (invenio_records.api.Record): Record class with a ``RecordAccessField``
+                                                 configured with an ``index_model_cls``.
+
+        field_name (str): Name of the ``RecordAccessField`` in the record class.
+
+        chunk_size (int): Number of records processed in each transaction.
+
+    Returns:
+        int: Number of records indexed.
+    """
+    field = getattr(record_cls, field_name)
+    model_cls = record_cls.model_cls
+
+    # the records are selected in batches sorted by ``id`` (keyset pagination). So,
+    # each batch is a new query and the commits do not interrupt a streamed result.
+    total = 0
+    last_id = None
+    while True:
+        query = model_cls.query.order_by(model_cls.id.asc())
+        if last_id is not None:
+            query = query.filter(model_cls.id > last_id)
+
+        models = query.limit(chunk_size).all()
+        if not models:
+            break
+
+        for model in models:
+            # skipping deleted records.
+            if model.data is None:
+                continue
+
+            record = record_cls(model.data, model=model)
+            field.sync_index(record, getattr(record, field_name))
+
+            total += 1
+
+        last_id = models[-1].id
+        db.session.commit()
+
+    return total
+
+
+def create_backfill_access_index_command(
+    record_cls, field_name="access", name="backfill-access-index"
+):
+    """Create a command to populate the access index table of a record class.
+
+    Args:
+        record_cls (invenio_records.api.Record): Record class with a ``RecordAccessField``
+                                                 configured with an ``index_model_cls``.
+
+        field_name (str): Name of the ``RecordAccessField`` in the record class.
+
+        name (str): Command name.
+
+    Returns:
+        click.Command: Command to be registered in the application CLI.
+    """
+
+    @click.command(name)
+    @click.option("--chunk-size", default=500, show_default=True, type=int)
+    @with_appcontext
+    def backfill(chunk_size):
+        """Populate the access index table with the access data of the existing records."""
+        total = backfill_access_index(record_cls, field_name, chunk_size)
+
+        click.secho(f"{total} records indexed.", fg="green")
+
+    return backfill
+
+
+__all__ = ("backfill_access_index", "create_backfill_access_index_command")
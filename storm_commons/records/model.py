@@ -10,6 +10,7 @@ from datetime import datetime
 
 from invenio_db import db
 from sqlalchemy.dialects import mysql
+from sqlalchemy.ext.declarative import declared_attr
 from sqlalchemy_utils.types import UUIDType
 
 
@@ -40,4 +41,38 @@ class BaseRecordModel:
     is_deleted = db.Column(db.Boolean(), default=False)
 
 
-__all__ = "BaseRecordModel"
+class BaseRecordAccessModel:
+    """Normalized access data of the records (``RecordAccess``).
+
+    Each row represents an agent with a role (e.g. ``owned_by``) in a record. The
+    rows are kept in sync by the ``RecordAccessField`` and are used to select the
+    records accessible by an agent without scanning the records JSON.
+
+    Note:
+        This is a mixin class. To use it, define a concrete model with the
+        ``__tablename__`` and set it in the ``RecordAccessField``.
+    """
+
+    record_id = db.Column(UUIDType, primary_key=True)
+
+    agent_type = db.Column(db.String(32), primary_key=True)
+
+    agent_id = db.Column(db.String(255), primary_key=True)
+
+    role = db.Column(db.String(32), primary_key=True)
+
+    @declared_attr
+    def __table_args__(cls):
+        """Indexes to select the records of an agent."""
+        return (
+            db.Index(
+                f"ix_{cls.__tablename__}_agent",
+                "agent_type",
+                "agent_id",
+                "role",
+                "record_id",
+            ),
+        )
+
+
+__all__ = ("BaseRecordModel", "BaseRecordAccessModel")
@@ -5,7 +5,10 @@
 # storm-commons is free software; you can redistribute it and/or modify it
 # under the terms of the MIT License; see LICENSE file for more details.
 
+import json
+from itertools import chain
 
+from invenio_db import db
 from invenio_records.systemfields import SystemField
 from storm_commons.records.systemfields.models import AgentList
 
@@ -24,6 +27,28 @@ class RecordAccess:
     owners_cls = AgentList
     contributors_cls = AgentList
 
+    @property
+    def owned_by(self):
+        """Record owners."""
+        return self._owned_by
+
+    @owned_by.setter
+    def owned_by(self, value):
+        """Set the record owners."""
+        self._owned_by = value
+        self._changed.add("owned_by")
+
+    @property
+    def contributed_by(self):
+        """Record contributors."""
+        return self._contributed_by
+
+    @contributed_by.setter
+    def contributed_by(self, value):
+        """Set the record contributors."""
+        self._contributed_by = value
+        self._changed.add("contributed_by")
+
     @property
     def owners(self):
         """An alias for the owned_by property."""
@@ -71,6 +96,11 @@ class RecordAccess:
             contributed_by=contributors,
         )
         access.errors = errors
+
+        # the object is equal to the ``access_dict``. So, it does not need
+        # to be dumped (unless some agents were discarded).
+        if not errors:
+            access.mark_clean()
         return access
 
     def __init__(
@@ -82,6 +112,8 @@ class RecordAccess:
         contributors_cls = contributors_cls or self.contributors_cls
 
         self.errors = []
+        self._changed = set()
+
         self.owned_by = owned_by if owned_by else owners_cls()
         self.contributed_by = contributed_by if contributed_by else contributors_cls()
 
@@ -92,6 +124,57 @@ class RecordAccess:
             "contributed_by": self.contributed_by.dump(),
         }
 
+    def changed_keys(self):
+        """Get the access keys (e.g. ``owned_by``) changed since the object creation."""
+        return {
+            key
+            for key in ["owned_by", "contributed_by"]
+            if key in self._changed or getattr(self, key).is_dirty
+        }
+
+    @property
+    def is_dirty(self):
+        """Check if the access object was changed."""
+        return bool(self.changed_keys())
+
+    def mark_dirty(self):
+        """Mark the access object as changed."""
+        self._changed.update(["owned_by", "contributed_by"])
+
+    def mark_clean(self):
+        """Mark the access object as not changed."""
+        self._changed.clear()
+
+        self.owned_by.mark_clean()
+        self.contributed_by.mark_clean()
+
+    def index_rows(self):
+        """Get the normalized access data as ``(agent_type, agent_id, role)`` rows."""
+        return {
+            (agent.agent_type, str(agent.agent_id), role)
+            for role, agents in [
+                ("owned_by", self.owned_by),
+                ("contributed_by", self.contributed_by),
+            ]
+            for agent in agents
+        }
+
+    @classmethod
+    def resolve_many(cls, accesses):
+        """Resolve the agents of many Access objects (e.g. the records of a result page).
+
+        All agents are resolved using a single query for each agent type.
+        """
+        agents = chain.from_iterable(
+            chain(access.owned_by, access.contributed_by) for access in accesses
+        )
+
+        cls.owners_cls.agent_cls.resolve_many(agents)
+
+    def resolve(self):
+        """Resolve the owners and contributors using a single query for each agent type."""
+        self.resolve_many([self])
+
     def refresh_from_dict(self, access_dict):
         """Re-initialize the Access object with the data in the access_dict."""
         new_access = self.from_dict(access_dict)
@@ -117,9 +200,21 @@ class RecordAccessField(SystemField):
         Reference class: https://github.com/inveniosoftware/invenio-rdm-records/blob/f3877c2b1482e3c951dc0a261f6cb8ea14a1cb16/invenio_rdm_records/records/systemfields/access/field/parent.py#L143
     """
 
-    def __init__(self, key="access", access_obj_class=RecordAccess):
-        """RecordAccessField initialization."""
+    def __init__(
+        self, key="access", access_obj_class=RecordAccess, index_model_cls=None
+    ):
+        """RecordAccessField initialization.
+
+        Args:
+            key (str): Key of the record data that stores the access data.
+
+            access_obj_class (type): Access object class.
+
+            index_model_cls (storm_commons.records.model.BaseRecordAccessModel): Optional
+                model used to store the normalized access data of the records.
+        """
         self._access_obj_class = access_obj_class
+        self._index_model_cls = index_model_cls
         super().__init__(key=key)
 
     def obj(self, instance):
@@ -141,19 +236,116 @@ class RecordAccessField(SystemField):
 
         assert isinstance(obj, self._access_obj_class)
 
+        # the new object must be dumped in the ``pre_commit``.
+        obj.mark_dirty()
+
         # From ``invenio-rdm-records``:
         # We do not dump the object until the pre_commit hook
         # I.e. record.access != record['access']
         self._set_cache(record, obj)
 
+    def _get_snapshot(self, record):
+        """Get the access data stored when the record was loaded (or last committed)."""
+        return getattr(record, "_obj_cache", {}).get(f"{self.attr_name}.snapshot")
+
+    @staticmethod
+    def _dump_snapshot(data):
+        """Serialize the access data (the snapshots are compared as JSON strings)."""
+        return json.dumps(data, sort_keys=True, default=str) if data else None
+
+    def _set_snapshot(self, record, data):
+        """Store a snapshot of the access data (used to check if the data was changed)."""
+        if not hasattr(record, "_obj_cache"):
+            record._obj_cache = {}
+        record._obj_cache[f"{self.attr_name}.snapshot"] = self._dump_snapshot(data)
+
+    def post_init(self, record, data, model=None, **kwargs):
+        """Store a snapshot of the access data of the loaded record.
+
+        Note:
+            The snapshot is a JSON string, which is cheaper to create than a copy of the
+            access data (see ``benchmarks/bench_access.py``). It is required to detect the
+            changes made directly in the record dict, which are not tracked.
+        """
+        self._set_snapshot(record, self.get_dictkey(record))
+
     def pre_commit(self, record):
-        """Dump the configured values before the record is committed."""
-        obj = self.obj(record)
-        if obj is not None:
+        """Dump the configured values before the record is committed.
+
+        Note:
+            When the access object was not loaded and the access data is equal to the data
+            loaded with the record, nothing is done. Otherwise, the access data is validated
+            (``from_dict``) and the changed parts of the access object are dumped.
+        """
+        obj = self._get_cache(record)
+        access_dict = self.get_dictkey(record)
+
+        is_unchanged = bool(access_dict) and self._dump_snapshot(
+            access_dict
+        ) == self._get_snapshot(record)
+
+        if obj is None:
+            if is_unchanged:
+                return  # the access data was not changed since the record was loaded.
+
+            # the access data was changed in the record dict (or the record is new): the
+            # data is validated and the valid data is dumped.
+            obj = self.obj(record)
+            obj.mark_dirty()
+
+        elif not is_unchanged:
+            # the access object is the source of the access data (as in the
+            # ``invenio-rdm-records``): changes in the record dict are overwritten.
+            obj.mark_dirty()
+
+        changed_keys = obj.changed_keys()
+        if not changed_keys:
+            return
+
+        if access_dict and isinstance(access_dict, dict):
+            for key in changed_keys:
+                access_dict[key] = getattr(obj, key).dump()
+        else:
             # only set the 'access' property if one was present in the
             # first place -- this was a problem in the unit test:
             # tests/resources/test_resources.py:test_simple_flow
-            record["access"] = obj.dump()
+            record[self.key] = obj.dump()
+
+        if self._index_model_cls:
+            self.sync_index(record, obj)
+
+        self._set_snapshot(record, self.get_dictkey(record))
+        obj.mark_clean()
+
+    def sync_index(self, record, obj):
+        """Synchronize the access index table with the record access object."""
+        model_cls = self._index_model_cls
+
+        rows = obj.index_rows()
+        existing_rows = {
+            (row.agent_type, row.agent_id, row.role): row
+            for row in model_cls.query.filter_by(record_id=record.id)
+        }
+
+        for row in existing_rows.keys() - rows:
+            db.session.delete(existing_rows[row])
+
+        db.session.add_all(
+            [
+                model_cls(
+                    record_id=record.id,
+                    agent_type=agent_type,
+                    agent_id=agent_id,
+                    role=role,
+                )
+                for agent_type, agent_id, role in rows - existing_rows.keys()
+            ]
+        )
+
+    def post_delete(self, record, force=False):
+        """Remove the normalized access data of a hard-deleted record."""
+        if force and self._index_model_cls:
+            self._index_model_cls.query.filter_by(record_id=record.id).delete()
 
     def __get__(self, record, owner=None):
         """Get the record's access object."""
@@ -21,6 +21,8 @@ class Agent:
         Reference class: https://github.com/inveniosoftware/invenio-rdm-records/blob/f3877c2b1482e3c951dc0a261f6cb8ea14a1cb16/invenio_rdm_records/records/systemfields/access/owners.py#L14
     """
 
+    __slots__ = ("agent_id", "agent_type", "_entity", "_resolved")
+
     #
     # Supported types
     #
@@ -34,10 +36,27 @@ class Agent:
         "project": lambda x: RecordMetadata.query.get(x),
     }
 
+    #
+    # Bulk loaders (used to resolve many agents with a single query for each type)
+    #
+    agent_cls_bulk_loaders = {
+        "user": lambda x: InvenioUser.query.filter(InvenioUser.id.in_(x)).all(),
+        "project": lambda x: RecordMetadata.query.filter(
+            RecordMetadata.id.in_(x)
+        ).all(),
+    }
+
     def __init__(self, agent):
-        """Create an agent object from a `dict` or `invenio_accounts.models.User`."""
+        """Create an agent object from a `dict` or `invenio_accounts.models.User`.
+
+        Note:
+            Agents created from a `dict` are resolved lazily. The entity is only
+            loaded from the database when ``resolve`` is called.
+        """
 
         self._entity = None
+        self._resolved = False
+
         self.agent_id = None
         self.agent_type = None
 
@@ -49,14 +68,6 @@ class Agent:
 
                 self.agent_type = _key
                 self.agent_id = agent[_key]
-
-                # finding the entity object
-                agent_cls = self.agent_cls.get(_key)
-                self._entity = (
-                    self.agent_cls_loaders.get(_key)(self.agent_id)
-                    if agent_cls
-                    else None
-                )
             else:
                 raise ValueError("Unknown owner type: {}".format(agent))
         else:
@@ -65,7 +76,8 @@ class Agent:
                 _entity = self.agent_cls.get(agent_type)
 
                 if isinstance(agent, _entity):
-                    self._entity = _entity
+                    self._entity = agent
+                    self._resolved = True
 
                     self.agent_id = agent.id
                     self.agent_type = agent_type
@@ -73,17 +85,53 @@ class Agent:
         if not all([self.agent_id, self.agent_type]):
             raise TypeError("Invalid agent type: {}".format(type(agent)))
 
+    @classmethod
+    def resolve_many(cls, agents):
+        """Resolve many agents using a single query for each agent type.
+
+        Args:
+            agents (Iterable[Agent]): Agents to be resolved. Agents already
+                                      resolved are not loaded again.
+
+        Returns:
+            None: The entities are stored in the agent objects.
+        """
+        unresolved = {}
+        for agent in agents:
+            if not agent._resolved:
+                unresolved.setdefault(agent.agent_type, []).append(agent)
+
+        for agent_type, agents_of_type in unresolved.items():
+            loader = cls.agent_cls_bulk_loaders.get(agent_type)
+            if not loader:
+                continue
+
+            entities = {
+                str(entity.id): entity
+                for entity in loader({agent.agent_id for agent in agents_of_type})
+            }
+
+            for agent in agents_of_type:
+                agent._entity = entities.get(str(agent.agent_id))
+                agent._resolved = True
+
     def dump(self):
         """Dump the owner to a dictionary."""
         return {self.agent_type: self.agent_id}
 
     def resolve(self):
         """Resolve the owner entity (e.g. User) via a database query."""
+        if not self._resolved:
+            loader = self.agent_cls_loaders.get(self.agent_type)
+
+            self._entity = loader(self.agent_id) if loader else None
+            self._resolved = True
+
         return self._entity
 
     def __hash__(self):
         """Return hash(self)."""
-        return hash(self.agent_type) + hash(self.agent_id)
+        return hash((self.agent_type, self.agent_id))
 
     def __eq__(self, other):
         """Return self == other."""
@@ -102,48 +150,173 @@ class Agent:
 
     def __repr__(self):
         """Return repr(self)."""
-        return repr(self.resolve())
+        return "<{} ({}: {})>".format(
+            type(self).__name__, self.agent_type, self.agent_id
+        )
 
 
 class AgentList(list):
-    """A list of agents for a record."""
+    """A list of agents for a record.
+
+    Note:
+        Besides the list (which keeps the agents order), a set of the agents
+        is kept to check the agents membership in constant time. Also, the list
+        tracks if it was changed after its creation (see ``is_dirty``).
+    """
 
     agent_cls = Agent
 
     def __init__(self, agents=None, agent_cls=None):
         """Create a new list of agents."""
         self.agent_cls = agent_cls or self.agent_cls
+        self._index = set()
 
         for agent in agents or []:
             self.add(agent)
 
+        self._dirty = False
+
+    @property
+    def is_dirty(self):
+        """Check if the list was changed since its creation (or the last ``mark_clean``)."""
+        return self._dirty
+
+    def mark_clean(self):
+        """Mark the list as not changed."""
+        self._dirty = False
+
+    def _to_agent(self, agent):
+        """Create an agent object (if required)."""
+        if not isinstance(agent, self.agent_cls):
+            agent = self.agent_cls(agent)
+        return agent
+
+    def __contains__(self, agent):
+        """Return agent in self."""
+        try:
+            return agent in self._index
+        except TypeError:  # unhashable objects are not agents.
+            return False
+
     def add(self, agent):
         """Alias for self.append(agent)."""
         self.append(agent)
 
     def append(self, agent):
         """Add the agent to a list of agents."""
-        if not isinstance(agent, self.agent_cls):
-            agent = self.agent_cls(agent)
+        agent = self._to_agent(agent)
 
-        if agent not in self:
+        if agent not in self._index:
             super().append(agent)
+            self._index.add(agent)
+            self._dirty = True
+
+    def insert(self, index, agent):
+        """Insert the agent before the index (if the agent is not in the list)."""
+        agent = self._to_agent(agent)
+
+        if agent not in self._index:
+            super().insert(index, agent)
+            self._index.add(agent)
+            self._dirty = True
 
     def extend(self, agents):
         """Add all new items from the specified agent to this list."""
         for agent in agents:
             self.add(agent)
 
+    def __iadd__(self, agents):
+        """Implement self += agents."""
+        self.extend(agents)
+        return self
+
+    def __imul__(self, times):
+        """Implement self *= times (the agents are not repeated)."""
+        if times <= 0:
+            self.clear()
+        return self
+
+    def sort(self, *, key=None, reverse=False):
+        """Sort the agents in place."""
+        agents = list(self)
+        super().sort(key=key, reverse=reverse)
+
+        if agents != list(self):
+            self._dirty = True
+
+    def reverse(self):
+        """Reverse the agents in place."""
+        if len(self) > 1:
+            super().reverse()
+            self._dirty = True
+
     def remove(self, agent):
         """Remove the specified owner from the list of owners.
 
         Args:
             agent (Agents.agent_cls): Agent object to remove from the list.
         """
-        if not isinstance(agent, self.agent_cls):
-            owner = self.agent_cls(agent)
+        agent = self._to_agent(agent)
 
         super().remove(agent)
+        self._index.discard(agent)
+        self._dirty = True
+
+    def pop(self, index=-1):
+        """Remove and return the agent at index (default last)."""
+        agent = super().pop(index)
+        self._index.discard(agent)
+        self._dirty = True
+
+        return agent
+
+    def clear(self):
+        """Remove all agents from the list."""
+        if self:
+            super().clear()
+            self._index.clear()
+            self._dirty = True
+
+    def __setitem__(self, index, value):
+        """Set self[index] to value."""
+        if isinstance(index, slice):
+            value = [self._to_agent(agent) for agent in value]
+        else:
+            value = self._to_agent(value)
+
+        super().__setitem__(index, value)
+        self._rebuild_index()
+        self._dirty = True
+
+    def __delitem__(self, index):
+        """Delete self[index]."""
+        super().__delitem__(index)
+        self._rebuild_index()
+        self._dirty = True
+
+    def _rebuild_index(self):
+        """Rebuild the agents set (removing duplicated agents)."""
+        agents = list(self)
+
+        super().clear()
+        self._index = set()
+
+        for agent in agents:
+            self.append(agent)
+
+    def __reduce__(self):
+        """Helper for pickle and copy."""
+        return type(self), (list(self), self.agent_cls)
+
+    def resolve(self):
+        """Resolve all agents using a single query for each agent type.
+
+        Returns:
+            list: The resolved entities (e.g. User).
+        """
+        self.agent_cls.resolve_many(self)
+
+        return [agent.resolve() for agent in self]
 
     def dump(self):
         """Dump the agents as a list of agent dictionaries."""
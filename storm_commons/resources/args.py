@@ -21,5 +21,19 @@ class BaseSearchRequestArgsSchema(MultiDictSchema):
     page = fields.Int(validate=validate.Range(min=1))
     size = fields.Int(validate=validate.Range(min=1))
 
+    # cursor-based pagination: an empty value starts the listing
+    # and the next cursors are provided in the ``next`` links.
+    after = fields.Str()
 
-__all__ = "BaseSearchRequestArgsSchema"
+
+class AdminAgentsRequestArgsSchema(MultiDictSchema):
+    """Query string arguments of the record agents listing (``admin_list_agents``)."""
+
+    page = fields.Int(validate=validate.Range(min=1))
+    size = fields.Int(validate=validate.Range(min=1))
+
+    role = fields.Str(validate=validate.OneOf(["owned_by", "contributed_by"]))
+    agent_type = fields.Str()
+
+
+__all__ = ("AdminAgentsRequestArgsSchema", "BaseSearchRequestArgsSchema")
@@ -14,6 +14,7 @@ from flask_resources import (
 )
 
 from storm_commons.resources.args import BaseSearchRequestArgsSchema
+from storm_commons.resources.serializers import NDJSONSerializer
 
 
 class BaseResourceConfig(ResourceConfig):
@@ -27,7 +28,10 @@ class BaseResourceConfig(ResourceConfig):
     default_content_type = "application/json"
 
     # Response handling
-    response_handlers = {"application/json": ResponseHandler(JSONSerializer())}
+    response_handlers = {
+        "application/json": ResponseHandler(JSONSerializer()),
+        "application/x-ndjson": ResponseHandler(NDJSONSerializer()),
+    }
     default_accept_mimetype = "application/json"
 
 
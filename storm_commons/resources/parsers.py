@@ -11,6 +11,8 @@ from flask_resources import (
     request_parser,
 )
 
+from storm_commons.resources.args import AdminAgentsRequestArgsSchema
+
 request_data = request_body_parser(
     parsers=from_conf("request_body_parsers"),
     default_content_type=from_conf("default_content_type"),
@@ -22,8 +24,13 @@ request_search_args = request_parser(from_conf("request_search_args"), location=
 
 request_view_args = request_parser(from_conf("request_view_args"), location="view_args")
 
+request_admin_agents_args = request_parser(
+    AdminAgentsRequestArgsSchema, location="args"
+)
+
 
 __all__ = (
+    "request_admin_agents_args",
     "request_data",
     "request_read_args",
     "request_search_args",
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-commons is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+from flask import g
+
+from flask_resources import response_handler, resource_requestctx
+
+from storm_commons.resources.parsers import request_search_args
+
+
+class ExportResourceMixin:
+    """Resource mixin with features to stream search results.
+
+    Note:
+        The records are always streamed as newline-delimited JSON (``export_mimetype``),
+        whatever the accept header of the request is: the other serializers (e.g. JSON)
+        can not serialize the lazy ``hits``. So, the ``export_mimetype`` must have a
+        response handler in the resource config (see ``BaseResourceConfig``). Also, the
+        ``export`` route must be defined in the ``create_url_rules`` of the resource.
+    """
+
+    export_mimetype = "application/x-ndjson"
+    """Mimetype of the response handler used to stream the records."""
+
+    @request_search_args
+    @response_handler(many=True)
+    def export(self):
+        """Stream all records that match the search arguments."""
+        # forcing the streaming handler (the negotiated one can be the default JSON).
+        resource_requestctx.accept_mimetype = self.export_mimetype
+        resource_requestctx.response_handler = self.config.response_handlers[
+            self.export_mimetype
+        ]
+
+        scan_result = self.service.scan(g.identity, resource_requestctx.args)
+        return scan_result.hits, 200
+
+
+__all__ = "ExportResourceMixin"
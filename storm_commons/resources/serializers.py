@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-commons is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+from flask import json, stream_with_context
+
+
+class NDJSONSerializer:
+    """Newline-delimited JSON (NDJSON) serializer.
+
+    Lists of objects (e.g. the ``hits`` of a ``BaseScanResult``) are serialized
+    lazily, one object per line. So, the response is streamed to the client while
+    the objects are generated.
+    """
+
+    def serialize_object(self, obj):
+        """Serialize a single object as a JSON line."""
+        return json.dumps(obj) + "\n"
+
+    def serialize_object_list(self, obj_list):
+        """Serialize a list (or iterator) of objects as a stream of JSON lines."""
+        return stream_with_context(self.serialize_object(obj) for obj in obj_list)
+
+
+__all__ = "NDJSONSerializer"
@@ -15,6 +15,10 @@ class SoftDeleteComponent(ServiceComponent):
         """Create handler."""
         record.is_deleted = True
 
+        # deleted records must not be served from the cache.
+        if hasattr(record, "invalidate_cache"):
+            record.invalidate_cache()
+
 
 class FinishStatusComponent(ServiceComponent):
     """Service component which set the record status (``is_finished``)."""
@@ -5,10 +5,20 @@
 # storm-commons is free software; you can redistribute it and/or modify it
 # under the terms of the MIT License; see LICENSE file for more details.
 
-from .conditional import BaseConditionalGenerator, IfFinished, AllGenerator
+from .conditional import (
+    BaseConditionalGenerator,
+    IfFinished,
+    AllGenerator,
+    generators_group_key,
+    generators_query_filter,
+    generators_sql_filter,
+)
 
 __all__ = (
     "IfFinished",
     "AllGenerator",
     "BaseConditionalGenerator",
+    "generators_group_key",
+    "generators_query_filter",
+    "generators_sql_filter",
 )
@@ -5,38 +5,341 @@
 # storm-commons is free software; you can redistribute it and/or modify it
 # under the terms of the MIT License; see LICENSE file for more details.
 
+import operator
 from abc import ABC, abstractmethod
+from collections.abc import Mapping, Sequence
+from functools import reduce
 
 from pydash import py_
-from itertools import chain
 
-from invenio_records_permissions.generators import Generator
+from elasticsearch_dsl.query import Q
+from sqlalchemy import (
+    Boolean,
+    and_,
+    cast,
+    false,
+    func,
+    inspect,
+    literal,
+    not_,
+    or_,
+    true,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+
+from invenio_records_permissions.generators import (
+    AnyUser,
+    AuthenticatedUser,
+    Disable,
+    Generator,
+    SystemProcess,
+)
+
+STATIC_GENERATORS = (AnyUser, AuthenticatedUser, Disable, SystemProcess)
+"""Generators whose needs do not depend on the record."""
+
+JSON_FALSY_VALUES = ("null", "false", "0", '""', "[]", "{}")
+"""JSON values that are false in Python (e.g. ``bool(0) is False``)."""
+
+
+_MISSING = object()
+"""Marker of the keys not found by the field getters."""
+
+
+def _get_item(obj, key):
+    """Get an item by key (or by the integer value of the key) as in ``pydash.get``."""
+    try:
+        return obj[key]
+    except Exception:
+        pass
+
+    if not isinstance(key, int):
+        try:
+            return obj[int(key)]
+        except Exception:
+            pass
+
+    return _MISSING
+
+
+def _get_key(obj, key):
+    """Get a key of an object as in ``pydash.get`` (``_MISSING`` if the key is not found)."""
+    if isinstance(obj, dict):
+        value = obj.get(key, _MISSING)
+
+        if value is _MISSING and not isinstance(key, int):
+            try:
+                value = obj.get(int(key), _MISSING)
+            except Exception:
+                pass
+        return value
+
+    # the attributes of the mappings and sequences (e.g. methods) are not
+    # used, except for the named tuples.
+    if isinstance(obj, (Mapping, Sequence)) and not (
+        isinstance(obj, tuple) and hasattr(obj, "_fields")
+    ):
+        return _get_item(obj, key)
+
+    value = _get_item(obj, key)
+    if value is _MISSING:
+        value = getattr(obj, key, _MISSING)
+    return value
+
+
+def compile_field_getter(field):
+    """Compile a field path (e.g. ``data.is_finished``) into a getter function.
+
+    The path is parsed only once. Each key is resolved as in ``pydash.get``: the mappings
+    and sequences are accessed by item (also with the integer value of the key, e.g. the
+    path ``a.1`` selects ``{"a": {1: "x"}}["a"][1]``) and the other objects by item and,
+    if it fails, by attribute. Missing values are returned as ``None``.
+    """
+    keys = tuple(py_.to_path(field))
+
+    def getter(obj):
+        for key in keys:
+            obj = _get_key(obj, key)
+
+            if obj is _MISSING:
+                return None
+        return obj
+
+    return getter
+
+
+def generators_sql_filter(generators, model_cls, identity):
+    """Create a SQL predicate selecting the records where the generators grant access.
+
+    Args:
+        generators (list): Generators (or ``flask_principal.Need`` objects) of a permission.
+
+        model_cls (storm_commons.records.model.BaseRecordModel): Model class queried.
+
+        identity (flask_principal.Identity): Identity of user searching the records.
+
+    Returns:
+        sqlalchemy.sql.ClauseElement: The predicate. When a generator can not be translated
+        to SQL (it does not implement ``sql_filter``), ``None`` is returned.
+    """
+    predicates = []
+
+    for g in generators:
+        if not hasattr(g, "needs"):
+            predicates.append(true() if g in identity.provides else false())
+
+        elif isinstance(g, STATIC_GENERATORS):
+            granted = any(need in identity.provides for need in g.needs())
+            predicates.append(true() if granted else false())
+
+        elif hasattr(g, "sql_filter"):
+            predicate = g.sql_filter(model_cls, identity)
+
+            if predicate is None:
+                return None
+            predicates.append(predicate)
+
+        else:
+            return None
+
+    return or_(*predicates) if predicates else false()
+
+
+def generators_query_filter(generators, **kwargs):
+    """Create a search query (``OR`` of the generators ``query_filter``).
+
+    Returns:
+        elasticsearch_dsl.query.Query: The query (or ``None`` if no generator defines a filter).
+    """
+    queries = [
+        g.query_filter(**kwargs) for g in generators if hasattr(g, "query_filter")
+    ]
+    queries = [q for q in queries if q]
+
+    return reduce(operator.or_, queries) if queries else None
+
+
+def generators_group_key(generators, record):
+    """Create a key identifying the records that have the same needs for the generators.
+
+    Records with equal keys are granted (or denied) the same way. So, a permission
+    can be evaluated once for each group of records (see ``check_permission_many``).
+
+    Args:
+        generators (list): Generators (or ``flask_principal.Need`` objects) of a permission.
+
+        record (object): Record used to evaluate the generators.
+
+    Returns:
+        tuple: The key. When a generator depends on the record and does not implement
+        ``group_key``, ``None`` is returned (the record can not be grouped).
+    """
+    key = []
+
+    for g in generators:
+        # needs and static generators does not depend on the record.
+        if not hasattr(g, "needs") or isinstance(g, STATIC_GENERATORS):
+            continue
+
+        g_key = g.group_key(record) if hasattr(g, "group_key") else None
+        if g_key is None:
+            return None
+        key.append(g_key)
+
+    return tuple(key)
 
 
 class BaseConditionalGenerator(ABC, Generator):
-    """Base generator to enable the creation of conditional generators."""
+    """Base generator to enable the creation of conditional generators.
+
+    Note:
+        The needs of each branch (``then_`` or ``else_``) are memoized. The ``flask_principal.Need``
+        objects and the needs of the generators that do not depend on the record (``STATIC_GENERATORS``)
+        are computed only once. The other generators are evaluated on each call.
+
+    Note:
+        The conditions can also be applied in the database (``sql_filter``) and in the search
+        engine (``query_filter``). In SQL, the fields are mapped to the ``Boolean`` model columns.
+        When a field is not a column, it is read from the JSON column defined in ``json_field``
+        (using the ``JSONB`` operators, which are only available in PostgreSQL).
+    """
+
+    json_field = "json"
+    """Name of the model column that stores the record data."""
 
     @abstractmethod
     def generators(self, record):
         """Choose between 'then' or 'else' generators."""
 
+    def _branch(self, generators):
+        """Split the generators of a branch into static needs and record-dependent generators."""
+        cache = self.__dict__.setdefault("_branches", {})
+
+        branch = cache.get(id(generators))
+        if branch is None or branch[0] is not generators:
+            static_needs, dynamic_generators = set(), []
+
+            # in the loop below is checked if the
+            # ``g`` has ``needs``. In this case is assumed
+            # that ``g`` is a ``Generator``. Otherwise, is
+            # assumed that ``g`` is a ``flask_principal.Need``.
+            for g in generators:
+                if not hasattr(g, "needs"):
+                    static_needs.add(g)
+                elif isinstance(g, STATIC_GENERATORS):
+                    static_needs.update(g.needs())
+                else:
+                    dynamic_generators.append(g)
+
+            branch = (generators, frozenset(static_needs), tuple(dynamic_generators))
+            cache[id(generators)] = branch
+
+        return branch
+
     def needs(self, record=None, **kwargs):
         """Needs to granting permission."""
+        _, static_needs, dynamic_generators = self._branch(self.generators(record))
 
-        # in the chain above is checked if the
-        # ``g`` has ``needs``. In this case is assumed
-        # that ``g`` is a ``Generator``. Otherwise, is
-        # assumed that ``g`` is a ``flask_principal.Need``.
-        return list(
-            set(
-                chain.from_iterable(
-                    [
-                        g.needs(record=record, **kwargs) if hasattr(g, "needs") else [g]
-                        for g in self.generators(record)
-                    ]
-                )
-            )
-        )
+        if not dynamic_generators:
+            return list(static_needs)
+
+        needs = set(static_needs)
+        for g in dynamic_generators:
+            needs.update(g.needs(record=record, **kwargs))
+
+        return list(needs)
+
+    def group_key(self, record):
+        """Key of the branch (and its record-dependent generators) selected for the record."""
+        branch, _, dynamic_generators = self._branch(self.generators(record))
+
+        key = generators_group_key(dynamic_generators, record)
+        if key is None:
+            return None
+        return id(branch), key
+
+    def _sql_field_condition(self, model_cls, field):
+        """Create a SQL predicate checking if a field is truth (``None`` if the field is not mapped).
+
+        The predicate follows the Python truthiness used in ``needs``. Values stored in the
+        JSON column are false when they are ``null``, ``false``, ``0``, ``""``, ``[]`` or ``{}``.
+        Other columns are only mapped when they are ``Boolean`` columns.
+        """
+        keys = list(py_.to_path(field))
+        columns = inspect(model_cls).columns
+
+        if keys[0] in columns:
+            column = getattr(model_cls, keys.pop(0))
+        elif self.json_field in columns:
+            column = getattr(model_cls, self.json_field)
+        else:
+            return None
+
+        if keys:
+            # nested value (``#>`` path operator). Missing keys are ``NULL``.
+            value = cast(column, JSONB)[tuple(keys)]
+            falsy_values = [
+                cast(literal(falsy_value), JSONB) for falsy_value in JSON_FALSY_VALUES
+            ]
+
+            condition = and_(value.isnot(None), value.notin_(falsy_values))
+        elif isinstance(column.type, Boolean):
+            condition = column == true()
+        else:
+            # the truthiness of other types (e.g. ``0`` or ``""``) is not translated.
+            return None
+
+        # ``NULL`` values are false (as ``None`` values in the ``needs``).
+        return func.coalesce(condition, false())
+
+    def _sql_condition(self, model_cls):
+        """Create the SQL predicate of the condition (``None`` if it can not be created)."""
+        return None
+
+    def _search_condition(self):
+        """Create the search query of the condition (``None`` if it can not be created)."""
+        return None
+
+    def sql_filter(self, model_cls, identity, **kwargs):
+        """SQL predicate selecting the records where the generator grants access.
+
+        Args:
+            model_cls (storm_commons.records.model.BaseRecordModel): Model class queried.
+
+            identity (flask_principal.Identity): Identity of user searching the records.
+
+        Returns:
+            sqlalchemy.sql.ClauseElement: The predicate (or ``None`` if the condition or
+            the branches generators can not be translated to SQL).
+        """
+        condition = self._sql_condition(model_cls)
+        if condition is None:
+            return None
+
+        then_ = generators_sql_filter(self.then_, model_cls, identity)
+        else_ = generators_sql_filter(self.else_, model_cls, identity)
+
+        if then_ is None or else_ is None:
+            return None
+
+        return or_(and_(condition, then_), and_(not_(condition), else_))
+
+    def query_filter(self, **kwargs):
+        """Search query selecting the documents where the generator grants access."""
+        condition = self._search_condition()
+        if condition is None:
+            return []
+
+        then_ = generators_query_filter(self.then_, **kwargs)
+        else_ = generators_query_filter(self.else_, **kwargs)
+
+        queries = []
+        if then_:
+            queries.append(condition & then_)
+        if else_:
+            queries.append(~condition & else_)
+
+        return reduce(operator.or_, queries) if queries else []
 
 
 class IfFinished(BaseConditionalGenerator):
@@ -60,18 +363,27 @@ class IfFinished(BaseConditionalGenerator):
         self.then_ = then_
         self.else_ = else_
 
+        # compiling the field path (handle properties and keys equally)
+        self._field_getter = compile_field_getter(field)
+
     def generators(self, record):
         """Choose between 'then' or 'else' generators."""
         if record is None:
             return self.else_
 
-        # getting the field using pydash
-        # (handle properties and keys equally)
-        value = py_.get(record, self.field)
+        value = self._field_getter(record)
         if value:
             return self.then_
         return self.else_
 
+    def _sql_condition(self, model_cls):
+        """Create the SQL predicate of the condition."""
+        return self._sql_field_condition(model_cls, self.field)
+
+    def _search_condition(self):
+        """Create the search query of the condition."""
+        return Q("term", **{self.field: True})
+
 
 class AllGenerator(BaseConditionalGenerator):
     """AllGenerator generator.
@@ -93,15 +405,39 @@ class AllGenerator(BaseConditionalGenerator):
         self.then_ = then_
         self.else_ = else_
 
+        # compiling the fields paths (handle properties and keys equally)
+        self._fields_getters = [compile_field_getter(field) for field in fields]
+
     def generators(self, record):
         """Choose between 'then' or 'else' generators."""
         if record is None:
             return self.else_
 
-        # getting the field using pydash
-        # (handle properties and keys equally)
-        all_fields_are_valid = all(py_.get(record, field) for field in self.fields)
+        all_fields_are_valid = all(getter(record) for getter in self._fields_getters)
 
         if all_fields_are_valid:
             return self.then_
         return self.else_
+
+    def _sql_condition(self, model_cls):
+        """Create the SQL predicate of the condition."""
+        conditions = [self._sql_field_condition(model_cls, f) for f in self.fields]
+
+        if any(condition is None for condition in conditions):
+            return None
+        return and_(*conditions)
+
+    def _search_condition(self):
+        """Create the search query of the condition."""
+        return Q("bool", must=[Q("term", **{field: True}) for field in self.fields])
+
+
+__all__ = (
+    "AllGenerator",
+    "BaseConditionalGenerator",
+    "IfFinished",
+    "compile_field_getter",
+    "generators_group_key",
+    "generators_query_filter",
+    "generators_sql_filter",
+)
@@ -6,10 +6,35 @@
 # under the terms of the MIT License; see LICENSE file for more details.
 
 
-from invenio_records_resources.services.base.links import LinksTemplate
+from invenio_records_resources.services.base.links import Link, LinksTemplate
 
 
-class ActionLinksTemplate(LinksTemplate):
+class BaseLinksTemplate(LinksTemplate):
+    """Templates for generating links with support to expand many objects at once."""
+
+    def _expand(self, obj, ctx):
+        """Expand all the link templates of an object using the given context."""
+        links = {}
+        for key, link in self._links.items():
+            if link.should_render(obj, ctx):
+                links[key] = link.expand(obj, ctx)
+
+        return links
+
+    def expand(self, obj):
+        """Expand all the link templates."""
+        return self._expand(obj, self.context)
+
+    def expand_many(self, objs):
+        """Expand all the link templates of many objects.
+
+        The links context is created only once for all objects.
+        """
+        ctx = self.context
+        return [self._expand(obj, ctx) for obj in objs]
+
+
+class ActionLinksTemplate(BaseLinksTemplate):
     """Templates for generating links with action objects."""
 
     def __init__(self, links, links_action, context=None):
@@ -18,11 +43,10 @@ class ActionLinksTemplate(LinksTemplate):
 
         self._links_action = links_action
 
-    def expand(self, obj):
-        """Expand all the link templates."""
+    def _expand(self, obj, ctx):
+        """Expand all the link templates of an object using the given context."""
 
         links = {"actions": {}}
-        ctx = self.context
         for key, link in self._links.items():
             if link.should_render(obj, ctx):
                 links[key] = link.expand(obj, ctx)
@@ -35,4 +59,50 @@ class ActionLinksTemplate(LinksTemplate):
         return links
 
 
-__all__ = "ActionLinksTemplate"
+def expand_links_many(links_tpl, objs):
+    """Expand the links of many objects.
+
+    Args:
+        links_tpl (invenio_records_resources.services.base.links.LinksTemplate): Links template.
+
+        objs (list): Objects used to expand the links.
+
+    Returns:
+        list: The expanded links of each object.
+    """
+    if hasattr(links_tpl, "expand_many"):
+        return links_tpl.expand_many(objs)
+    return [links_tpl.expand(obj) for obj in objs]
+
+
+def _keyset_next_vars(pagination, vars):
+    """Replace the cursor of the current page by the next page cursor."""
+    vars["args"].pop("page", None)
+    vars["args"]["after"] = pagination.next_after
+
+
+def keyset_pagination_links(tpl):
+    """Create the links for a cursor-based (keyset) paginated search.
+
+    Args:
+        tpl (str): URI template used to generate the links (e.g. ``{+api}/jobs{?args*}``).
+
+    Returns:
+        dict: Links definition (``self`` and ``next``).
+    """
+    return {
+        "self": Link(tpl),
+        "next": Link(
+            tpl,
+            when=lambda pagination, ctx: pagination.has_next,
+            vars=_keyset_next_vars,
+        ),
+    }
+
+
+__all__ = (
+    "BaseLinksTemplate",
+    "ActionLinksTemplate",
+    "expand_links_many",
+    "keyset_pagination_links",
+)
@@ -7,9 +7,32 @@
 
 from .options import BaseSearchOptions
 from .params import BasePaginationParam
+from .keyset import KeysetPage, keyset_paginate
+from .offset import OffsetPage, offset_paginate
+from .totals import ExactTotal, CappedTotal, EstimatedTotal, CachedTotal
+from .filters import (
+    BaseQueryFilter,
+    PermissionQueryFilter,
+    QueryFilterConfigurationError,
+    RecordAccessFilter,
+    RecordAccessIndexFilter,
+)
 
 
 __all__ = (
     "BaseSearchOptions",
     "BasePaginationParam",
+    "KeysetPage",
+    "keyset_paginate",
+    "OffsetPage",
+    "offset_paginate",
+    "ExactTotal",
+    "CappedTotal",
+    "EstimatedTotal",
+    "CachedTotal",
+    "BaseQueryFilter",
+    "PermissionQueryFilter",
+    "QueryFilterConfigurationError",
+    "RecordAccessFilter",
+    "RecordAccessIndexFilter",
 )
@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-commons is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+from flask import current_app
+from invenio_access.permissions import superuser_access, system_process
+from invenio_db import db
+from sqlalchemy import and_, cast, false, or_
+from sqlalchemy.dialects.postgresql import JSONB
+
+from storm_commons.services.generators.conditional import generators_sql_filter
+
+
+class QueryFilterConfigurationError(RuntimeError):
+    """Error raised when a query filter can not be applied with its configuration."""
+
+
+class BaseQueryFilter:
+    """Base class for the filters applied to the SQL queries of the search operations.
+
+    The filters are defined in the ``query_filters_cls`` option of the search options.
+    """
+
+    def __init__(self, config):
+        """Initializer."""
+        self.config = config
+
+    def apply(self, identity, query, params):
+        """Apply the filter to the query.
+
+        Args:
+            identity (flask_principal.Identity): Identity of user searching the records.
+
+            query (flask_sqlalchemy.BaseQuery): Search query.
+
+            params (dict): Search params (without the pagination params).
+
+        Returns:
+            flask_sqlalchemy.BaseQuery: The filtered query.
+        """
+        return query
+
+
+class RecordAccessFilter(BaseQueryFilter):
+    """Filter the records by the access data of the ``RecordAccessField``.
+
+    Only the records where an agent of the identity (the user itself or one of its
+    projects) is an owner or a contributor are selected. In the ``RecordAccess``
+    data, the agents are stored as ``{<agent type>: <agent id>}`` (e.g. ``{"user": 1}``).
+
+    Note:
+        This filter uses the ``JSONB`` containment operator (``@>``), which is
+        only available in PostgreSQL. The JSON column of the model is defined
+        by the ``json_field`` attribute.
+    """
+
+    json_field = "json"
+    """Name of the model column that stores the record data."""
+
+    access_key = "access"
+    """Key of the record data that stores the access data."""
+
+    roles = ("owned_by", "contributed_by")
+    """Roles that grant access to the records."""
+
+    project_need_method = "project"
+    """Need method used to define the projects of the identity."""
+
+    def bypass(self, identity):
+        """Check if the identity can access all records."""
+        return any(
+            need in identity.provides for need in (system_process, superuser_access)
+        )
+
+    def agents(self, identity):
+        """Get the agents (``{<agent type>: <agent id>}``) of the identity."""
+        agents = []
+
+        if identity.id is not None:
+            agents.append({"user": identity.id})
+
+        for need in identity.provides:
+            if need.method == self.project_need_method:
+                agents.append({"project": need.value})
+        return agents
+
+    def apply(self, identity, query, params):
+        """Select only the records accessible by the identity."""
+        if self.bypass(identity):
+            return query
+
+        agents = self.agents(identity)
+        if not agents:
+            return query.filter(false())
+
+        model_cls = query.column_descriptions[0]["entity"]
+        column = cast(getattr(model_cls, self.json_field), JSONB)
+
+        return query.filter(
+            or_(
+                *[
+                    column.contains({self.access_key: {role: [agent]}})
+                    for role in self.roles
+                    for agent in agents
+                ]
+            )
+        )
+
+
+class RecordAccessIndexFilter(RecordAccessFilter):
+    """Filter the records by the normalized access data (access index table).
+
+    Unlike the ``RecordAccessFilter``, this filter selects the accessible records
+    using the indexed table defined in the ``index_model_cls`` attribute (a model
+    based on ``storm_commons.records.model.BaseRecordAccessModel``).
+    """
+
+    index_model_cls = None
+    """Model that stores the normalized access data of the records."""
+
+    def apply(self, identity, query, params):
+        """Select only the records accessible by the identity."""
+        if self.bypass(identity):
+            return query
+
+        agents = self.agents(identity)
+        if not agents:
+            return query.filter(false())
+
+        index = self.index_model_cls
+        model_cls = query.column_descriptions[0]["entity"]
+
+        records_ids = db.session.query(index.record_id).filter(
+            index.role.in_(self.roles),
+            or_(
+                *[
+                    and_(
+                        index.agent_type == agent_type, index.agent_id == str(agent_id)
+                    )
+                    for agent in agents
+                    for agent_type, agent_id in agent.items()
+                ]
+            ),
+        )
+
+        return query.filter(model_cls.id.in_(records_ids))
+
+
+class PermissionQueryFilter(BaseQueryFilter):
+    """Filter the records using the generators of a permission policy.
+
+    The generators of the ``can_<action>`` attribute of the ``permission_policy_cls``
+    are translated to a SQL predicate (see ``storm_commons.services.generators.generators_sql_filter``).
+    So, the records are filtered in the database instead of being checked one by one.
+
+    Note:
+        When a generator of the policy can not be translated to SQL (e.g. it does not
+        implement ``sql_filter``), a ``QueryFilterConfigurationError`` is raised. To return
+        the query unfiltered in this case (e.g. when the records are checked later), use
+        ``allow_unfiltered = True``: a warning is logged for each unfiltered query.
+    """
+
+    permission_policy_cls = None
+    """Permission policy class with the generators used to filter the records."""
+
+    action = "read"
+    """Action of the permission policy used to filter the records."""
+
+    allow_unfiltered = False
+    """Flag indicating if the query is returned unfiltered when the policy can not be translated."""
+
+    def apply(self, identity, query, params):
+        """Select only the records where the policy grants the action to the identity."""
+        # as in the permission policies, the super users can access all records.
+        if superuser_access in identity.provides:
+            return query
+
+        generators = getattr(self.permission_policy_cls, f"can_{self.action}", [])
+
+        model_cls = query.column_descriptions[0]["entity"]
+        predicate = generators_sql_filter(generators, model_cls, identity)
+
+        if predicate is None:
+            message = (
+                f"The `can_{self.action}` generators of `{self.permission_policy_cls!r}` "
+                "can not be translated to SQL."
+            )
+
+            if not self.allow_unfiltered:
+                raise QueryFilterConfigurationError(message)
+
+            current_app.logger.warning(f"{message} The query was not filtered.")
+            return query
+
+        return query.filter(predicate)
+
+
+__all__ = (
+    "BaseQueryFilter",
+    "PermissionQueryFilter",
+    "QueryFilterConfigurationError",
+    "RecordAccessFilter",
+    "RecordAccessIndexFilter",
+)
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-commons is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+import base64
+import json
+import uuid
+from datetime import datetime
+
+from sqlalchemy import and_, or_
+
+CURSOR_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%f"
+"""Format of the timestamps in the cursor tokens (always with microseconds)."""
+
+
+def encode_cursor(created, id_):
+    """Encode a ``(created, id)`` pair as an opaque cursor token.
+
+    Args:
+        created (datetime.datetime): Creation timestamp of the last record of a page.
+
+        id_ (Union[uuid.UUID, str]): Identifier of the last record of a page.
+
+    Returns:
+        str: URL-safe cursor token.
+    """
+    payload = json.dumps(
+        [created.strftime(CURSOR_DATETIME_FORMAT), str(id_)], separators=(",", ":")
+    )
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token):
+    """Decode a cursor token created by ``encode_cursor``.
+
+    Args:
+        token (str): Cursor token.
+
+    Returns:
+        Tuple[datetime.datetime, uuid.UUID]: The ``(created, id)`` pair. When the token
+        is empty (first page of a cursor-based listing), ``None`` is returned.
+
+    Raises:
+        ValueError: If the token is malformed.
+    """
+    if not token:
+        return None
+
+    try:
+        padding = "=" * (-len(token) % 4)
+        created, id_ = json.loads(base64.urlsafe_b64decode(token + padding))
+
+        return datetime.strptime(created, CURSOR_DATETIME_FORMAT), uuid.UUID(id_)
+    except Exception:
+        raise ValueError("Invalid cursor token.")
+
+
+class KeysetPage:
+    """Page of results selected with keyset (seek) pagination.
+
+    This class has the same interface used by the ``BaseListResult`` on the
+    ``flask_sqlalchemy.Pagination`` objects (``items`` and ``total``), plus the
+    cursor used to select the next page. The rows are not counted in this mode.
+    """
+
+    total_strategy = None
+    """Strategy used to compute the total (the total is not computed)."""
+
+    def __init__(self, items, size, after=None, next_after=None, total=None):
+        self.items = items
+        self.size = size
+        self.after = after
+        self.next_after = next_after
+        self.total = total
+
+    @property
+    def has_next(self):
+        """Check if there is a page after the current one."""
+        return self.next_after is not None
+
+
+def keyset_paginate(query, model_cls, size, after=None):
+    """Paginate a query using the ``(created, id)`` columns as the sort key.
+
+    Instead of skipping the ``OFFSET`` rows of the previous pages, the query seeks
+    directly to the rows after the cursor. So, the cost of each page is the same
+    at any depth of the listing (as long as ``(created, id)`` is indexed).
+
+    Args:
+        query (flask_sqlalchemy.BaseQuery): Query with the filters applied.
+
+        model_cls (storm_commons.records.model.BaseRecordModel): Model class queried.
+
+        size (int): Number of records per page.
+
+        after (str): Cursor token of the last record seen.
+
+    Returns:
+        KeysetPage: Selected page.
+    """
+    cursor = decode_cursor(after)
+
+    if cursor:
+        created, id_ = cursor
+        query = query.filter(
+            or_(
+                model_cls.created > created,
+                and_(model_cls.created == created, model_cls.id > id_),
+            )
+        )
+
+    # fetching one extra row to check if there is a next page.
+    items = (
+        query.order_by(model_cls.created.asc(), model_cls.id.asc())
+        .limit(size + 1)
+        .all()
+    )
+
+    next_after = None
+    if len(items) > size:
+        items = items[:size]
+        next_after = encode_cursor(items[-1].created, items[-1].id)
+
+    return KeysetPage(items, size, after=after, next_after=next_after)
+
+
+__all__ = (
+    "KeysetPage",
+    "decode_cursor",
+    "encode_cursor",
+    "keyset_paginate",
+)
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-commons is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+from storm_commons.services.pagination.totals import ExactTotal
+
+
+class OffsetPage:
+    """Page of results selected with ``LIMIT``/``OFFSET`` pagination.
+
+    This class has the same interface used by the ``BaseListResult`` on the
+    ``flask_sqlalchemy.Pagination`` objects (``items`` and ``total``), plus the
+    name of the strategy used to compute the total.
+    """
+
+    def __init__(self, items, page, size, total, total_strategy):
+        self.items = items
+        self.page = page
+        self.size = size
+        self.total = total
+        self.total_strategy = total_strategy
+
+
+def offset_paginate(query, page, size, total_strategy):
+    """Paginate a query using ``LIMIT``/``OFFSET``.
+
+    Args:
+        query (flask_sqlalchemy.BaseQuery): Query with the filters applied.
+
+        page (int): Page number (starting at 1).
+
+        size (int): Number of records per page.
+
+        total_strategy (storm_commons.services.pagination.totals.ExactTotal): Strategy
+                        used to compute the total of records selected by the query.
+
+    Returns:
+        OffsetPage: Selected page.
+    """
+    items = query.limit(size).offset((page - 1) * size).all()
+
+    # as in ``flask_sqlalchemy``, the count is not required when
+    # all records are in the first page.
+    if page == 1 and len(items) < size:
+        total, strategy_name = len(items), ExactTotal.name
+    else:
+        total, strategy_name = total_strategy.count(query)
+
+    return OffsetPage(items, page, size, total, strategy_name)
+
+
+__all__ = ("OffsetPage", "offset_paginate")
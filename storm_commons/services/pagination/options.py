@@ -6,6 +6,7 @@
 # under the terms of the MIT License; see LICENSE file for more details.
 
 from storm_commons.services.pagination.params import BasePaginationParam
+from storm_commons.services.pagination.totals import ExactTotal
 
 
 class BaseSearchOptions:
@@ -14,9 +15,30 @@ class BaseSearchOptions:
     #
     # Pagination options
     #
-    pagination_options = {"default_results_per_page": 25, "default_max_results": 10000}
+    pagination_options = {
+        "default_results_per_page": 25,
+        "default_max_results": 10000,
+        # options of the total strategies.
+        "total_cap": 10000,
+        "total_cache_ttl": 60,
+    }
+
+    #
+    # Total strategy (``ExactTotal``, ``CappedTotal``, ``EstimatedTotal`` or ``CachedTotal``)
+    #
+    total_strategy_cls = ExactTotal
+
+    #
+    # Scan (streaming search) options
+    #
+    scan_options = {"chunk_size": 500}
 
     #
     # Parameters interpreters
     #
     params_interpreters_cls = [BasePaginationParam]
+
+    #
+    # Query filters (e.g. ``RecordAccessFilter``)
+    #
+    query_filters_cls = []
@@ -11,12 +11,14 @@ from invenio_records_resources.services.records.params import ParamInterpreter
 
 from invenio_records_resources.resources import RecordResourceConfig
 
+from storm_commons.services.pagination.keyset import decode_cursor
+
 
 class BasePaginationParam(ParamInterpreter):
     """Base pagination evaluator.
 
-    This param interpreter validates the search params (`size`, `page`). Please, note that,
-    since this interpreter does not use the `search` object, its returns None.
+    This param interpreter validates the search params (`size`, `page` and `after`). Please,
+    note that, since this interpreter does not use the `search` object, its returns None.
     """
 
     def apply(self, identity, search, params):
@@ -37,4 +39,11 @@ class BasePaginationParam(ParamInterpreter):
         if not p.valid():
             raise QuerystringValidationError("Invalid pagination parameters.")
 
+        # cursor-based pagination (``after`` is an opaque cursor token).
+        if "after" in params:
+            try:
+                decode_cursor(params["after"])
+            except ValueError:
+                raise QuerystringValidationError("Invalid pagination cursor.")
+
         return None
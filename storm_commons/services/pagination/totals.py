@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-commons is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+import threading
+import weakref
+
+from invenio_db import db
+from sqlalchemy import func
+from sqlalchemy.exc import CompileError
+
+from storm_commons.records.cache import LocalRecordCache
+
+
+class ExactTotal:
+    """Total strategy that counts all rows selected by the query (``COUNT(*)``)."""
+
+    name = "exact"
+    """Strategy name (reported in the search results)."""
+
+    def __init__(self, options):
+        """Initializer."""
+        self.options = options
+
+    def count(self, query):
+        """Count the rows selected by the query.
+
+        Returns:
+            Tuple[int, str]: The total and the name of the strategy that produced it.
+        """
+        return query.order_by(None).count(), self.name
+
+
+class CappedTotal(ExactTotal):
+    """Total strategy that stops counting after ``total_cap`` rows.
+
+    The total is exact when the query selects up to ``total_cap`` rows. Otherwise,
+    ``total_cap`` is reported.
+    """
+
+    name = "capped"
+
+    def count(self, query):
+        """Count the rows selected by the query (up to ``total_cap``)."""
+        cap = self.options.pagination_options["total_cap"]
+
+        subquery = query.order_by(None).limit(cap + 1).subquery()
+        total = db.session.query(func.count()).select_from(subquery).scalar()
+
+        if total > cap:
+            return cap, self.name
+        return total, ExactTotal.name
+
+
+class EstimatedTotal(ExactTotal):
+    """Total strategy that uses the query planner statistics.
+
+    Note:
+        The estimation is only available in PostgreSQL. In other databases (or when the
+        query can not be compiled with literal values), the rows are counted.
+    """
+
+    name = "estimated"
+
+    @staticmethod
+    def _explain(statement):
+        """Run an ``EXPLAIN`` statement in the session connection and get the plan.
+
+        Note:
+            The statement is sent with the DBAPI cursor (``text`` would parse the ``:name``
+            patterns of the literal values as bind parameters). The empty parameters make
+            the driver un-escape the ``%%`` rendered in the literal values.
+        """
+        cursor = db.session.connection().connection.cursor()
+
+        try:
+            cursor.execute(statement, ())
+            return cursor.fetchone()[0]
+        finally:
+            cursor.close()
+
+    def count(self, query):
+        """Estimate the number of rows selected by the query."""
+        bind = db.session.get_bind()
+
+        if bind.dialect.name == "postgresql":
+            try:
+                statement = query.order_by(None).statement.compile(
+                    dialect=bind.dialect, compile_kwargs={"literal_binds": True}
+                )
+            except (CompileError, NotImplementedError):
+                # e.g. values that can not be rendered as literals.
+                statement = None
+
+            if statement is not None:
+                plan = self._explain(f"EXPLAIN (FORMAT JSON) {statement}")
+                return int(plan[0]["Plan"]["Plan Rows"]), self.name
+
+        total, _ = super(EstimatedTotal, self).count(query)
+        return total, ExactTotal.name
+
+
+class CachedTotal(ExactTotal):
+    """Total strategy that caches the exact totals of each filter set.
+
+    The totals are cached (in-process) during ``total_cache_ttl`` seconds. Each search
+    options (e.g. the ``search`` of a service config) has its own cache.
+    """
+
+    name = "cached"
+
+    caches = weakref.WeakKeyDictionary()
+    """Caches of the totals indexed by the search options (created in the first use)."""
+
+    caches_lock = threading.Lock()
+    """Lock used to create the caches."""
+
+    def _cache(self):
+        """Get the totals cache of the search options."""
+        cache = self.caches.get(self.options)
+
+        if cache is None:
+            with self.caches_lock:
+                cache = self.caches.get(self.options)
+
+                if cache is None:
+                    cache = LocalRecordCache(
+                        maxsize=1024,
+                        ttl=self.options.pagination_options["total_cache_ttl"],
+                    )
+                    self.caches[self.options] = cache
+        return cache
+
+    def count(self, query):
+        """Get the cached total of the query (counting the rows in the cache misses)."""
+        statement = query.order_by(None).statement.compile()
+        key = f"{statement}:{sorted(statement.params.items())!r}"
+
+        cache = self._cache()
+        total = cache.get(key)
+
+        if total is None:
+            cache.register_miss()
+
+            total, _ = super(CachedTotal, self).count(query)
+            cache.set(key, total)
+        else:
+            cache.register_hit()
+
+        return total, self.name
+
+
+__all__ = (
+    "ExactTotal",
+    "CappedTotal",
+    "EstimatedTotal",
+    "CachedTotal",
+)
@@ -8,6 +8,36 @@
 from invenio_records_resources.pagination import Pagination
 from invenio_records_resources.services.base import ServiceItemResult, ServiceListResult
 
+from storm_commons.services.links import expand_links_many
+from storm_commons.services.pagination.keyset import KeysetPage
+
+
+def _dump_many(schema, identity, records, links_tpl=None):
+    """Serialize many records in a single schema pass."""
+    hits = schema.dump(
+        records,
+        schema_args={"many": True},
+        context=dict(identity=identity),
+    )
+
+    if links_tpl:
+        for hit, links in zip(hits, expand_links_many(links_tpl, records)):
+            hit["links"] = links
+
+    return hits
+
+
+def _dump_records(service, schema, identity, records, links_tpl=None, many=False):
+    """Serialize records in a single schema pass (``many``) or one by one."""
+    if many:
+        return _dump_many(schema, identity, records, links_tpl)
+
+    # the schema context of each record has the ``record`` (e.g. for field permissions).
+    return [
+        BaseItemResult(service, identity, record, links_tpl, schema).to_dict()
+        for record in records
+    ]
+
 
 class BaseItemResult(ServiceItemResult):
     """Single record result."""
@@ -49,36 +79,73 @@ class BaseListResult(ServiceListResult):
     """List of records results.
 
     This base class was implemented based on ``flask_sqlalchemy.Pagination``.  Thus, the result
-    passed to the class must be an ``SQLAlchemy pagination object.``.
+    passed to the class must be an ``SQLAlchemy pagination object.`` or, for cursor-based
+    searches, a ``storm_commons.services.pagination.keyset.KeysetPage``.
+
+    Note:
+        By default, each record is serialized with a ``BaseItemResult`` (the schema context
+        has the ``identity`` and the ``record``). Results whose schemas do not depend on
+        the ``record`` context (e.g. ``field_permission_check``) can set ``dump_many`` to
+        ``True`` to serialize the records of a page in a single ``many=True`` schema pass.
     """
 
+    dump_many = False
+    """Flag indicating if the page records are serialized in a single schema pass (opt-in)."""
+
+    @property
+    def is_keyset(self):
+        """Check if the results were selected with cursor-based pagination."""
+        return isinstance(self._results, KeysetPage)
+
     @property
     def pagination(self):
-        """Record list pagination."""
-        return Pagination(self._params["size"], self._params["page"], self.total)
+        """Record list pagination.
+
+        Note:
+            The pagination (and the ``prev``/``next`` links) of the offset-based searches
+            is computed from the reported total. With the ``capped`` and ``estimated`` total
+            strategies, the last page may be missing (or not exist). The strategy is
+            available in the ``total_strategy`` of the pagination (e.g. for the ``when``
+            conditions of the links).
+        """
+        if self.is_keyset:
+            return self._results
+
+        pagination = Pagination(self._params["size"], self._params["page"], self.total)
+        pagination.total_strategy = self.total_strategy
+
+        return pagination
 
     @property
     def items(self):
         """Result item iterator."""
-        for result in self._results.items:
-            # Load model
-            record = self._service.record_cls(model=result)
-
-            yield BaseItemResult(
-                self._service,
-                self._identity,
-                record,
-                self._links_item_tpl,
-                self._schema,
-            ).to_dict()
+        records = [
+            self._service.record_cls(model=result) for result in self._results.items
+        ]
+
+        yield from _dump_records(
+            self._service,
+            self._schema,
+            self._identity,
+            records,
+            self._links_item_tpl,
+            many=self.dump_many,
+        )
 
     @property
     def total(self):
         """Get total number of items in the result."""
         return self._results.total
 
+    @property
+    def total_strategy(self):
+        """Get the name of the strategy used to compute the total."""
+        return getattr(self._results, "total_strategy", "exact")
+
     def __len__(self):
         """Number of result items."""
+        if self.total is None:
+            return len(self._results.items)
         return self.total
 
     def __init__(
@@ -100,7 +167,17 @@ class BaseListResult(ServiceListResult):
         self._links_item_tpl = links_item_tpl
 
     def to_dict(self):
-        res = {"hits": {"hits": list(self.items), "total": self.total}}
+        res = {
+            "hits": {
+                "hits": list(self.items),
+                "total": self.total,
+                "total_strategy": self.total_strategy,
+            }
+        }
+
+        # cursor of the next page (``None`` in the last page).
+        if self.is_keyset:
+            res["hits"]["next_after"] = self._results.next_after
 
         if self._params:
             if self._links_tpl:
@@ -109,4 +186,102 @@ class BaseListResult(ServiceListResult):
         return res
 
 
-__all__ = ("BaseItemResult", "BaseListResult")
+class BaseScanResult(ServiceListResult):
+    """Stream of records results.
+
+    Unlike the ``BaseListResult``, this class does not load all records in memory. The
+    records are consumed from an iterator (e.g. ``BaseRecordModelAPI.iter_records``) and
+    serialized in chunks, when the ``hits`` are iterated.
+
+    Note:
+        As in the ``BaseListResult``, the single schema pass for each chunk is opt-in
+        (``dump_many``).
+    """
+
+    dump_many = False
+    """Flag indicating if each chunk is serialized in a single schema pass (opt-in)."""
+
+    def _dump_chunk(self, chunk):
+        """Serialize a chunk of records."""
+        return _dump_records(
+            self._service,
+            self._schema,
+            self._identity,
+            chunk,
+            self._links_item_tpl,
+            many=self.dump_many,
+        )
+
+    @property
+    def hits(self):
+        """Result item iterator."""
+        chunk = []
+        for record in self._records:
+            chunk.append(record)
+
+            if len(chunk) >= self._chunk_size:
+                yield from self._dump_chunk(chunk)
+                chunk = []
+
+        if chunk:
+            yield from self._dump_chunk(chunk)
+
+    def __init__(
+        self,
+        service,
+        identity,
+        records,
+        links_item_tpl=None,
+        schema=None,
+        chunk_size=500,
+    ):
+        self._service = service
+        self._identity = identity
+        self._records = records
+        self._schema = schema
+        self._links_item_tpl = links_item_tpl
+        self._chunk_size = chunk_size
+
+
+class BaseBulkResult(ServiceListResult):
+    """Result of a bulk operation.
+
+    This class stores the results of the items processed with success and
+    the errors of the items that could not be processed.
+    """
+
+    @property
+    def items(self):
+        """Result item iterator."""
+        for item in self._items:
+            yield item.to_dict()
+
+    @property
+    def errors(self):
+        """Errors of the items that could not be processed."""
+        return self._errors
+
+    @property
+    def total(self):
+        """Get total number of items processed with success."""
+        return len(self._items)
+
+    def __len__(self):
+        """Number of result items."""
+        return self.total
+
+    def __init__(self, service, identity, items, errors=None):
+        self._service = service
+        self._identity = identity
+        self._items = items
+        self._errors = errors or []
+
+    def to_dict(self):
+        """Get a dictionary for the bulk result."""
+        return {
+            "hits": {"hits": list(self.items), "total": self.total},
+            "errors": self.errors,
+        }
+
+
+__all__ = ("BaseItemResult", "BaseListResult", "BaseScanResult", "BaseBulkResult")
@@ -5,12 +5,24 @@
 # storm-commons is free software; you can redistribute it and/or modify it
 # under the terms of the MIT License; see LICENSE file for more details.
 
+import threading
+
 from invenio_db import db
+from marshmallow import ValidationError
+from sqlalchemy import inspect
 
 from invenio_records_resources.services.base import Service
+from invenio_records_resources.services.records.components import ServiceComponent
 from invenio_records_resources.services.uow import unit_of_work, RecordCommitOp
 from invenio_records_resources.services import ServiceSchemaWrapper, LinksTemplate
 
+from storm_commons.services.generators.conditional import generators_group_key
+from storm_commons.services.links import BaseLinksTemplate
+from storm_commons.services.pagination.keyset import keyset_paginate
+from storm_commons.services.pagination.offset import offset_paginate
+from storm_commons.services.results import BaseBulkResult, BaseScanResult
+from storm_commons.services.uow import RecordBulkCommitOp
+
 
 class BaseInvenioService(Service):
     """Base class service for building API without Elasticsearch indexing and other invenio stuffs.
@@ -20,6 +32,83 @@ class BaseInvenioService(Service):
         and many records, please use the Invenio-records and Invenio-[Record/Draft]-Resources Classes.
     """
 
+    def __init__(self, config):
+        super(BaseInvenioService, self).__init__(config)
+
+        # the components are instantiated once by thread and the methods that implement
+        # each operation are selected in advance (see ``run_components``).
+        self._components_local = threading.local()
+
+        # the schema wrapper and the links template are created once (on the
+        # first access) and reused by all requests. Both are stateless: the
+        # request context (e.g. identity) is passed in each call.
+        self._schema = None
+        self._links_item_tpl = None
+
+    @staticmethod
+    def _build_components_dispatch(components):
+        """Build the table of the component methods that implement each operation.
+
+        The methods inherited from ``ServiceComponent`` (no-op) are not included
+        in the table. The order of the components is preserved.
+
+        Returns:
+            dict: Bound methods indexed by the operation name.
+        """
+        dispatch = {}
+
+        for component in components:
+            for name in dir(type(component)):
+                if name.startswith("_"):
+                    continue
+
+                method = getattr(type(component), name)
+                if not callable(method) or method is getattr(
+                    ServiceComponent, name, None
+                ):
+                    continue
+
+                dispatch.setdefault(name, []).append(getattr(component, name))
+        return dispatch
+
+    def _thread_components(self):
+        """Get the components (and the dispatch table) of the current thread."""
+        local = self._components_local
+
+        if not hasattr(local, "components"):
+            local.components = [component(self) for component in self.config.components]
+            local.dispatch = self._build_components_dispatch(local.components)
+        return local
+
+    @property
+    def components(self):
+        """Service components.
+
+        Note:
+            The component instances are reused by all calls of the service in a thread. So,
+            the components must not store request data (e.g. the record or the identity).
+            Only the ``uow`` is defined in the components during each call.
+        """
+        return self._thread_components().components
+
+    def run_components(self, action, *args, **kwargs):
+        """Run the components methods that implement an operation.
+
+        Like ``Service.run_components``, the ``uow`` argument is not passed to the
+        methods: it is defined in the ``uow`` attribute of the components during the call.
+        """
+        uow = kwargs.pop("uow", None)
+
+        for method in self._thread_components().dispatch.get(action, ()):
+            component = method.__self__
+
+            if uow is not None:
+                component.uow = uow
+            try:
+                method(*args, **kwargs)
+            finally:
+                component.uow = None
+
     @property
     def record_cls(self):
         """Service record API class."""
@@ -28,11 +117,235 @@ class BaseInvenioService(Service):
     @property
     def schema(self):
         """Service record schema."""
-        return ServiceSchemaWrapper(self, schema=self.config.schema)
+        if self._schema is None:
+            self._schema = ServiceSchemaWrapper(self, schema=self.config.schema)
+        return self._schema
 
     @property
     def links_item_tpl(self):
-        return LinksTemplate(self.config.links_item)
+        """Service item links template."""
+        if self._links_item_tpl is None:
+            self._links_item_tpl = BaseLinksTemplate(self.config.links_item)
+        return self._links_item_tpl
+
+    @property
+    def result_bulk(self):
+        """Service bulk result class."""
+        return getattr(self.config, "result_bulk_cls", BaseBulkResult)
+
+    @property
+    def result_scan(self):
+        """Service scan result class."""
+        return getattr(self.config, "result_scan_cls", BaseScanResult)
+
+    def _load_many(self, identity, data):
+        """Validate many input items.
+
+        Returns:
+            Tuple[list, dict]: The loaded items (``None`` for the invalid ones) and the errors
+            indexed by the item position.
+
+        Note:
+            The items are loaded one by one (with the same schema instance). With ``many=True``,
+            marshmallow skips the schema validators and the ``post_load`` hooks of all items
+            when an item has field errors.
+        """
+        if not isinstance(data, (list, tuple)):
+            raise ValidationError({"_schema": ["Invalid input type."]})
+
+        loaded_items, errors = [], {}
+        for idx, item in enumerate(data):
+            try:
+                item, _ = self.schema.load(
+                    item, context={"identity": identity}, raise_errors=True
+                )
+            except ValidationError as e:
+                errors[idx] = e.messages
+                item = None
+
+            loaded_items.append(item)
+        return loaded_items, errors
+
+    def _run_components_many(self, action, identity, items, errors, uow=None):
+        """Run the components over a batch of items.
+
+        Each item runs the ``<action>`` method of the components in a savepoint. When a
+        component fails, the savepoint is rolled back (the changes made in the item by the
+        previous components are also discarded) and the item error is registered. Then,
+        the components that implement ``<action>_many`` are called once with the items
+        processed with success.
+
+        Args:
+            action (str): Component operation (e.g. ``create``).
+
+            identity (flask_principal.Identity): User identity.
+
+            items (list): List of ``(index, record, data)`` items.
+
+            errors (dict): Errors indexed by the item position.
+
+            uow (invenio_records_resources.services.uow.UnitOfWork): Unit of work defined in
+                                                                     the components (``uow``).
+
+        Returns:
+            list: The items processed with success.
+        """
+        components = self.components
+        for component in components:
+            component.uow = uow
+
+        try:
+            return self._run_components_items(action, identity, items, errors)
+        finally:
+            for component in components:
+                component.uow = None
+
+    def _run_components_items(self, action, identity, items, errors):
+        """Run the components over the items of a batch (see ``_run_components_many``)."""
+        batch_components = [
+            component
+            for component in self.components
+            if hasattr(component, f"{action}_many")
+        ]
+
+        processed_items = []
+        for idx, record, data in items:
+            try:
+                with db.session.begin_nested():
+                    for component in self.components:
+                        if component in batch_components or not hasattr(
+                            component, action
+                        ):
+                            continue
+
+                        getattr(component, action)(identity, record=record, data=data)
+            except ValidationError as e:
+                errors[idx] = e.messages
+                self._discard_record(action, record)
+            except Exception as e:
+                errors[idx] = [str(e)]
+                self._discard_record(action, record)
+            else:
+                processed_items.append((idx, record, data))
+
+        for component in batch_components:
+            getattr(component, f"{action}_many")(
+                identity,
+                records=[record for _, record, _ in processed_items],
+                data=[data for _, _, data in processed_items],
+            )
+        return processed_items
+
+    def _discard_record(self, action, record):
+        """Discard the record of an item that failed in a bulk operation.
+
+        Note:
+            The changes made by the components were rolled back with the item savepoint (see
+            ``_run_components_many``). The new records were inserted (flushed) before the
+            savepoint: so, they are deleted.
+        """
+        model = record.model
+
+        if action == "create" and inspect(model).persistent:
+            db.session.delete(model)
+        elif model in db.session:
+            db.session.expunge(model)
+
+    def _result_bulk(self, identity, items, errors, ids=None):
+        """Create the result object of a bulk operation."""
+        errors_list = []
+        for idx in sorted(errors):
+            error = {"index": idx, "errors": errors[idx]}
+            if ids:
+                error["id"] = str(ids[idx])
+            errors_list.append(error)
+
+        return self.result_bulk(
+            self,
+            identity,
+            [
+                self.result_item(
+                    self,
+                    identity,
+                    record,
+                    links_tpl=self.links_item_tpl,
+                    schema=self.schema,
+                )
+                for _, record, _ in items
+            ],
+            errors_list,
+        )
+
+    def check_permission_many(self, identity, action_name, records, **kwargs):
+        """Check a permission for many records.
+
+        The records are grouped by the branches selected in the conditional generators of
+        the policy (e.g. finished and unfinished records). The permission is evaluated
+        once for each group and the result is shared by all records of the group.
+
+        Args:
+            identity (flask_principal.Identity): User identity.
+
+            action_name (str): Action of the permission policy (e.g. ``read``).
+
+            records (list): Records to be checked.
+
+        Returns:
+            list: Flags (``bool``) indicating if the action is allowed for each record.
+
+        Note:
+            Records that can not be grouped (the policy has a generator that depends on the
+            record and does not implement ``group_key``) are checked one by one.
+        """
+        generators = getattr(
+            self.config.permission_policy_cls, f"can_{action_name}", []
+        )
+
+        results = []
+        groups = {}
+
+        for record in records:
+            key = generators_group_key(generators, record)
+
+            if key is None:
+                allowed = self.check_permission(
+                    identity, action_name, record=record, **kwargs
+                )
+            else:
+                if key not in groups:
+                    groups[key] = self.check_permission(
+                        identity, action_name, record=record, **kwargs
+                    )
+                allowed = groups[key]
+
+            results.append(allowed)
+        return results
+
+    def _get_records_many(self, identity, action, ids, errors):
+        """Load many records with a single query and check the action permission."""
+        records = self.record_cls.get_records_by_id(ids)
+
+        items = []
+        found_items = []
+        for idx, id_ in enumerate(ids):
+            record = records.get(str(id_))
+
+            if record is None:
+                errors[idx] = ["Record not found."]
+            else:
+                found_items.append((idx, record))
+
+        # checking the permission of all records (evaluated once for each group of records).
+        allowed = self.check_permission_many(
+            identity, action, [record for _, record in found_items]
+        )
+
+        for (idx, record), is_allowed in zip(found_items, allowed):
+            if not is_allowed:
+                errors[idx] = ["Permission denied."]
+            else:
+                items.append((idx, record))
+        return items
 
     @unit_of_work()
     def create(self, identity, data, uow=None):
@@ -57,9 +370,7 @@ class BaseInvenioService(Service):
         record = self.record_cls.create()
 
         # Run components
-        for component in self.components:
-            if hasattr(component, "create"):
-                component.create(identity, record=record, data=data)
+        self.run_components("create", identity, record=record, data=data, uow=uow)
 
         # Saving the data
         uow.register(RecordCommitOp(record))
@@ -88,9 +399,7 @@ class BaseInvenioService(Service):
         self.require_permission(identity, "read", record=record)
 
         # Run components
-        for component in self.components:
-            if hasattr(component, "read"):
-                component.read(identity, record=record)
+        self.run_components("read", identity, record=record)
 
         return self.result_item(
             self,
@@ -124,9 +433,7 @@ class BaseInvenioService(Service):
         )
 
         # Run components
-        for component in self.components:
-            if hasattr(component, "update"):
-                component.update(identity, record=record, data=data)
+        self.run_components("update", identity, record=record, data=data, uow=uow)
 
         # Saving the data
         uow.register(RecordCommitOp(record))
@@ -156,13 +463,132 @@ class BaseInvenioService(Service):
         self.require_permission(identity, "delete", record=record)
 
         # Run components
-        for component in self.components:
-            if hasattr(component, "delete"):
-                component.delete(identity, record=record)
+        self.run_components("delete", identity, record=record, uow=uow)
 
         # Saving the data
         uow.register(RecordCommitOp(record))
 
+    @unit_of_work()
+    def create_many(self, identity, data, uow=None):
+        """Create many records in the datastore in a single unit of work.
+
+        Args:
+            identity (flask_principal.Identity): Identity of user creating the records.
+
+            data (list): List of input data according to the selected service schema.
+
+        Returns:
+            `config.result_bulk_cls`: Created records and the errors of the items that could not be created.
+        """
+        self.require_permission(identity, "create")
+
+        # Validate input data (errors are registered by item)
+        data, errors = self._load_many(identity, data)
+        valid_indices = [idx for idx in range(len(data)) if idx not in errors]
+
+        # It's the components who saves the actual data in the records.
+        records = self.record_cls.create_many([{} for _ in valid_indices])
+
+        # Run components
+        items = self._run_components_many(
+            "create",
+            identity,
+            [(idx, record, data[idx]) for idx, record in zip(valid_indices, records)],
+            errors,
+            uow=uow,
+        )
+
+        # Saving the data
+        uow.register(RecordBulkCommitOp([record for _, record, _ in items]))
+
+        return self._result_bulk(identity, items, errors)
+
+    @unit_of_work()
+    def update_many(self, identity, data, uow=None):
+        """Update many existing records in the datastore in a single unit of work.
+
+        Args:
+            identity (flask_principal.Identity): Identity of user updating the records.
+
+            data (list): List of ``(id_, data)`` pairs, where ``data`` is the input
+                         data according to the selected service schema.
+
+        Returns:
+            `config.result_bulk_cls`: Updated records and the errors of the items that could not be updated.
+        """
+        errors = {}
+        ids = [id_ for id_, _ in data]
+
+        # Resolve (single query) and require permission
+        records = self._get_records_many(identity, "update", ids, errors)
+
+        # Validate input data (errors are registered by item)
+        loaded_data, load_errors = self._load_many(
+            identity, [data[idx][1] for idx, _ in records]
+        )
+        items = []
+        for position, (idx, record) in enumerate(records):
+            if position in load_errors:
+                errors[idx] = load_errors[position]
+            else:
+                items.append((idx, record, loaded_data[position]))
+
+        # Run components
+        items = self._run_components_many("update", identity, items, errors, uow=uow)
+
+        # Saving the data
+        uow.register(RecordBulkCommitOp([record for _, record, _ in items]))
+
+        return self._result_bulk(identity, items, errors, ids=ids)
+
+    @unit_of_work()
+    def delete_many(self, identity, ids, uow=None):
+        """Delete many existing records in the datastore in a single unit of work.
+
+        Args:
+            identity (flask_principal.Identity): Identity of user deleting the records.
+
+            ids (list): Record ids to delete from the datastore.
+
+        Returns:
+            `config.result_bulk_cls`: Deleted records and the errors of the items that could not be deleted.
+        """
+        errors = {}
+
+        # Resolve (single query) and require permission
+        records = self._get_records_many(identity, "delete", ids, errors)
+
+        # Run components
+        items = self._run_components_many(
+            "delete",
+            identity,
+            [(idx, record, None) for idx, record in records],
+            errors,
+            uow=uow,
+        )
+
+        # Saving the data
+        uow.register(RecordBulkCommitOp([record for _, record, _ in items]))
+
+        return self._result_bulk(identity, items, errors, ids=ids)
+
+    def _apply_query_filters(self, identity, query, params):
+        """Apply the query filters defined in the search options."""
+        for filter_cls in self.config.search.query_filters_cls:
+            query = filter_cls(self.config.search).apply(identity, query, params)
+        return query
+
+    def _links_search_keyset(self):
+        """Get the links of the cursor-based searches (``links_search_keyset`` config)."""
+        links_search = getattr(self.config, "links_search_keyset", None)
+
+        if links_search is None:
+            raise RuntimeError(
+                "Cursor-based search requires the `links_search_keyset` in the service "
+                "config (see `storm_commons.services.links.keyset_pagination_links`)."
+            )
+        return links_search
+
     def search(self, identity, params):
         """Search an existing record in the datastore.
 
@@ -173,6 +599,14 @@ class BaseInvenioService(Service):
 
         Returns:
             `config.result_list_cls`: List of records that match the query criteria.
+
+        Note:
+            By default, the records are paginated with ``page`` and ``size``. When the ``after``
+            parameter is defined (an empty value selects the first page), the records are paginated
+            with a cursor over the ``(created, id)`` columns. In this mode, the ``next`` links are
+            generated with the ``links_search_keyset`` (see
+            ``storm_commons.services.links.keyset_pagination_links``), which must be defined in the
+            service config. The next cursor is also available in the ``next_after`` of the result.
         """
         self.require_permission(identity, "search")
 
@@ -186,8 +620,10 @@ class BaseInvenioService(Service):
 
         # extracting the parameters
         # note: This search method handle data with SQLAlchemy. So, we need to "remove"
-        # the results options (in this case `size` and `page`) from the params dict.
-        pagination_params = {k: v for k, v in params.items() if k in ["size", "page"]}
+        # the results options (in this case `size`, `page` and `after`) from the params dict.
+        pagination_params = {
+            k: v for k, v in params.items() if k in ["size", "page", "after"]
+        }
         query_params = {k: v for k, v in params.items() if k not in pagination_params}
 
         with db.session.no_autoflush:
@@ -196,27 +632,85 @@ class BaseInvenioService(Service):
                 is_deleted=False, **query_params
             )
 
-            # paginate the results.
-            search_result = query.paginate(
-                page=pagination_params["page"],
-                per_page=pagination_params["size"],
-                error_out=False,
-            )
+            # filtering the records in the database (e.g. access filters). So,
+            # the pages and totals have only the records the identity may see.
+            query = self._apply_query_filters(identity, query, query_params)
+
+            if "after" in pagination_params:
+                # cursor-based pagination: the records are sorted by ``(created, id)``
+                # and the query seeks to the first record after the cursor.
+                links_search = self._links_search_keyset()
+                search_result = keyset_paginate(
+                    query,
+                    self.record_cls.model_cls,
+                    pagination_params["size"],
+                    after=pagination_params["after"],
+                )
+            else:
+                # paginate the results (the total is computed with
+                # the strategy defined in the search options).
+                search_result = offset_paginate(
+                    query,
+                    pagination_params["page"],
+                    pagination_params["size"],
+                    self.config.search.total_strategy_cls(self.config.search),
+                )
+                links_search = self.config.links_search
 
             # create a result list object.
-            # we use the ``flask_sqlalchemy.Pagination``, created in the
-            # ``BaseQuery.paginate`` method above.
+            # we use the ``OffsetPage`` (or the ``KeysetPage`` for
+            # cursor-based searches), created above.
             return self.result_list(
                 self,
                 identity,
                 search_result,
                 params,
-                links_tpl=LinksTemplate(
-                    self.config.links_search, context={"args": params}
+                links_tpl=(
+                    LinksTemplate(links_search, context={"args": params})
+                    if links_search
+                    else None
                 ),
                 links_item_tpl=self.links_item_tpl,
                 schema=self.schema,
             )
 
+    def scan(self, identity, params):
+        """Stream all records that match the search params.
+
+        Unlike ``search``, the records are not paginated: they are read from the
+        datastore with a server-side cursor while the result ``hits`` are consumed.
+        So, exports are not limited by the ``default_max_results`` option.
+
+        Args:
+            identity (flask_principal.Identity): Identity of user searching the records.
+
+            params (dict): Search params.
+
+        Returns:
+            `config.result_scan_cls`: Stream of records that match the query criteria.
+        """
+        self.require_permission(identity, "search")
+
+        # pagination params are not used in the scan.
+        query_params = {
+            k: v for k, v in params.items() if k not in ["size", "page", "after"]
+        }
+        chunk_size = self.config.search.scan_options["chunk_size"]
+
+        return self.result_scan(
+            self,
+            identity,
+            self.record_cls.iter_records(
+                chunk_size=chunk_size,
+                query_filter=lambda query: self._apply_query_filters(
+                    identity, query, query_params
+                ),
+                **query_params,
+            ),
+            links_item_tpl=self.links_item_tpl,
+            schema=self.schema,
+            chunk_size=chunk_size,
+        )
+
 
 __all__ = "BaseInvenioService"
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-commons is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+from invenio_records_resources.services.uow import Operation
+
+
+class RecordBulkCommitOp(Operation):
+    """Record bulk commit operation.
+
+    This operation commits many ``storm_commons.records.api.BaseRecordModelAPI``
+    records using a single savepoint (instead of one ``RecordCommitOp`` for each record).
+    """
+
+    def __init__(self, records):
+        """Initialize the record bulk commit operation."""
+        self._records = list(records)
+
+    def on_register(self, uow):
+        """Commit the records."""
+        if self._records:
+            type(self._records[0]).commit_many(self._records)
+
+
+class RecordBulkIndexOp(Operation):
+    """Record bulk index operation.
+
+    This operation indexes many records after the commit of the unit of work. By default,
+    the records are indexed one by one (synchronously, as in ``RecordCommitOp``). When
+    ``bulk`` is enabled and the indexer supports bulk indexing (``bulk_index``, e.g.
+    ``invenio_indexer.api.RecordIndexer``), the records are sent to the bulk indexing
+    queue in a single call (they are indexed when the queue is consumed).
+    """
+
+    def __init__(self, records, indexer, bulk=False):
+        """Initialize the record bulk index operation."""
+        self._records = list(records)
+        self._indexer = indexer
+        self._bulk = bulk
+
+    def on_commit(self, uow):
+        """Index the records."""
+        if not self._indexer or not self._records:
+            return
+
+        if self._bulk and hasattr(self._indexer, "bulk_index"):
+            self._indexer.bulk_index([str(record.id) for record in self._records])
+        else:
+            for record in self._records:
+                self._indexer.index(record)
+
+
+__all__ = ("RecordBulkCommitOp", "RecordBulkIndexOp")
@@ -5,14 +5,60 @@
 # storm-commons is free software; you can redistribute it and/or modify it
 # under the terms of the MIT License; see LICENSE file for more details.
 
-from jinja2 import Environment, PackageLoader
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
+
+from jinja2 import Environment, FileSystemBytecodeCache, PackageLoader
+
+from storm_commons.utils import default_cache_dir, private_directory
+
+TEMPLATES_CACHE_DIR = default_cache_dir()
+if TEMPLATES_CACHE_DIR:
+    TEMPLATES_CACHE_DIR = os.path.join(TEMPLATES_CACHE_DIR, "templates")
+"""Directory where the compiled templates are cached (``None`` disables the cache).
+
+The directory is private to the current user (see ``storm_commons.utils.private_directory``).
+To disable the cache, set the ``STORM_COMMONS_CACHE_DIR`` environment variable to an empty value.
+"""
+
+
+@lru_cache(maxsize=None)
+def _bytecode_cache(cache_dir):
+    """Create the bytecode cache shared by the template environments."""
+    if not cache_dir:
+        return None
+
+    try:
+        private_directory(cache_dir)
+    except OSError:
+        return None  # e.g. read-only file systems or directories of other users.
+
+    return FileSystemBytecodeCache(cache_dir)
+
+
+@lru_cache(maxsize=None)
+def get_template_environment(module_name: str, package_path: str):
+    """Get the jinja environment of a templates package.
+
+    The environments are created once for each ``(module_name, package_path)``. So,
+    the templates are parsed and compiled only in the first render of each process.
+    Also, the compiled templates are stored in a bytecode cache (see ``TEMPLATES_CACHE_DIR``)
+    shared by the processes.
+    """
+    return Environment(
+        loader=PackageLoader(module_name, package_path),
+        bytecode_cache=_bytecode_cache(TEMPLATES_CACHE_DIR),
+    )
 
 
 def render_template(
     template_name: str, module_name: str, package_path: str, **template_objects
 ):
     """Render a jinja template."""
-    env = Environment(loader=PackageLoader(module_name, package_path))
+    env = get_template_environment(module_name, package_path)
 
     # Metadata template file
     template = env.get_template(template_name)
@@ -21,4 +67,122 @@ def render_template(
     return template.render(**template_objects)
 
 
-__all__ = "render_template"
+def stream_template(
+    template_name: str, module_name: str, package_path: str, **template_objects
+):
+    """Render a jinja template in chunks.
+
+    Unlike ``render_template``, the rendered document is not built in memory: the
+    chunks are generated while they are consumed (e.g. by a streamed response).
+
+    Returns:
+        Iterator[str]: The rendered chunks.
+    """
+    env = get_template_environment(module_name, package_path)
+
+    return env.get_template(template_name).generate(**template_objects)
+
+
+def write_template(
+    output, template_name: str, module_name: str, package_path: str, **template_objects
+):
+    """Render a jinja template directly to a file.
+
+    Args:
+        output (Union[str, IO]): File path or file object (opened in text mode).
+
+        template_name (str): Name of the template file.
+
+        module_name (str): Module with the templates package.
+
+        package_path (str): Templates path in the module.
+
+    Returns:
+        None: The rendered chunks are written in the output.
+    """
+    env = get_template_environment(module_name, package_path)
+
+    stream = env.get_template(template_name).stream(**template_objects)
+    stream.enable_buffering()
+    stream.dump(output, encoding="utf-8" if isinstance(output, str) else None)
+
+
+def _render_contexts(template_name, module_name, package_path, contexts):
+    """Render a template for a batch of contexts (used in the worker processes)."""
+    template = get_template_environment(module_name, package_path).get_template(
+        template_name
+    )
+
+    return [template.render(**context) for context in contexts]
+
+
+def render_template_many(
+    template_name: str,
+    module_name: str,
+    package_path: str,
+    contexts,
+    processes: int = None,
+    chunksize: int = 16,
+):
+    """Render a jinja template for many contexts (e.g. one context for each record).
+
+    Args:
+        template_name (str): Name of the template file.
+
+        module_name (str): Module with the templates package.
+
+        package_path (str): Templates path in the module.
+
+        contexts (Iterable[dict]): Template objects of each render.
+
+        processes (int): Number of worker processes. By default, the templates are
+                         rendered in the current process.
+
+        chunksize (int): Number of contexts sent to a worker process in each task.
+
+    Returns:
+        Iterator[str]: The rendered documents (in the ``contexts`` order).
+
+    Note:
+        The template is compiled once (in each process). The contexts are consumed while
+        the results are consumed: in the parallel mode, at most ``2 * processes`` chunks
+        are pending. So, the memory is bounded even for large iterables. The contexts must
+        be picklable in the parallel mode.
+    """
+    if not processes:
+        template = get_template_environment(module_name, package_path).get_template(
+            template_name
+        )
+
+        for context in contexts:
+            yield template.render(**context)
+        return
+
+    contexts = iter(contexts)
+    chunks = iter(lambda: list(islice(contexts, chunksize)), [])
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        pending = deque()
+
+        for chunk in chunks:
+            pending.append(
+                executor.submit(
+                    _render_contexts, template_name, module_name, package_path, chunk
+                )
+            )
+
+            # waiting for the oldest chunk when the window is full.
+            if len(pending) >= 2 * processes:
+                yield from pending.popleft().result()
+
+        while pending:
+            yield from pending.popleft().result()
+
+
+__all__ = (
+    "get_template_environment",
+    "render_template",
+    "render_template_many",
+    "stream_template",
+    "write_template",
+)
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-commons is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+import os
+import stat
+
+
+def default_cache_dir():
+    """Get the directory where the storm-commons files are cached.
+
+    The directory is defined by the ``STORM_COMMONS_CACHE_DIR`` environment variable. By
+    default, a per-user directory is used (``$XDG_CACHE_HOME/storm-commons`` or
+    ``~/.cache/storm-commons``).
+
+    Returns:
+        str: The cache directory (``None`` if ``STORM_COMMONS_CACHE_DIR`` is empty, which
+        disables the caches).
+    """
+    cache_dir = os.environ.get("STORM_COMMONS_CACHE_DIR")
+
+    if cache_dir is None:
+        cache_dir = os.path.join(
+            os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+            "storm-commons",
+        )
+
+    return cache_dir or None
+
+
+def private_directory(path):
+    """Create (if required) a directory that can only be accessed by the current user.
+
+    Note:
+        The cached files (e.g. compiled templates) are executed when they are loaded. So, the
+        directory must not be writable by other users: the directory is created with the
+        ``0o700`` mode and its owner is checked.
+
+    Raises:
+        OSError: If the directory can not be created or is not owned by the current user.
+    """
+    os.makedirs(path, mode=0o700, exist_ok=True)
+
+    path_stat = os.lstat(path)
+    if not stat.S_ISDIR(path_stat.st_mode):
+        raise OSError(f"Cache path is not a directory: {path}")
+
+    if hasattr(os, "getuid") and path_stat.st_uid != os.getuid():
+        raise OSError(f"Cache directory is not owned by the current user: {path}")
+
+    if stat.S_IMODE(path_stat.st_mode) & 0o077:
+        os.chmod(path, 0o700)
+
+    return path
+
+
+__all__ = ("default_cache_dir", "private_directory")
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-commons is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Pytest configuration.
+
+The database fixtures (``db``) are provided by ``pytest-invenio``. The tests that use
+them must skip when the Invenio packages are not installed.
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def create_app(instance_path):
+    """Application factory (used by the ``pytest-invenio`` fixtures)."""
+    from flask import Flask
+    from invenio_access import InvenioAccess
+    from invenio_db import InvenioDB
+
+    # the models of the mock module must be defined before the tables are created.
+    import mock_module.models  # noqa: F401
+
+    def factory(**config):
+        app = Flask("testapp", instance_path=instance_path)
+        app.config.update(**config)
+
+        InvenioDB(app)
+        InvenioAccess(app)
+        return app
+
+    return factory
+
+
+@pytest.fixture()
+def service(appctx):
+    """Item service (see ``mock_module``)."""
+    from storm_commons.services.service import BaseInvenioService
+    from mock_module.service import ItemServiceConfig
+
+    return BaseInvenioService(ItemServiceConfig)
+
+
+@pytest.fixture()
+def identity():
+    """System identity."""
+    from invenio_access.permissions import system_identity
+
+    return system_identity
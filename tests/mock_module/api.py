@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-commons is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Mock record API."""
+
+from storm_commons.records.api import BaseRecordModelAPI
+from storm_commons.records.cache import LocalRecordCache
+
+from .models import ItemModel
+
+
+class Item(BaseRecordModelAPI):
+    """Item record."""
+
+    model_cls = ItemModel
+
+    @property
+    def name(self):
+        """Item name."""
+        return self.model.name if self.model else None
+
+
+class CachedItem(Item):
+    """Item record read through a local cache."""
+
+    cache = LocalRecordCache(maxsize=16, ttl=None)
@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-commons is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Mock models."""
+
+from invenio_db import db
+
+from storm_commons.records.model import BaseRecordModel
+
+
+class ItemModel(db.Model, BaseRecordModel):
+    """Item stored in the database."""
+
+    __tablename__ = "storm_commons_test_items"
+
+    name = db.Column(db.String(255), nullable=True)
+
+    # the check constraint of the boolean columns must be named (e.g. in SQLite).
+    is_deleted = db.Column(db.Boolean(name="is_deleted"), default=False)
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-commons is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Mock service."""
+
+from invenio_records_permissions.generators import AnyUser, SystemProcess
+from invenio_records_permissions.policies.records import RecordPermissionPolicy
+from invenio_records_resources.services import Link, pagination_links
+from invenio_records_resources.services.records.components import ServiceComponent
+from marshmallow import (
+    Schema,
+    ValidationError,
+    fields,
+    post_load,
+    validates_schema,
+)
+
+from storm_commons.services.links import keyset_pagination_links
+from storm_commons.services.pagination.options import BaseSearchOptions
+from storm_commons.services.results import BaseItemResult, BaseListResult
+
+from .api import Item
+
+
+class ItemSchema(Schema):
+    """Item schema."""
+
+    id = fields.String(dump_only=True)
+    name = fields.String(required=True)
+
+    @validates_schema
+    def validate_name(self, data, **kwargs):
+        """Reject the reserved names."""
+        if data.get("name") == "reserved":
+            raise ValidationError("Reserved name.", "name")
+
+    @post_load
+    def normalize_name(self, data, **kwargs):
+        """Normalize the name."""
+        data["name"] = data["name"].strip()
+        return data
+
+
+class ItemComponent(ServiceComponent):
+    """Component that saves the item name (it fails for the ``fail`` names)."""
+
+    def _set_name(self, record, data):
+        """Save the name in the record model."""
+        record.model.name = data["name"]
+
+        if data["name"] == "fail":
+            raise RuntimeError("Component failure.")
+
+    def create(self, identity, data=None, record=None, **kwargs):
+        """Create handler."""
+        self._set_name(record, data)
+
+    def update(self, identity, data=None, record=None, **kwargs):
+        """Update handler."""
+        self._set_name(record, data)
+
+    def delete(self, identity, record=None, **kwargs):
+        """Delete handler."""
+        if record.model.name == "locked":
+            raise RuntimeError("Locked item.")
+
+        record.model.is_deleted = True
+
+
+class ItemPermissionPolicy(RecordPermissionPolicy):
+    """Item permission policy."""
+
+    can_create = [AnyUser(), SystemProcess()]
+    can_read = [AnyUser(), SystemProcess()]
+    can_update = [AnyUser(), SystemProcess()]
+    can_delete = [AnyUser(), SystemProcess()]
+    can_search = [AnyUser(), SystemProcess()]
+
+
+class ItemServiceConfig:
+    """Item service config."""
+
+    record_cls = Item
+    schema = ItemSchema
+    permission_policy_cls = ItemPermissionPolicy
+
+    result_item_cls = BaseItemResult
+    result_list_cls = BaseListResult
+
+    search = BaseSearchOptions
+
+    components = [ItemComponent]
+
+    links_item = {
+        "self": Link(
+            "{+api}/items/{id}",
+            vars=lambda record, vars: vars.update({"id": str(record.id)}),
+        )
+    }
+    links_search = pagination_links("{+api}/items{?args*}")
+    links_search_keyset = keyset_pagination_links("{+api}/items{?args*}")
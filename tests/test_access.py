@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-commons is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Record access (system field and agents) tests."""
+
+import pytest
+
+pytest.importorskip("invenio_records")
+pytest.importorskip("invenio_accounts")
+
+from invenio_records.api import Record  # noqa: E402
+from invenio_records.systemfields import SystemFieldsMixin  # noqa: E402
+
+from storm_commons.records.systemfields.fields.access import (  # noqa: E402
+    RecordAccess,
+    RecordAccessField,
+)
+from storm_commons.records.systemfields.models import AgentList  # noqa: E402
+
+
+class AccessRecord(Record, SystemFieldsMixin):
+    """Record with an access field."""
+
+    access = RecordAccessField()
+
+
+@pytest.fixture()
+def record():
+    """Record with owners and contributors."""
+    return AccessRecord(
+        {
+            "access": {
+                "owned_by": [{"user": 1}],
+                "contributed_by": [{"project": "p1"}],
+            }
+        }
+    )
+
+
+def test_agent_list_dirty_tracking():
+    """Test the changes tracking of the agents list."""
+    agents = AgentList([{"user": 1}])
+
+    assert not agents.is_dirty
+    assert {"user": 1} not in agents  # unhashable objects are not agents.
+    assert agents.agent_cls({"user": 1}) in agents
+
+    # duplicated agents are not added.
+    agents.add({"user": 1})
+    assert not agents.is_dirty
+    assert len(agents) == 1
+
+    agents.add({"user": 2})
+    assert agents.is_dirty
+
+    agents.mark_clean()
+    agents.remove({"user": 2})
+    assert agents.is_dirty
+    assert agents.agent_cls({"user": 2}) not in agents
+
+
+def test_agent_list_reorder_tracking():
+    """Test the changes tracking of the in place reordering operations."""
+    agents = AgentList([{"user": 2}, {"user": 1}])
+
+    agents.sort(key=lambda agent: agent.agent_id, reverse=True)
+    assert not agents.is_dirty  # already sorted.
+
+    agents.sort(key=lambda agent: agent.agent_id)
+    assert agents.is_dirty
+    assert agents.dump() == [{"user": 1}, {"user": 2}]
+
+    agents.mark_clean()
+    agents.reverse()
+    assert agents.is_dirty
+    assert agents.dump() == [{"user": 2}, {"user": 1}]
+
+    # the agents are not repeated.
+    agents.mark_clean()
+    agents *= 2
+    assert not agents.is_dirty
+    assert len(agents) == 2
+
+    agents *= 0
+    assert agents.is_dirty
+    assert agents == [] and agents.agent_cls({"user": 1}) not in agents
+
+
+def test_record_access_changed_keys():
+    """Test the changes tracking of the access object."""
+    access = RecordAccess.from_dict({"owned_by": [{"user": 1}]})
+    assert not access.is_dirty
+
+    access.contributed_by.add({"user": 2})
+    assert access.changed_keys() == {"contributed_by"}
+
+    access.mark_clean()
+    access.owned_by = AgentList()
+    assert access.changed_keys() == {"owned_by"}
+
+
+def test_pre_commit_unchanged_record(record):
+    """Test the commit of a record without access changes."""
+    access_data = {
+        "owned_by": [{"user": 1}],
+        "contributed_by": [{"project": "p1"}],
+    }
+
+    AccessRecord.access.pre_commit(record)
+
+    assert record["access"] == access_data
+    assert AccessRecord.access._get_cache(record) is None  # not loaded.
+
+
+def test_pre_commit_validates_dict_changes(record):
+    """Test that the access data changed in the record dict is validated."""
+    record["access"]["owned_by"].append({"bogus": 1})
+
+    AccessRecord.access.pre_commit(record)
+
+    assert record["access"]["owned_by"] == [{"user": 1}]
+
+
+def test_pre_commit_validates_record_update(record):
+    """Test that the access data replaced with ``update`` is validated."""
+    record.update({"access": {"owned_by": [{"bogus": 1}, {"user": 3}]}})
+
+    AccessRecord.access.pre_commit(record)
+
+    assert record["access"]["owned_by"] == [{"user": 3}]
+    assert record["access"]["contributed_by"] == []
+
+
+def test_pre_commit_dumps_object_changes(record):
+    """Test that the changes of the access object are dumped."""
+    record.access.owned_by.add({"user": 2})
+
+    AccessRecord.access.pre_commit(record)
+
+    assert record["access"]["owned_by"] == [{"user": 1}, {"user": 2}]
+    assert not record.access.is_dirty
+
+    # a new change after the commit is detected.
+    record["access"]["contributed_by"].append({"bogus": 1})
+    AccessRecord.access.pre_commit(record)
+
+    assert record["access"]["contributed_by"] == [{"project": "p1"}]
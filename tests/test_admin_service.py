@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-commons is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Admin service (bulk agents edition) tests."""
+
+import pytest
+
+pytest.importorskip("invenio_records_resources")
+pytest.importorskip("invenio_pidstore")
+
+from invenio_access.permissions import system_process  # noqa: E402
+from invenio_pidstore.errors import PIDDoesNotExistError  # noqa: E402
+from invenio_records_permissions.generators import Generator  # noqa: E402
+from invenio_records_permissions.policies.records import (  # noqa: E402
+    RecordPermissionPolicy,
+)
+from invenio_records_resources.services.records.components import (  # noqa: E402
+    ServiceComponent,
+)
+from mock_module.models import ItemModel  # noqa: E402
+
+from storm_commons.admin.service import AdminRecordService  # noqa: E402
+
+
+class AgentsRecord:
+    """Record resolved by id (from ``records``) that counts its commits."""
+
+    records = {}
+
+    class pid:
+        """Record PID field."""
+
+        @staticmethod
+        def resolve(record_id):
+            """Resolve the record."""
+            try:
+                return AgentsRecord.records[record_id]
+            except KeyError:
+                raise PIDDoesNotExistError("recid", record_id)
+
+    def __init__(self, id_, locked=False):
+        """Initialize the record."""
+        self.id = id_
+        self.locked = locked
+        self.commits = 0
+
+    def commit(self):
+        """Commit the record."""
+        self.commits += 1
+
+
+class RecordNotLocked(Generator):
+    """Allow the system processes to manage the records that are not locked."""
+
+    def needs(self, record=None, **kwargs):
+        """Enabling needs."""
+        return [] if record.locked else [system_process]
+
+
+class AgentsPermissionPolicy(RecordPermissionPolicy):
+    """Agents permission policy."""
+
+    can_manage_access = [RecordNotLocked()]
+
+
+class AgentsComponent(ServiceComponent):
+    """Component that stores the operations (it fails for the ``fail`` agents)."""
+
+    def update(self, identity, record=None, agent_id=None, operation=None, **kwargs):
+        """Update handler."""
+        if agent_id == "fail":
+            raise RuntimeError("Invalid agent.")
+
+        # the operations are stored in the database to check the savepoints.
+        ItemModel.query.session.add(
+            ItemModel(name=f"{record.id}:{operation}:{agent_id}")
+        )
+        ItemModel.query.session.flush()
+
+
+class Indexer:
+    """Indexer that stores the indexed records."""
+
+    def __init__(self, **kwargs):
+        """Initialize the indexer."""
+        self.indexed = []
+        self.bulk_indexed = []
+
+    def index(self, record, arguments=None):
+        """Index a record."""
+        self.indexed.append(record.id)
+
+    def bulk_index(self, record_ids):
+        """Send the records to the bulk indexing queue."""
+        self.bulk_indexed.extend(record_ids)
+
+
+class ResultItem:
+    """Result item (the record)."""
+
+    def __init__(self, service, identity, record, links_tpl=None):
+        """Initialize the result item."""
+        self.record = record
+
+    def to_dict(self):
+        """Get the record id."""
+        return {"id": self.record.id}
+
+
+class AgentsServiceConfig:
+    """Agents service config."""
+
+    record_cls = AgentsRecord
+    permission_policy_cls = AgentsPermissionPolicy
+    components = [AgentsComponent]
+
+    indexer_cls = Indexer
+    index_dumper = None
+
+    result_item_cls = ResultItem
+    links_item = {}
+
+
+@pytest.fixture()
+def records():
+    """Records of the service (``locked`` can not be managed)."""
+    AgentsRecord.records = {
+        id_: AgentsRecord(id_, locked=id_ == "locked") for id_ in ("a", "b", "locked")
+    }
+    return AgentsRecord.records
+
+
+@pytest.fixture()
+def admin_service(appctx, monkeypatch):
+    """Admin service (with a single indexer instance)."""
+    service = AdminRecordService(AgentsServiceConfig)
+
+    indexer = Indexer()
+    monkeypatch.setattr(AdminRecordService, "indexer", indexer)
+
+    return service
+
+
+def operations_names():
+    """Operations stored in the database."""
+    return sorted(item.name for item in ItemModel.query)
+
+
+def test_edit_agents(db, admin_service, identity, records):
+    """Test that the operations are grouped by record and the errors are indexed."""
+    result = admin_service.admin_edit_agents(
+        identity,
+        [
+            {"id": "a", "agent_type": "user", "agent_id": "1", "operation": "add"},
+            {"id": "b", "agent_type": "user", "agent_id": "1", "operation": "add"},
+            {
+                "id": "missing",
+                "agent_type": "user",
+                "agent_id": "1",
+                "operation": "add",
+            },
+            {"id": "a", "agent_type": "user", "agent_id": "2", "operation": "remove"},
+            {"id": "locked", "agent_type": "user", "agent_id": "1", "operation": "add"},
+            {"id": "a", "agent_type": "user", "agent_id": "3", "operation": "move"},
+            {"id": "b", "agent_type": "user"},
+        ],
+    )
+
+    assert [item["id"] for item in result.items] == ["a", "b"]
+    assert result.errors == [
+        {"index": 2, "id": "missing", "errors": ["Record not found."]},
+        {"index": 4, "id": "locked", "errors": ["Permission denied."]},
+        {
+            "index": 5,
+            "id": "a",
+            "errors": ["Invalid operation (use `add` or `remove`)."],
+        },
+        {
+            "index": 6,
+            "id": "b",
+            "errors": [
+                "Operations must have the `id`, `agent_type`, `agent_id` and "
+                "`operation` keys."
+            ],
+        },
+    ]
+
+    # each record is committed and indexed only once.
+    assert [records[id_].commits for id_ in ("a", "b", "locked")] == [1, 1, 0]
+    assert admin_service.indexer.indexed == ["a", "b"]
+    assert admin_service.indexer.bulk_indexed == []
+
+    assert operations_names() == ["a:add:1", "a:remove:2", "b:add:1"]
+
+
+def test_edit_agents_savepoint(db, admin_service, identity, records):
+    """Test that the operations of a record are rolled back when one of them fails."""
+    result = admin_service.admin_edit_agents(
+        identity,
+        [
+            {"id": "a", "agent_type": "user", "agent_id": "1", "operation": "add"},
+            {"id": "b", "agent_type": "user", "agent_id": "1", "operation": "add"},
+            {"id": "a", "agent_type": "user", "agent_id": "fail", "operation": "add"},
+            {"id": "a", "agent_type": "user", "agent_id": "2", "operation": "add"},
+        ],
+    )
+
+    assert [item["id"] for item in result.items] == ["b"]
+    assert result.errors == [
+        {
+            "index": 0,
+            "id": "a",
+            "errors": ["Not applied: another operation of the record failed."],
+        },
+        {"index": 2, "id": "a", "errors": ["Invalid agent."]},
+        {
+            "index": 3,
+            "id": "a",
+            "errors": ["Not applied: another operation of the record failed."],
+        },
+    ]
+
+    assert records["a"].commits == 0
+    assert operations_names() == ["b:add:1"]
+
+
+def test_edit_agents_bulk_index(db, admin_service, identity, records, monkeypatch):
+    """Test that the records are sent to the bulk indexing queue (when enabled)."""
+    monkeypatch.setattr(AgentsServiceConfig, "admin_bulk_index", True, raising=False)
+
+    admin_service.admin_edit_agents(
+        identity,
+        [
+            {"id": "b", "agent_type": "user", "agent_id": "1", "operation": "add"},
+            {"id": "a", "agent_type": "user", "agent_id": "1", "operation": "add"},
+        ],
+    )
+
+    assert admin_service.indexer.bulk_indexed == ["b", "a"]
+    assert admin_service.indexer.indexed == []
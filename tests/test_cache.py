@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-commons is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Record cache tests."""
+
+import pytest
+
+from storm_commons.records import cache as cache_module
+from storm_commons.records.cache import LocalRecordCache
+
+
+@pytest.fixture()
+def clock(monkeypatch):
+    """Clock of the cache entries (changed by the tests)."""
+    now = [0.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+
+    return now
+
+
+def test_local_cache_values():
+    """Test that the cached values are copies."""
+    cache = LocalRecordCache()
+    value = {"name": "a"}
+
+    assert cache.get("a") is None
+
+    cache.set("a", value)
+    value["name"] = "b"
+    cache.get("a")["name"] = "c"
+
+    assert cache.get("a") == {"name": "a"}
+
+    cache.delete("a")
+    assert cache.get("a") is None
+
+
+def test_local_cache_ttl(clock):
+    """Test that the entries expire after the ttl."""
+    cache = LocalRecordCache(ttl=10)
+    cache.set("a", 1)
+
+    clock[0] = 10
+    assert cache.get("a") == 1
+
+    clock[0] = 10.1
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_local_cache_lru():
+    """Test that the least recently used entries are evicted."""
+    cache = LocalRecordCache(maxsize=2, ttl=None)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+
+
+def test_cache_stats():
+    """Test the hits and misses counters."""
+    cache = LocalRecordCache()
+    assert cache.stats()["hit_ratio"] == 0.0
+
+    cache.register_hit()
+    cache.register_hit()
+    cache.register_miss()
+
+    assert cache.stats() == {"hits": 2, "misses": 1, "hit_ratio": 2 / 3}
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-commons is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Plugins entry points tests."""
+
+import pytest
+
+pytest.importorskip("werkzeug")
+
+import storm_commons.plugins.packages.entry_point as entry_point_module  # noqa: E402
+from storm_commons.plugins.packages.entry_point import (  # noqa: E402
+    EntryPoint,
+    list_plugins_entrypoint,
+)
+
+GROUP = "storm_commons.tests"
+
+
+@pytest.fixture()
+def entry_points(monkeypatch):
+    """Entry points of the test group (with a duplicated distribution)."""
+    eps = [
+        EntryPoint(name="b", value="json:dumps", group=GROUP),
+        EntryPoint(name="a", value="json:loads", group=GROUP),
+        EntryPoint(name="b", value="json:dumps", group=GROUP),
+    ]
+    monkeypatch.setattr(entry_point_module, "entry_points", lambda: {GROUP: eps})
+
+    return eps
+
+
+@pytest.mark.parametrize("cached", [False, True])
+def test_discovery_order(entry_points, tmp_path, cached):
+    """Test that the entry points keep the discovery order (also when cached)."""
+    cache_dir = str(tmp_path / "cache") if cached else None
+
+    for _ in range(2):
+        assert [ep.name for ep in list_plugins_entrypoint(GROUP, cache_dir)] == [
+            "b",
+            "a",
+        ]
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-commons is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Process pool backend tests."""
+
+import os
+import time
+
+import pytest
+
+from storm_commons.plugins.executors import (
+    BackendBusyError,
+    ProcessPoolBackend,
+    ProcessServiceProxy,
+)
+
+
+class Service:
+    """Picklable service."""
+
+    id = "service"
+    process_methods = ["pid", "increment", "sleep", "exit"]
+
+    def __init__(self):
+        self.calls = 0
+
+    def pid(self):
+        """Get the process id."""
+        return os.getpid()
+
+    def increment(self):
+        """Count the calls of the service instance."""
+        self.calls += 1
+        return self.calls
+
+    def sleep(self, seconds):
+        """Wait some time."""
+        time.sleep(seconds)
+        return seconds
+
+    def exit(self):
+        """Kill the process."""
+        os._exit(1)
+
+    def local(self):
+        """Method executed in the current process."""
+        return os.getpid()
+
+
+@pytest.fixture()
+def backend():
+    """Process pool backend with one process."""
+    backend = ProcessPoolBackend(max_workers=1, max_queue=1, timeout=10)
+    yield backend
+    backend.shutdown()
+
+
+def test_service_proxy(backend):
+    """Test that the service methods are executed in the worker process."""
+    proxy = ProcessServiceProxy(Service(), backend)
+
+    assert proxy.id == "service"
+    assert proxy.local() == os.getpid()
+    assert proxy.pid() != os.getpid()
+    assert proxy.sleep.submit(0).result() == 0
+
+    # the service is created in the worker only once (and reused by the calls).
+    assert [proxy.increment() for _ in range(3)] == [1, 2, 3]
+    assert proxy.service.calls == 0
+
+
+def test_backend_limits(backend):
+    """Test that the calls are rejected when the queue is full."""
+    proxy = ProcessServiceProxy(Service(), backend)
+
+    futures = [proxy.sleep.submit(0.5), proxy.sleep.submit(0.5)]
+
+    with pytest.raises(BackendBusyError):
+        proxy.sleep.submit(0)
+
+    assert [future.result() for future in futures] == [0.5, 0.5]
+
+    metrics = backend.metrics()
+    assert metrics["rejected"] == 1
+    assert metrics["completed"] == 2
+    assert metrics["pending"] == metrics["running_estimate"] == 0
+
+
+def test_backend_timeout(backend):
+    """Test the timeout of the calls."""
+    proxy = ProcessServiceProxy(Service(), backend)
+
+    with pytest.raises(TimeoutError):
+        proxy.sleep(0.5, timeout=0.1)
+
+    assert backend.metrics()["timed_out"] == 1
+
+    # the slot of the call is released when the call finishes.
+    deadline = time.monotonic() + 5
+    while backend.metrics()["pending"] and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+    assert backend.metrics()["completed"] == 1
+    assert proxy.sleep(0) == 0
+
+
+def test_backend_recovers_broken_pool(backend):
+    """Test that the pool is recreated when a worker process dies."""
+    proxy = ProcessServiceProxy(Service(), backend)
+    pid = proxy.pid()
+
+    with pytest.raises(Exception):
+        proxy.exit()
+
+    assert proxy.pid() != pid
+    assert backend.metrics()["failed"] == 1
+    assert backend.metrics()["restarted"] == 1
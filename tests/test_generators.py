@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-commons is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Conditional generators tests."""
+
+from collections import namedtuple
+
+import pytest
+
+pytest.importorskip("invenio_records_permissions")
+
+import pydash  # noqa: E402
+from flask_principal import UserNeed  # noqa: E402
+from invenio_records_permissions.generators import (  # noqa: E402
+    AnyUser,
+    Generator,
+)
+
+from storm_commons.services.generators.conditional import (  # noqa: E402
+    AllGenerator,
+    IfFinished,
+    compile_field_getter,
+)
+
+
+class ItemObject:
+    """Object with item access and attributes."""
+
+    value = "attribute"
+    other = "attribute"
+
+    def __getitem__(self, key):
+        if key == "value":
+            return "item"
+        raise KeyError(key)
+
+
+class RecordOwner(Generator):
+    """Generator that depends on the record (counting its calls)."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def needs(self, record=None, **kwargs):
+        """Needs of the record owner."""
+        self.calls += 1
+        return [UserNeed(record["owner"])]
+
+
+@pytest.mark.parametrize(
+    "obj,path",
+    [
+        ({"a": {1: "x"}}, "a.1"),
+        ({"a": [0, 5]}, "a.1"),
+        ({"a": [0, 5]}, "a[1]"),
+        ({"a": [0, 5]}, "a.5"),
+        ({"a": [0, 5]}, "a.count"),
+        ({"a": namedtuple("Point", "x y")(1, 2)}, "a.y"),
+        ({"a": ItemObject()}, "a.value"),
+        ({"a": ItemObject()}, "a.other"),
+        ({"a": None}, "a.b"),
+        ({}, "a.b"),
+    ],
+)
+def test_field_getter_follows_pydash(obj, path):
+    """Test that the compiled getters select the same values of ``pydash.get``."""
+    assert compile_field_getter(path)(obj) == pydash.get(obj, path)
+
+
+def test_branch_memoization():
+    """Test that the static needs of the branches are computed only once."""
+    owner = RecordOwner()
+    generator = IfFinished(
+        field="data.is_finished", then_=[AnyUser()], else_=[owner, UserNeed(2)]
+    )
+
+    finished = {"data": {"is_finished": True}, "owner": 1}
+    draft = {"data": {"is_finished": False}, "owner": 1}
+
+    assert generator.needs(record=finished) == AnyUser().needs()
+    assert set(generator.needs(record=draft)) == {UserNeed(1), UserNeed(2)}
+
+    branches = generator._branches
+    assert len(branches) == 2
+
+    # the branches are reused and the record-dependent generators are evaluated again.
+    generator.needs(record=draft)
+    generator.needs(record=finished)
+
+    assert generator._branches == branches
+    assert owner.calls == 2
+
+
+def test_group_key():
+    """Test that records with the same branch (and needs) have equal group keys."""
+    generator = AllGenerator(
+        fields=["data.is_finished", "data.is_public"],
+        then_=[AnyUser()],
+        else_=[UserNeed(1)],
+    )
+
+    public = {"data": {"is_finished": True, "is_public": True}}
+    private = {"data": {"is_finished": True, "is_public": False}}
+
+    assert generator.group_key(public) == generator.group_key(dict(public))
+    assert generator.group_key(public) != generator.group_key(private)
+
+    # record-dependent generators without ``group_key`` can not be grouped.
+    generator = IfFinished(field="is_finished", then_=[RecordOwner()], else_=[])
+    assert generator.group_key({"is_finished": True, "owner": 1}) is None
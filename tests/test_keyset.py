@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-commons is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Keyset (cursor-based) pagination tests."""
+
+import uuid
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("invenio_records_resources")
+
+from storm_commons.services.pagination.keyset import (  # noqa: E402
+    KeysetPage,
+    decode_cursor,
+    encode_cursor,
+)
+
+
+@pytest.mark.parametrize(
+    "created",
+    [datetime(2021, 5, 4, 10, 30, 15, 123456), datetime(2021, 5, 4, 10, 30, 15)],
+)
+def test_cursor_round_trip(created):
+    """Test that a decoded cursor has the encoded values."""
+    id_ = uuid.uuid4()
+
+    token = encode_cursor(created, id_)
+
+    assert "=" not in token
+    assert decode_cursor(token) == (created, id_)
+    assert decode_cursor(encode_cursor(created, str(id_))) == (created, id_)
+
+
+def test_decode_empty_cursor():
+    """Test that an empty cursor selects the first page."""
+    assert decode_cursor("") is None
+    assert decode_cursor(None) is None
+
+
+@pytest.mark.parametrize("token", ["invalid", "W10", encode_cursor(datetime.now(), 1)])
+def test_decode_invalid_cursor(token):
+    """Test that malformed cursors are rejected."""
+    with pytest.raises(ValueError, match="Invalid cursor token"):
+        decode_cursor(token)
+
+
+def test_keyset_page_has_next():
+    """Test the next page check."""
+    assert KeysetPage([], 10).has_next is False
+    assert KeysetPage([], 10, next_after="token").has_next is True
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-commons is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Plugins factory tests."""
+
+import threading
+import time
+
+import pytest
+
+flask = pytest.importorskip("flask")
+
+from storm_commons.plugins.packages.factory import (  # noqa: E402
+    _initialize_plugins,
+    _plugins_dependencies,
+)
+
+
+@pytest.fixture()
+def app():
+    """Application used to initialize the plugins."""
+    return flask.Flask("test_plugins_factory")
+
+
+def make_plugin(name, initialized, dependencies=(), delay=0):
+    """Create a plugin class that records its initialization."""
+
+    def __init__(self, app):
+        time.sleep(delay)
+        initialized.append(name)
+
+        # the plugins are initialized in the application context.
+        self.app_name = flask.current_app.name
+        self.thread = threading.current_thread()
+
+    return type(
+        name, (), {"__init__": __init__, "plugin_dependencies": list(dependencies)}
+    )
+
+
+def test_plugins_dependencies_errors():
+    """Test the validation of the plugins dependencies."""
+    with pytest.raises(RuntimeError, match="unavailable plugins: b"):
+        _plugins_dependencies({"a": make_plugin("a", [], ["b"])})
+
+    with pytest.raises(RuntimeError, match="cyclic dependencies: a, b"):
+        _plugins_dependencies(
+            {"a": make_plugin("a", [], ["b"]), "b": make_plugin("b", [], ["a"])}
+        )
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_initialize_plugins_order(app, max_workers):
+    """Test that the plugins are initialized after their dependencies."""
+    initialized = []
+    plugins = {
+        "c": make_plugin("c", initialized, ["a", "b"]),
+        "b": make_plugin("b", initialized, ["a"], delay=0.05),
+        "a": make_plugin("a", initialized, delay=0.05),
+        "d": make_plugin("d", initialized),
+    }
+
+    plugins_obj, plugins_time = _initialize_plugins(
+        app, plugins, _plugins_dependencies(plugins), max_workers, None
+    )
+
+    assert set(plugins_obj) == set(plugins_time) == set(plugins)
+    assert initialized.index("a") < initialized.index("b") < initialized.index("c")
+    assert {plugin.app_name for plugin in plugins_obj.values()} == {app.name}
+
+    # by default, the plugins are initialized in the calling thread.
+    in_calling_thread = {
+        plugin.thread is threading.current_thread() for plugin in plugins_obj.values()
+    }
+    assert in_calling_thread == {max_workers == 1}
+
+
+def test_initialize_plugins_in_app_context(app):
+    """Test that the application context of the caller is used in the calling thread."""
+    initialized = []
+    plugins = {"a": make_plugin("a", initialized)}
+
+    with app.app_context():
+        flask.g.value = "caller"
+        plugins["a"].__init__ = lambda self, app: initialized.append(flask.g.value)
+
+        _initialize_plugins(app, plugins, _plugins_dependencies(plugins), 1, None)
+
+    assert initialized == ["caller"]
+
+
+def test_initialize_plugins_timeout_excludes_queue_time(app):
+    """Test that the timeout of each plugin starts when the plugin starts."""
+    initialized = []
+    plugins = {
+        name: make_plugin(name, initialized, delay=0.2) for name in ("a", "b", "c")
+    }
+
+    plugins_obj, _ = _initialize_plugins(
+        app, plugins, _plugins_dependencies(plugins), 1, 0.5
+    )
+
+    assert sorted(plugins_obj) == ["a", "b", "c"]
+
+
+def test_initialize_plugins_timeout(app):
+    """Test that a slow plugin raises a timeout error."""
+    release = threading.Event()
+    initialized = []
+    plugins = {
+        "fast": make_plugin("fast", initialized),
+        "slow": type("slow", (), {"__init__": lambda self, app: release.wait(5)}),
+    }
+
+    try:
+        with pytest.raises(TimeoutError, match="slow"):
+            _initialize_plugins(app, plugins, _plugins_dependencies(plugins), 2, 0.1)
+    finally:
+        release.set()
+
+    assert initialized == ["fast"]
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-commons is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Plugin manager tests."""
+
+from types import SimpleNamespace
+
+import pytest
+
+flask = pytest.importorskip("flask")
+marshmallow = pytest.importorskip("marshmallow")
+
+from storm_commons.plugins.packages.manager import PluginManager  # noqa: E402
+from storm_commons.plugins.validators import (  # noqa: E402
+    marshmallow_validate_custom_plugin_schema,
+    marshmallow_validate_plugin_service,
+)
+
+
+class ServiceSchema(marshmallow.Schema):
+    """Schema of a plugin service."""
+
+    name = marshmallow.fields.String(required=True)
+
+
+def make_service(id_, schema=None):
+    """Create a plugin service."""
+    return SimpleNamespace(id=id_, metadata={"title": id_}, schema=schema)
+
+
+@pytest.fixture()
+def plugin_manager():
+    """Plugin manager with three services."""
+    return PluginManager(
+        {
+            "c": make_service("c"),
+            "a": make_service("a", ServiceSchema),
+            "b": make_service("b"),
+        }
+    )
+
+
+@pytest.fixture()
+def app(plugin_manager):
+    """Application with an extension that has the plugin manager."""
+    app = flask.Flask("test_plugins_manager")
+    app.extensions["storm-tests"] = SimpleNamespace(plugin_manager=plugin_manager)
+
+    with app.app_context():
+        yield app
+
+
+def test_services_catalog(plugin_manager):
+    """Test the services catalog."""
+    assert plugin_manager.services_ids == {"a", "b", "c"}
+    assert plugin_manager.services_catalog["a"] == {"title": "a"}
+    assert [service["id"] for service in plugin_manager.services()] == ["c", "a", "b"]
+
+
+def test_schema_instances(plugin_manager):
+    """Test that each call creates a new schema instance."""
+    schema = plugin_manager.schema("a")
+    schema.context["identity"] = "user"
+
+    assert isinstance(schema, ServiceSchema)
+    assert plugin_manager.schema("a") is not schema
+    assert plugin_manager.schema("a").context == {}
+
+    assert plugin_manager.schema("b") is None
+
+
+def test_validate_plugin_service(app):
+    """Test that the valid services are listed in order."""
+    validator = marshmallow_validate_plugin_service("storm-tests")
+
+    assert validator("a") == "a"
+    assert validator.choices == ("a", "b", "c")
+
+    with pytest.raises(marshmallow.ValidationError, match="a, b, c"):
+        validator("d")
+
+
+def test_validate_custom_plugin_schema(app):
+    """Test the validation with the schema of a service."""
+    validator = marshmallow_validate_custom_plugin_schema("storm-tests", "a")
+
+    assert validator({"name": "plugin"}) == {"name": "plugin"}
+    with pytest.raises(marshmallow.ValidationError):
+        validator({})
+
+    assert marshmallow_validate_custom_plugin_schema("storm-tests", "b")({}) is False
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-commons is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Record API (read-through cache) tests."""
+
+import pytest
+
+pytest.importorskip("invenio_db")
+
+from mock_module.api import CachedItem  # noqa: E402
+from sqlalchemy.orm.exc import NoResultFound  # noqa: E402
+
+
+@pytest.fixture()
+def cache(database):
+    """Cache of the items.
+
+    The items are committed in the database (the cache entries are removed when
+    the transactions finish). So, they are removed after each test.
+    """
+    cache = CachedItem.cache
+    cache.clear()
+    cache.hits = cache.misses = 0
+
+    yield cache
+
+    database.session.rollback()
+    CachedItem.model_cls.query.delete()
+    database.session.commit()
+    cache.clear()
+
+
+@pytest.fixture()
+def item(database, cache):
+    """Item committed in the database."""
+    item = CachedItem.create(name="item")
+    database.session.commit()
+    id_ = item.id
+
+    # the records are read from the cache only in new sessions.
+    database.session.remove()
+    return id_
+
+
+def test_read_through(database, cache, item):
+    """Test that the records are read from the cache after the first read."""
+    assert CachedItem.get_record(id=item).name == "item"
+    database.session.remove()
+
+    assert CachedItem.get_record(id=item).name == "item"
+    database.session.remove()
+
+    # lookups by other attributes are cached too (the key has the record id).
+    assert CachedItem.get_record(name="item").id == item
+    database.session.remove()
+    assert CachedItem.get_record(name="item").id == item
+
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+def test_invalidation_on_commit(database, cache, item):
+    """Test that the cache entry is removed when the changes are committed."""
+    record = CachedItem.get_record(id=item)
+    record.model.name = "changed"
+    record.commit()
+
+    # until the commit, the record is read from the session (and not cached).
+    assert cache.get(CachedItem._cache_key(id=item)) is not None
+    assert CachedItem.get_record(id=item).name == "changed"
+
+    database.session.commit()
+    database.session.remove()
+
+    assert cache.get(CachedItem._cache_key(id=item)) is None
+    assert CachedItem.get_record(id=item).name == "changed"
+
+
+def test_invalidation_on_rollback(database, cache, item):
+    """Test that the cache entry is removed when the changes are rolled back."""
+    record = CachedItem.get_record(id=item)
+    record.model.is_deleted = True
+    record.commit()
+
+    database.session.rollback()
+    database.session.remove()
+
+    assert cache.get(CachedItem._cache_key(id=item)) is None
+    assert CachedItem.get_record(id=item).name == "item"
+
+
+def test_deleted_records(database, cache, item):
+    """Test that the soft-deleted records are not read from the cache."""
+    record = CachedItem.get_record(id=item)
+    record.model.is_deleted = True
+    record.commit()
+    database.session.commit()
+    database.session.remove()
+
+    CachedItem.get_record(id=item, with_deleted=True)
+    database.session.remove()
+
+    with pytest.raises(NoResultFound):
+        CachedItem.get_record(id=item)
+    assert CachedItem.get_record(id=item, with_deleted=True).model.is_deleted
+
+
+def test_session_instance_not_reverted(database, cache, item):
+    """Test that a cached read does not revert the changes of a loaded instance."""
+    CachedItem.get_record(id=item)
+    database.session.remove()
+
+    record = CachedItem.get_record(id=item)
+    record.model.name = "changed"
+
+    for id_ in (item, str(item)):
+        other = CachedItem.get_record(id=id_)
+
+        assert other.model is record.model
+        assert other.name == "changed"
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-commons is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Service bulk operations tests."""
+
+import uuid
+
+import pytest
+
+pytest.importorskip("invenio_records_resources")
+
+from marshmallow import ValidationError  # noqa: E402
+from mock_module.api import Item  # noqa: E402
+
+
+def errors_by_index(result):
+    """Get the errors of a bulk result indexed by the item position."""
+    return {error["index"]: error for error in result.errors}
+
+
+def names(db):
+    """Names of the items stored in the database (not deleted)."""
+    db.session.expire_all()
+    return sorted(
+        item.name for item in Item.model_cls.query.filter_by(is_deleted=False)
+    )
+
+
+def test_create_many(db, service, identity):
+    """Test that the items with errors are not created (the others are)."""
+    result = service.create_many(
+        identity,
+        [
+            {"name": " first "},
+            {},
+            {"name": "reserved"},
+            {"name": "fail"},
+            {"name": "second"},
+        ],
+    )
+
+    errors = errors_by_index(result)
+    assert sorted(errors) == [1, 2, 3]
+    assert "name" in errors[1]["errors"]
+    assert errors[2]["errors"] == {"name": ["Reserved name."]}
+    assert errors[3]["errors"] == ["Component failure."]
+
+    # the schema hooks (``post_load``) run for the valid items.
+    assert [hit["name"] for hit in result.to_dict()["hits"]["hits"]] == [
+        "first",
+        "second",
+    ]
+    assert names(db) == ["first", "second"]
+
+
+def test_create_many_invalid_input(db, service, identity):
+    """Test that the input must be a list of items."""
+    with pytest.raises(ValidationError):
+        service.create_many(identity, {"name": "item"})
+
+
+def test_update_many(db, service, identity):
+    """Test that the changes of the items with errors are rolled back."""
+    ids = [
+        service.create(identity, {"name": f"item-{idx}"}).to_dict()["id"]
+        for idx in range(3)
+    ]
+    missing_id = str(uuid.uuid4())
+
+    result = service.update_many(
+        identity,
+        [
+            (ids[0], {"name": "changed"}),
+            (ids[1], {"name": "fail"}),
+            (missing_id, {"name": "missing"}),
+            (ids[2], {"name": "reserved"}),
+        ],
+    )
+
+    errors = errors_by_index(result)
+    assert sorted(errors) == [1, 2, 3]
+    assert errors[1] == {"index": 1, "id": ids[1], "errors": ["Component failure."]}
+    assert errors[2]["errors"] == ["Record not found."]
+
+    assert names(db) == ["changed", "item-1", "item-2"]
+
+
+def test_delete_many(db, service, identity):
+    """Test that the items with errors are not deleted (the others are)."""
+    ids = [
+        service.create(identity, {"name": name}).to_dict()["id"]
+        for name in ("a", "locked", "b")
+    ]
+
+    result = service.delete_many(identity, ids)
+
+    assert list(errors_by_index(result)) == [1]
+    assert names(db) == ["locked"]
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-commons is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Service components tests."""
+
+import threading
+
+import pytest
+
+pytest.importorskip("invenio_records_resources")
+
+from invenio_records_resources.services.records.components import (  # noqa: E402
+    ServiceComponent,
+)
+
+from storm_commons.services.service import BaseInvenioService  # noqa: E402
+
+
+class RecordingComponent(ServiceComponent):
+    """Component that records the unit of work defined in each call."""
+
+    def __init__(self, service):
+        super().__init__(service)
+        self.calls = []
+
+    def create(self, identity, record=None, data=None, **kwargs):
+        """Create handler."""
+        assert "uow" not in kwargs
+
+        try:
+            self.calls.append(self.uow)
+        except RuntimeError:  # not running in a unit of work.
+            self.calls.append(None)
+
+
+class ServiceConfig:
+    """Service config (only the components are used)."""
+
+    components = [RecordingComponent, ServiceComponent]
+
+
+def test_run_components_uow():
+    """Test that the ``uow`` is defined in the components only during the call."""
+    service = BaseInvenioService(ServiceConfig)
+    component = service.components[0]
+
+    service.run_components("create", None, record=None, data=None, uow="uow")
+    service.run_components("create", None, record=None, data=None)
+
+    assert component.calls == ["uow", None]
+
+    with pytest.raises(RuntimeError):
+        component.uow
+
+    # operations without components are ignored.
+    service.run_components("search", None, uow="uow")
+
+
+def test_components_by_thread():
+    """Test that the components are reused in a thread and not shared between threads."""
+    service = BaseInvenioService(ServiceConfig)
+    components = {}
+
+    def get_components(name):
+        components[name] = service.components
+
+    thread = threading.Thread(target=get_components, args=("thread",))
+    thread.start()
+    thread.join()
+
+    assert service.components is service.components
+    assert all(
+        component not in components["thread"] for component in service.components
+    )
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-commons is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Service search tests."""
+
+import pytest
+
+pytest.importorskip("invenio_records_resources")
+
+
+@pytest.fixture()
+def items(db, service, identity):
+    """Items created in the database."""
+    return [
+        service.create(identity, {"name": f"item-{idx}"}).to_dict()["id"]
+        for idx in range(5)
+    ]
+
+
+def test_search_keyset(service, identity, items):
+    """Test the cursor-based search and its ``next`` links."""
+    ids = []
+    params = {"size": 2, "after": ""}
+
+    while True:
+        result = service.search(identity, dict(params)).to_dict()
+        ids.extend(hit["id"] for hit in result["hits"]["hits"])
+
+        next_after = result["hits"]["next_after"]
+        if next_after is None:
+            assert "next" not in result["links"]
+            break
+
+        assert result["links"]["next"] == f"/api/items?after={next_after}&size=2"
+        params["after"] = next_after
+
+    assert sorted(ids) == sorted(items)
+
+
+def test_search_keyset_requires_links(service, identity, items, monkeypatch):
+    """Test that the cursor-based search requires the ``links_search_keyset``."""
+    monkeypatch.delattr(service.config, "links_search_keyset")
+
+    with pytest.raises(RuntimeError, match="links_search_keyset"):
+        service.search(identity, {"size": 2, "after": ""})
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-commons is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Template rendering tests."""
+
+import io
+import os
+import stat
+
+import pytest
+
+import storm_commons.template as template_module
+from storm_commons.template import (
+    render_template,
+    render_template_many,
+    stream_template,
+    write_template,
+)
+
+
+@pytest.fixture()
+def templates(tmp_path, monkeypatch, request):
+    """Package with a template (the module name is unique for each test)."""
+    module_name = f"templates_{request.node.name.replace('[', '_').strip(']')}"
+
+    package = tmp_path / "src" / module_name
+    (package / "templates").mkdir(parents=True)
+    (package / "__init__.py").write_text("")
+    (package / "templates" / "item.txt").write_text("{{ name }}:{{ value }}\n")
+
+    monkeypatch.syspath_prepend(str(tmp_path / "src"))
+    monkeypatch.setattr(
+        template_module, "TEMPLATES_CACHE_DIR", str(tmp_path / "cache" / "templates")
+    )
+
+    return module_name, "templates"
+
+
+def test_render_and_stream_template(templates):
+    """Test the rendering of a template (in memory and in chunks)."""
+    module_name, package_path = templates
+
+    assert (
+        render_template("item.txt", module_name, package_path, name="a", value=1)
+        == "a:1"
+    )
+    assert (
+        "".join(stream_template("item.txt", module_name, package_path, name="b"))
+        == "b:"
+    )
+
+
+def test_bytecode_cache_directory(templates, tmp_path):
+    """Test that the compiled templates are stored in a private directory."""
+    module_name, package_path = templates
+    render_template("item.txt", module_name, package_path, name="a", value=1)
+
+    cache_dir = tmp_path / "cache" / "templates"
+    assert stat.S_IMODE(os.stat(cache_dir).st_mode) == 0o700
+    assert os.listdir(cache_dir)
+
+
+def test_write_template(templates, tmp_path):
+    """Test the rendering of a template to files."""
+    module_name, package_path = templates
+
+    output = tmp_path / "item.txt"
+    write_template(str(output), "item.txt", module_name, package_path, name="a")
+    assert output.read_text() == "a:"
+
+    buffer = io.StringIO()
+    write_template(buffer, "item.txt", module_name, package_path, name="b", value=2)
+    assert buffer.getvalue() == "b:2"
+
+
+@pytest.mark.parametrize("processes", [None, 2])
+def test_render_template_many(templates, processes):
+    """Test the rendering of many contexts (keeping the contexts order)."""
+    module_name, package_path = templates
+    contexts = ({"name": f"item-{idx}", "value": idx} for idx in range(50))
+
+    results = render_template_many(
+        "item.txt",
+        module_name,
+        package_path,
+        contexts,
+        processes=processes,
+        chunksize=7,
+    )
+
+    assert list(results) == [f"item-{idx}:{idx}" for idx in range(50)]
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-commons is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Search totals strategies tests."""
+
+import pytest
+
+pytest.importorskip("invenio_records_resources")
+
+from mock_module.api import Item  # noqa: E402
+
+from storm_commons.services.pagination.options import (  # noqa: E402
+    BaseSearchOptions,
+)
+from storm_commons.services.pagination.totals import (  # noqa: E402
+    CachedTotal,
+    CappedTotal,
+    EstimatedTotal,
+    ExactTotal,
+)
+
+
+class SearchOptions(BaseSearchOptions):
+    """Search options with a small cap."""
+
+    pagination_options = {
+        **BaseSearchOptions.pagination_options,
+        "total_cap": 3,
+        "total_cache_ttl": 60,
+    }
+
+
+@pytest.fixture()
+def query(db):
+    """Query selecting five items."""
+    Item.create_many([{"name": f"item-{idx}"} for idx in range(5)])
+    db.session.flush()
+
+    return Item.model_cls.query.filter_by(is_deleted=False)
+
+
+def test_exact_total(query):
+    """Test the exact total."""
+    assert ExactTotal(SearchOptions).count(query) == (5, "exact")
+
+
+def test_capped_total(query):
+    """Test that the total is capped (and exact below the cap)."""
+    strategy = CappedTotal(SearchOptions)
+
+    assert strategy.count(query) == (3, "capped")
+    assert strategy.count(query.limit(2).from_self()) == (2, "exact")
+
+
+def test_estimated_total(db, query):
+    """Test that the rows are counted when the estimation is not available."""
+    assert EstimatedTotal(SearchOptions).count(query) == (5, "exact")
+
+    # the statements are executed with the DBAPI cursor of the session connection.
+    assert EstimatedTotal._explain("SELECT 1") == 1
+
+
+def test_cached_total(db, query):
+    """Test that the totals are cached by search options and filters."""
+    strategy = CachedTotal(SearchOptions)
+
+    assert strategy.count(query) == (5, "cached")
+
+    Item.create(name="item-5")
+    db.session.flush()
+
+    assert strategy.count(query) == (5, "cached")
+    assert strategy.count(query.filter_by(name="item-5")) == (1, "cached")
+    assert CachedTotal(BaseSearchOptions).count(query) == (6, "cached")
+
+    assert strategy._cache().stats()["hits"] == 1
+
+
+def test_search_total_strategy(db, service, identity, monkeypatch):
+    """Test that the strategy is reported in the search results."""
+    for idx in range(5):
+        service.create(identity, {"name": f"item-{idx}"})
+
+    monkeypatch.setattr(service.config, "search", SearchOptions)
+    monkeypatch.setattr(SearchOptions, "total_strategy_cls", CappedTotal)
+
+    result = service.search(identity, {"page": 1, "size": 2})
+    hits = result.to_dict()["hits"]
+
+    assert (hits["total"], hits["total_strategy"]) == (3, "capped")
+    assert result.pagination.total_strategy == "capped"